@@ -11,11 +11,38 @@ Modules:
     * par
     * fun
     * opt
+
+The classes and modules are imported when they are first used: a program
+that only uses sequential lists or trees does not import mpi4py, and does
+not initialize MPI.
 """
+import importlib
+from typing import TYPE_CHECKING
 
-from pyske.core.list import PList, SList, Distribution
-from pyske.core.util.timing import Timing
-from pyske.core.util import par
-from pyske.core.util import fun
+if TYPE_CHECKING:
+    from pyske.core.list import PList, SList, Distribution
+    from pyske.core.util.timing import Timing
+    from pyske.core.util import par
+    from pyske.core.util import fun
 
 __all__ = ['PList', 'SList', 'Timing', 'Distribution', 'par', 'fun']
+
+# Module of each class, or None for modules.
+_LAZY = {'PList': 'pyske.core.list.plist', 'SList': 'pyske.core.list.slist',
+         'Distribution': 'pyske.core.list.distribution', 'Timing': 'pyske.core.util.timing',
+         'par': None, 'fun': None}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+    if _LAZY[name] is None:
+        value = importlib.import_module('pyske.core.util.' + name)
+    else:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
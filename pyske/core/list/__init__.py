@@ -4,10 +4,30 @@ pyske.core.list: sequential and parallel lists.
 Classes:
     * SList: sequential list.
     * PList: parallel list.
+
+The classes are imported when they are first used: importing SList
+does not initialize MPI.
 """
+import importlib
+from typing import TYPE_CHECKING
 
-from .plist import PList
-from .slist import SList
-from .distribution import Distribution
+if TYPE_CHECKING:
+    from .plist import PList
+    from .slist import SList
+    from .distribution import Distribution
 
 __all__ = ['SList', 'PList', 'Distribution']
+
+_LAZY = {'PList': '.plist', 'SList': '.slist', 'Distribution': '.distribution'}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
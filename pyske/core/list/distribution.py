@@ -1,8 +1,10 @@
 """
 distribution: lists representing PySke list distributions
 """
+import bisect
 import functools
 from operator import add
+from typing import List, Tuple
 
 from pyske.core import interface
 from pyske.core.support import parallel
@@ -27,10 +29,40 @@ class Distribution(interface.Distribution):
         distr = [parallel.local_size(pid, size) for pid in procs()]
         return Distribution(distr)
 
+    def bounds(self) -> List[int]:
+        """
+        Return the index of the first element of each processor,
+        followed by the size of the distributed data structure.
+
+        Example::
+
+            >>> Distribution([2, 0, 3]).bounds()
+            [0, 2, 2, 5]
+        """
+        return scan(self, add, 0)
+
+    def overlaps(self, lower: int, upper: int) -> List[Tuple[int, int, int]]:
+        """
+        Return the processors that hold elements with indices in ``range(lower, upper)``.
+
+        :param lower: the first index
+        :param upper: the index after the last index
+        :return: a list of triples ``(pid, start, stop)``, in increasing
+            ``pid`` order, such that processor ``pid`` holds the (non-empty)
+            part ``range(start, stop)`` of the range.
+        """
+        bounds = self.bounds()
+        overlaps = []
+        for pid in range(max(0, bisect.bisect_right(bounds, lower) - 1), len(self)):
+            if bounds[pid] >= upper:
+                break
+            start, stop = max(lower, bounds[pid]), min(upper, bounds[pid + 1])
+            if start < stop:
+                overlaps.append((pid, start, stop))
+        return overlaps
+
     def to_pid(self, index: int, value):
-        indices = scan(self, add, 0)
-        indices.pop(0)
-        for (pid, bound) in enumerate(indices):
-            if index < bound:
-                return pid, (index, value)
+        bounds = self.bounds()
+        if 0 <= index < bounds[-1]:
+            return bisect.bisect_right(bounds, index) - 1, (index, value)
         return None  # unreachable if index is valid
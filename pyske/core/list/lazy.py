@@ -0,0 +1,218 @@
+"""
+A module of lazy sequential lists
+
+class LazySList: sequential lists whose element-wise skeletons are deferred.
+"""
+import builtins
+import functools
+import itertools
+from typing import TypeVar, Callable, Sequence, Tuple, Optional, Generic, Iterator, Iterable
+from pyske.core import interface
+from pyske.core.list.slist import SList
+
+__all__ = ['LazySList']
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+R = TypeVar('R')  # pylint: disable=invalid-name
+U = TypeVar('U')  # pylint: disable=invalid-name
+V = TypeVar('V')  # pylint: disable=invalid-name
+
+_NOTHING = object()
+
+Stage = Callable[[Iterator], Iterator]
+
+
+class LazySList(interface.List, Generic[T]):
+    # pylint: disable=too-many-public-methods
+    """
+    Lazy sequential list.
+
+    A lazy list is a source list and a pipeline of element-wise stages
+    (``map``, ``mapi``, ``map2``, ``map2i``, ``map3``, ``zip``, ``filter``).
+    Calling one of these skeletons only adds a stage to the pipeline.
+    The pipeline is run in one pass, without building intermediate lists,
+    when the list is forced: by ``force()``, by a reduction
+    (``reduce``, ``map_reduce``), which consumes the elements
+    without storing them, or by any other skeleton.
+
+    A lazy list is usually obtained by ``SList.lazy()``.
+    The source list should not be modified while the lazy list is in use.
+
+    Static methods from interface IList:
+        init, from_seq.
+
+    Methods from interface IList:
+        length, to_seq,
+        map, mapi, map2, map2i, zip, filter,
+        reduce, map_reduce, scanl, scanl_last, scanr,
+        get_partition, flatten,
+        distribute, balance,
+        gather, scatter, scatter_range,
+        invariant.
+
+    Methods:
+        lazy, force.
+    """
+
+    def __init__(self: 'LazySList[T]', source: Iterable = None,
+                 stages: Sequence[Stage] = (), size: Optional[int] = None):
+        # pylint: disable=super-init-not-called
+        self.__source = SList() if source is None else source
+        self.__stages: Tuple[Stage, ...] = tuple(stages)
+        self.__size: Optional[int] = len(self.__source) if not self.__stages else size
+
+    def __then(self: 'LazySList[T]', stage: Stage, keeps_size: bool = True) -> 'LazySList':
+        return LazySList(self.__source, self.__stages + (stage,),
+                         self.__size if keeps_size else None)
+
+    def __check_size(self: 'LazySList[T]', a_list) -> None:
+        if self.__size is not None and not \
+                (isinstance(a_list, LazySList) and a_list.__size is None):
+            assert self.__size == len(a_list)
+
+    def __iter__(self: 'LazySList[T]') -> Iterator[T]:
+        values = iter(self.__source)
+        for stage in self.__stages:
+            values = stage(values)
+        return values
+
+    def __len__(self: 'LazySList[T]') -> int:
+        if self.__size is None:
+            return len(self.force())
+        return self.__size
+
+    def __getitem__(self: 'LazySList[T]', index):
+        return self.force()[index]
+
+    def __eq__(self: 'LazySList[T]', other) -> bool:
+        return self.force() == other
+
+    def __str__(self: 'LazySList[T]') -> str:
+        return str(self.force())
+
+    def __repr__(self: 'LazySList[T]') -> str:
+        return repr(self.force())
+
+    def lazy(self: 'LazySList[T]') -> 'LazySList[T]':
+        """
+        Return the lazy list itself.
+
+        :return: self
+        """
+        return self
+
+    def force(self: 'LazySList[T]') -> 'SList[T]':
+        """
+        Run the pending stages and return the resulting list.
+
+        The result is kept: forcing the same lazy list twice
+        runs the pipeline only once.
+
+        :return: a sequential list
+        """
+        if self.__stages or not isinstance(self.__source, SList):
+            self.__source = SList(iter(self))
+            self.__stages = ()
+            self.__size = len(self.__source)
+        return self.__source
+
+    @staticmethod
+    def init(value_at: Callable[[int], T], size: int) -> 'LazySList[T]':
+        assert size >= 0
+        return LazySList(range(0, size)).map(value_at)
+
+    @staticmethod
+    def from_seq(sequence: Sequence[T]) -> 'LazySList[T]':
+        return LazySList(SList(sequence))
+
+    def to_seq(self: 'LazySList[T]') -> 'SList[T]':
+        return self.force()
+
+    def length(self: 'LazySList[T]') -> int:
+        return len(self)
+
+    def invariant(self: 'LazySList[T]') -> bool:
+        return True
+
+    def map(self: 'LazySList[T]', unary_op: Callable[[T], R]) -> 'LazySList[R]':
+        return self.__then(lambda values: builtins.map(unary_op, values))
+
+    def mapi(self: 'LazySList[T]', binary_op: Callable[[int, T], R]) -> 'LazySList[R]':
+        return self.__then(lambda values: builtins.map(binary_op, itertools.count(), values))
+
+    def map2(self: 'LazySList[T]', binary_op: Callable[[T, U], R],
+             a_list: 'interface.List[U]') -> 'LazySList[R]':
+        self.__check_size(a_list)
+        return self.__then(lambda values: builtins.map(binary_op, values, a_list))
+
+    def map2i(self: 'LazySList[T]', ternary_op: Callable[[int, T, U], R],
+              a_list: 'interface.List[U]') -> 'LazySList[R]':
+        self.__check_size(a_list)
+        return self.__then(lambda values:
+                           builtins.map(ternary_op, itertools.count(), values, a_list))
+
+    def map3(self: 'LazySList[T]', ternary_op: Callable[[T, U, V], R],
+             a_list: 'interface.List[U]', b_list: 'interface.List[V]') -> 'LazySList[R]':
+        self.__check_size(a_list)
+        self.__check_size(b_list)
+        return self.__then(lambda values: builtins.map(ternary_op, values, a_list, b_list))
+
+    def zip(self: 'LazySList[T]', a_list: 'interface.List[U]') -> 'LazySList[Tuple[T, U]]':
+        self.__check_size(a_list)
+        return self.__then(lambda values: builtins.zip(values, a_list))
+
+    def filter(self: 'LazySList[T]', predicate: Callable[[T], bool]) -> 'LazySList[T]':
+        return self.__then(lambda values: builtins.filter(predicate, values), False)
+
+    def reduce(self: 'LazySList[T]', binary_op: Callable[[T, T], T],
+               neutral: Optional[T] = None) -> T:
+        if neutral is None:
+            return functools.reduce(binary_op, iter(self))
+        return functools.reduce(binary_op, iter(self), neutral)
+
+    def map_reduce(self: 'LazySList[T]', unary_op: Callable[[T], R],
+                   binary_op: Callable[[R, R], R], neutral: Optional[R] = None) -> R:
+        values = builtins.map(unary_op, iter(self))
+        if neutral is None:
+            first = next(values, _NOTHING)
+            if first is _NOTHING:
+                return neutral
+            return functools.reduce(binary_op, values, first)
+        return functools.reduce(binary_op, values, neutral)
+
+    def scanl(self: 'LazySList[T]', binary_op: Callable[[R, T], R], neutral: R) -> 'SList[R]':
+        return self.force().scanl(binary_op, neutral)
+
+    def scanr(self: 'LazySList[T]', binary_op: Callable[[R, T], R]) -> 'SList[R]':
+        return self.force().scanr(binary_op)
+
+    def scanl_last(self: 'LazySList[T]', binary_op: Callable[[R, T], R], neutral: R) \
+            -> 'Tuple[SList[R], R]':
+        return self.force().scanl_last(binary_op, neutral)
+
+    def get_partition(self: 'LazySList[T]') -> 'SList[SList[T]]':
+        return self.force().get_partition()
+
+    def flatten(self: 'LazySList[SList[T]]',
+                new_distr: interface.Distribution = None) -> 'SList[T]':
+        return self.force().flatten(new_distr)
+
+    def distribute(self: 'LazySList[T]', _: interface.Distribution) -> 'LazySList[T]':
+        return self
+
+    def balance(self: 'LazySList[T]') -> 'LazySList[T]':
+        return self
+
+    def gather(self: 'LazySList[T]', pid: int) -> 'LazySList[T]':
+        assert pid == 0
+        return self
+
+    def scatter(self: 'LazySList[T]', pid: int) -> 'LazySList[T]':
+        assert pid == 0
+        return self
+
+    def scatter_range(self: 'LazySList[T]', rng: range) -> 'SList[T]':
+        return self.force().scatter_range(rng)
+
+    def permute(self: 'LazySList[T]', bij: Callable[[int], int]) -> 'SList[T]':
+        return self.force().permute(bij)
@@ -0,0 +1,383 @@
+"""
+A module of parallel arrays and associated skeletons
+
+class PArray: parallel lists whose local content is a NumPy array.
+"""
+from operator import add
+from typing import Optional, Tuple, Sequence, Generic  # pylint: disable=unused-import
+from typing import TypeVar, Callable  # pylint: disable=unused-import
+import numpy
+
+from pyske.core.list.slist import SList
+from pyske.core.list.sarray import SArray
+from pyske.core.list.distribution import Distribution
+from pyske.core import interface
+from pyske.core.support import parallel as parimpl
+from pyske.core.support import array as arrimpl
+from pyske.core.support.list import scan
+from pyske.core.util import par
+
+__all__ = ['PArray']
+
+_PID: int = parimpl.PID
+_NPROCS: int = parimpl.NPROCS
+_COMM = parimpl.COMM
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+U = TypeVar('U')  # pylint: disable=invalid-name
+V = TypeVar('V')  # pylint: disable=invalid-name
+R = TypeVar('R')  # pylint: disable=invalid-name
+
+
+class PArray(interface.List, Generic[T]):
+    # pylint: disable=too-many-public-methods
+    # pylint: disable=protected-access
+    """
+    Distributed arrays
+
+    A PArray has the same skeletons than a PList, but the content of each
+    processor is stored in a SArray, i.e. in a contiguous NumPy array.
+    When the elements are numbers, the collective operations exchange
+    the raw buffers of these arrays instead of pickled Python lists.
+
+    Static methods from interface IList:
+        init, from_seq.
+
+    Methods from interface IList:
+        length, to_seq,
+        map, mapi, map2, map2i, zip, filter,
+        reduce, map_reduce, scanl, scanl_last, scanr,
+        get_partition, flatten,
+        distribute, balance,
+        gather, scatter, scatter_range,
+        invariant.
+
+    Methods:
+        lazy, force, gather_to_root.
+    """
+    __distribution: Distribution
+
+    def __init__(self: 'PArray[T]'):
+        # pylint: disable=super-init-not-called
+        super().__init__()
+        self.__content: 'SArray[T]' = SArray()
+        self.__global_size: int = 0
+        self.__local_size: int = 0
+        self.__start_index: int = 0
+        self.__distribution = Distribution([0 for _ in range(0, _NPROCS)])
+
+    def __get_shape(self: 'PArray[T]') -> 'PArray':
+        p_array = PArray()
+        p_array.__local_size = self.__local_size
+        p_array.__global_size = self.__global_size
+        p_array.__distribution = self.__distribution
+        p_array.__start_index = self.__start_index
+        return p_array
+
+    def __set_distribution(self: 'PArray[T]', distribution) -> None:
+        self.__distribution = Distribution(distribution)
+        self.__local_size = self.__distribution[_PID]
+        self.__global_size = sum(self.__distribution)
+        self.__start_index = sum(self.__distribution[0:_PID])
+
+    def __str__(self: 'PArray[T]') -> str:
+        return "PID[" + str(_PID) + "]:\n" + \
+               "  global_size: " + str(self.__global_size) + "\n" + \
+               "  local_size: " + str(self.__local_size) + "\n" + \
+               "  start_index: " + str(self.__start_index) + "\n" + \
+               "  distribution: " + str(self.__distribution) + "\n" + \
+               "  content: " + str(self.__content) + "\n"
+
+    @property
+    def distribution(self):
+        """Return the distribution of the array"""
+        return self.__distribution
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """Return the data type of the local content"""
+        return self.__content.dtype
+
+    def invariant(self: 'PArray[T]') -> None:
+        assert isinstance(self.__content, SArray)
+        assert isinstance(self.__distribution, Distribution)
+        prefix = scan(self.__distribution, add, 0)
+        assert len(self.__content) == self.__local_size
+        assert self.__distribution[_PID] == self.__local_size
+        assert self.__start_index == prefix[_PID]
+        assert prefix[_NPROCS] == self.__global_size
+
+    def __len__(self) -> int:
+        return self.__global_size
+
+    def lazy(self: 'PArray[T]') -> 'PArray[T]':
+        """
+        Return the array itself: array-backed lists are never lazy.
+
+        :return: self
+        """
+        return self
+
+    def force(self: 'PArray[T]') -> 'PArray[T]':
+        """
+        Return the array itself: array-backed lists are never lazy.
+
+        :return: self
+        """
+        return self
+
+    def length(self: 'PArray[T]') -> int:
+        return self.__global_size
+
+    @staticmethod
+    def init(value_at: Callable[[int], T], size: int = _NPROCS, dtype=None) -> 'PArray[T]':
+        assert size >= 0
+        p_array = PArray()
+        p_array.__set_distribution(Distribution.balanced(size))
+        start = p_array.__start_index
+        p_array.__content = SArray.init(lambda i: value_at(start + i),
+                                        p_array.__local_size, dtype)
+        return p_array
+
+    def map(self: 'PArray[T]', unary_op: Callable[[T], V]) -> 'PArray[V]':
+        p_array = self.__get_shape()
+        p_array.__content = self.__content.map(unary_op)
+        return p_array
+
+    def mapi(self: 'PArray[T]', binary_op: Callable[[int, T], V]) -> 'PArray[V]':
+        p_array = self.__get_shape()
+        p_array.__content = self.__content.mapi(lambda i, x:
+                                                binary_op(i + self.__start_index, x))
+        return p_array
+
+    def map2(self: 'PArray[T]', binary_op: Callable[[T, U], V],
+             a_list: 'PArray[U]') -> 'PArray[V]':
+        assert self.__distribution == a_list.__distribution
+        res = self.__get_shape()
+        res.__content = self.__content.map2(binary_op, a_list.__content)
+        return res
+
+    def map2i(self: 'PArray[T]', ternary_op: Callable[[int, T, U], V],
+              a_list: 'PArray[U]') -> 'PArray[V]':
+        assert self.__distribution == a_list.__distribution
+        res = self.__get_shape()
+        res.__content = self.__content.map2i(lambda i, x, y:
+                                             ternary_op(i + self.__start_index, x, y),
+                                             a_list.__content)
+        return res
+
+    def map3(self: 'PArray[T]', ternary_op: Callable[[T, U, V], R],
+             a_list: 'PArray[U]', b_list: 'PArray[V]') -> 'PArray[R]':
+        assert self.__distribution == a_list.__distribution
+        assert self.__distribution == b_list.__distribution
+        res = self.__get_shape()
+        res.__content = self.__content.map3(ternary_op, a_list.__content, b_list.__content)
+        return res
+
+    def zip(self: 'PArray[T]', a_list: 'PArray[U]') -> 'PArray[Tuple[T, U]]':
+        assert self.__distribution == a_list.__distribution
+        res = self.__get_shape()
+        res.__content = self.__content.zip(a_list.__content)
+        return res
+
+    def filter(self: 'PArray[T]', predicate: Callable[[T], bool]) -> 'PArray[T]':
+        p_array = PArray()
+        p_array.__content = self.__content.filter(predicate)
+        p_array.__set_distribution(_COMM.allgather(len(p_array.__content)))
+        return p_array
+
+    def get_partition(self: 'PArray[T]') -> 'PArray[SArray[T]]':
+        p_array = PArray()
+        p_array.__content = self.__content.get_partition()
+        p_array.__set_distribution([1 for _ in par.procs()])
+        return p_array
+
+    def flatten(self: 'PArray[SArray[T]]', new_distr: Distribution = None) -> 'PArray[T]':
+        p_array = PArray()
+        p_array.__content = self.__content.flatten()
+        if new_distr is None:
+            new_distr = _COMM.allgather(len(p_array.__content))
+        p_array.__set_distribution(new_distr)
+        assert p_array.__local_size == len(p_array.__content)
+        return p_array
+
+    def reduce(self: 'PArray[T]', binary_op: Callable[[T, T], T], neutral: Optional[T] = None,
+               root: Optional[int] = None) -> T:
+        """
+        Reduce a list of value to one value (see ``interface.List.reduce``).
+
+        The partial results of the processors are combined along a binomial
+        tree, in ceil(log2(NPROCS)) steps.
+
+        :param binary_op: a binary associative operation
+        :param neutral: (optional) a neutral element for the operation.
+            If this argument is omitted the list should not be empty.
+        :param root: (optional) if given, the result is only returned at
+            processor ``root``, the other processors get ``None``.
+        :return: a value
+        """
+        if neutral is None:
+            assert self.__global_size >= 1
+            partial = None if self.__local_size == 0 else self.__content.reduce(binary_op)
+        else:
+            # assert: (binary_op, neutral) form a monoid
+            partial = self.__content.reduce(binary_op, neutral)
+        return parimpl.reduce(binary_op, partial, root)
+
+    def map_reduce(self: 'PArray[T]', unary_op: Callable[[T], V],
+                   binary_op: Callable[[V, V], V], neutral: Optional[V] = None,
+                   root: Optional[int] = None) -> V:
+        """
+        Combination of a map and a reduce (see ``interface.List.map_reduce``).
+
+        :param unary_op: unary operation.
+        :param binary_op: binary associative operation.
+        :param neutral: (optional) neutral element for the binary operation.
+            If this argument is omitted the list should not be empty.
+        :param root: (optional) if given, the result is only returned at
+            processor ``root``, the other processors get ``None``.
+        :return: a value.
+        """
+        if neutral is None:
+            assert self.__global_size >= 1
+            partial = None if self.__local_size == 0 \
+                else self.__content.map_reduce(unary_op, binary_op)
+        else:
+            # assert: (binary_op, neutral) form a monoid
+            partial = self.__content.map_reduce(unary_op, binary_op, neutral)
+        return parimpl.reduce(binary_op, partial, root)
+
+    def scanr(self: 'PArray[T]', binary_op: Callable[[T, T], T]) -> 'PArray[T]':
+        assert self.__global_size > 0
+        p_array = self.__get_shape()
+        partials = self.__content.scanr(binary_op) if self.__local_size > 0 else SArray()
+        last = partials[self.__local_size - 1] if self.__local_size > 0 else None
+        acc, _ = parimpl.scan(lambda x, y: y if x is None else x if y is None
+                              else binary_op(x, y), last)
+        if _PID != 0 and acc is not None:
+            partials = partials.map(lambda value: binary_op(acc, value))
+        p_array.__content = partials
+        return p_array
+
+    def scanl_last(self: 'PArray[T]', binary_op: Callable[[T, T], T], neutral: T) \
+            -> 'Tuple[PArray[T], T]':
+        p_array = self.__get_shape()
+        partials, last = self.__content.scanl_last(binary_op, neutral)
+        acc, red = parimpl.scan(binary_op, last)
+        if _PID != 0:
+            partials = partials.map(lambda value: binary_op(acc, value))
+        p_array.__content = partials
+        return p_array, red
+
+    def scanl(self: 'PArray[T]', binary_op: Callable[[T, T], T], neutral: T) -> 'PArray[T]':
+        res, _ = self.scanl_last(binary_op, neutral)
+        return res
+
+    def distribute(self: 'PArray[T]', target_distr: Distribution) -> 'PArray[T]':
+        """
+        Only the processors holding elements that should be moved
+        communicate, by point-to-point communications.
+        If the target distribution is the current one, no communication occurs.
+        """
+        assert Distribution.is_valid(target_distr, self.__global_size)
+        target_distr = Distribution(target_distr)
+        p_array = PArray()
+        if target_distr == self.__distribution:
+            p_array.__content = self.__content
+            p_array.__set_distribution(target_distr)
+            return p_array
+        start = self.__start_index
+        sends = [(pid, lower - start, upper - start) for (pid, lower, upper)
+                 in target_distr.overlaps(start, start + self.__local_size)]
+        target_start = target_distr.bounds()[_PID]
+        receives = [(pid, upper - lower) for (pid, lower, upper) in Distribution(
+            self.__distribution).overlaps(target_start, target_start + target_distr[_PID])]
+        values = self.__content.array
+        values = values.astype(arrimpl.common_dtype(values), copy=False)
+        p_array.__content = SArray(arrimpl.exchange(values, sends, receives))
+        p_array.__set_distribution(target_distr)
+        return p_array
+
+    def balance(self: 'PArray[T]') -> 'PArray[T]':
+        return self.distribute(Distribution.balanced(self.length()))
+
+    def gather(self: 'PArray[T]', pid: int) -> 'PArray[T]':
+        assert pid in par.procs()
+        d_list = [self.length() if i == pid else 0 for i in par.procs()]
+        return self.distribute(Distribution(d_list))
+
+    def scatter(self: 'PArray[T]', pid: int) -> 'PArray[T]':
+        assert pid in par.procs()
+        at_pid = PArray()
+        at_pid.__content = self.__content if _PID == pid else self.__content[0:0]
+        at_pid.__set_distribution([size if index == pid else 0
+                                   for (index, size) in enumerate(self.__distribution)])
+        return at_pid.balance()
+
+    def scatter_range(self: 'PArray[T]', rng) -> 'PArray[T]':
+        indices = range(self.__start_index, self.__start_index + self.__local_size)
+        mask = numpy.fromiter((index in rng for index in indices), bool, self.__local_size)
+        selected = PArray()
+        selected.__content = SArray(self.__content.array[mask])
+        selected.__set_distribution(_COMM.allgather(len(selected.__content)))
+        return selected.balance()
+
+    @staticmethod
+    def from_seq(sequence: Sequence[T], dtype=None) -> 'PArray[T]':
+        p_array = PArray()
+        distribution = None
+        if _PID == 0:
+            p_array.__content = SArray(sequence, dtype)
+            distribution = [len(sequence) if i == 0 else 0 for i in par.procs()]
+            dtype = p_array.__content.dtype
+        distribution, dtype = _COMM.bcast((distribution, dtype), 0)
+        if _PID != 0:
+            p_array.__content = SArray([], dtype)
+        p_array.__set_distribution(distribution)
+        return p_array
+
+    def gather_to_root(self: 'PArray[T]', pid: int = 0) -> Optional['SArray[T]']:
+        """
+        Return the content of the array at one processor.
+
+        The chunks of all the processors are gathered at processor ``pid``
+        by one collective communication (``Gatherv`` for numbers).
+        Contrary to ``to_seq``, the other processors do not receive the content.
+
+        :param pid: (default: 0) a processor identifier
+        :return: a sequential array at processor ``pid``, None at the other processors
+        """
+        assert pid in par.procs()
+        values = self.__content.array
+        values = values.astype(arrimpl.common_dtype(values), copy=False)
+        result = arrimpl.gatherv(values, self.__distribution, pid)
+        return None if result is None else SArray(result)
+
+    def to_seq(self: 'PArray[T]') -> 'SList[T]':
+        values = self.__content.array
+        values = values.astype(arrimpl.common_dtype(values), copy=False)
+        return SList(arrimpl.allgatherv(values, self.__distribution).tolist())
+
+    def permute(self: 'PArray[T]', bij: Callable[[int], int]) -> 'PArray[T]':
+        bounds = numpy.array(scan(list(self.__distribution), add, 0)[1:], dtype=numpy.int64)
+        indices = numpy.fromiter(map(bij, range(self.__start_index,
+                                                self.__start_index + self.__local_size)),
+                                 numpy.int64, self.__local_size)
+        pids = numpy.searchsorted(bounds, indices, side='right')
+        order = numpy.argsort(pids, kind='stable')
+        send_counts = numpy.bincount(pids, minlength=_NPROCS)
+        recv_counts = numpy.empty(_NPROCS, dtype=send_counts.dtype)
+        _COMM.Alltoall(send_counts, recv_counts)
+        send_bounds = scan(send_counts.tolist(), add, 0)
+        sends = [(pid, send_bounds[pid], send_bounds[pid + 1])
+                 for pid in par.procs() if send_counts[pid] > 0]
+        receives = [(pid, int(recv_counts[pid])) for pid in par.procs() if recv_counts[pid] > 0]
+        values = self.__content.array
+        values = values.astype(arrimpl.common_dtype(values), copy=False)
+        received_values = arrimpl.exchange(values[order], sends, receives)
+        received_indices = arrimpl.exchange(indices[order], sends, receives)
+        content = numpy.empty_like(received_values)
+        content[received_indices - self.__start_index] = received_values
+        p_array = self.__get_shape()
+        p_array.__content = SArray(content)
+        return p_array
@@ -3,18 +3,22 @@ A module of parallel lists and associated skeletons
 
 class PList: parallel lists.
 """
+import bisect
 import functools
+import itertools
+import os
 from collections import defaultdict
-from operator import add, concat
+from operator import add
 from typing import Optional, Tuple, Sequence, Generic  # pylint: disable=unused-import
-from typing import TypeVar, Callable  # pylint: disable=unused-import
+from typing import TypeVar, Callable, Iterable  # pylint: disable=unused-import
 
 from pyske.core.list.slist import SList
+from pyske.core.list.lazy import LazySList
 from pyske.core.list.distribution import Distribution
 from pyske.core import interface
-from pyske.core.support import parallel as parimpl, interval
+from pyske.core.support import parallel as parimpl, files
 from pyske.core.support.list import scan
-from pyske.core.util import par
+from pyske.core.util import par, workers
 
 __all__ = ['PList']
 
@@ -28,19 +32,16 @@ V = TypeVar('V')  # pylint: disable=invalid-name
 R = TypeVar('R')  # pylint: disable=invalid-name
 
 
-def _group_by(a_list):
-    dic = defaultdict(list)
-    for key, val in a_list:
-        dic[key].append(val)
-    return dic
-
-
 class PList(interface.List, Generic[T]):
     # pylint: disable=too-many-public-methods
     # pylint: disable=protected-access
     """
     Distributed lists
 
+    The local parts of ``map``, ``mapi``, ``map2``, ``map2i``, ``map3``,
+    ``filter`` and ``map_reduce`` are split among the local workers
+    of each processor, if any (see ``pyske.core.util.workers``).
+
     Static methods from interface IList:
         init, from_seq.
 
@@ -52,6 +53,13 @@ class PList(interface.List, Generic[T]):
         distribute, balance,
         gather, scatter, scatter_range,
         invariant.
+
+    Static methods:
+        from_iterable, from_file, from_text_lines, from_binary, load.
+
+    Methods:
+        lazy, force, save, gather_to_root,
+        reduce_async, distribute_async, balance_async, gather_async.
     """
     __distribution: Distribution
 
@@ -64,6 +72,16 @@ class PList(interface.List, Generic[T]):
         self.__start_index: int = 0
         self.__distribution = Distribution([0 for _ in range(0, _NPROCS)])
 
+    @staticmethod
+    def __from_content(content: 'SList[T]', distr: Distribution) -> 'PList[T]':
+        p_list = PList()
+        p_list.__content = content
+        p_list.__local_size = distr[_PID]
+        p_list.__global_size = distr.bounds()[-1]
+        p_list.__start_index = distr.bounds()[_PID]
+        p_list.__distribution = distr
+        return p_list
+
     def __get_shape(self: 'PList[T]') -> 'PList':
         p_list = PList()
         p_list.__local_size = self.__local_size
@@ -86,7 +104,7 @@ class PList(interface.List, Generic[T]):
         return self.__distribution
 
     def invariant(self: 'PList[T]') -> None:
-        assert isinstance(self.__content, SList)
+        assert isinstance(self.__content, (SList, LazySList))
         assert isinstance(self.__distribution, Distribution)
         prefix = scan(self.__distribution, add, 0)
         assert len(self.__content) == self.__local_size
@@ -112,32 +130,64 @@ class PList(interface.List, Generic[T]):
         p_list.__content = SList([value_at(i) for i in
                                   range(p_list.__start_index,
                                         p_list.__start_index + p_list.__local_size)])
-        p_list.__distribution = [parimpl.local_size(i, size) for i in range(0, _NPROCS)]
+        p_list.__distribution = Distribution([parimpl.local_size(i, size)
+                                              for i in range(0, _NPROCS)])
+        return p_list
+
+    def lazy(self: 'PList[T]') -> 'PList[T]':
+        """
+        Return a list with the same content, in lazy mode.
+
+        In lazy mode, chains of the local element-wise skeletons
+        (map, mapi, map2, map2i, map3, zip) are evaluated in one pass on each
+        processor, without intermediate lists, when the list is forced:
+        by ``force()``, by a reduction, or by a skeleton that communicates.
+
+        :return: a parallel list
+        """
+        p_list = self.__get_shape()
+        p_list.__content = self.__content.lazy()
+        return p_list
+
+    def force(self: 'PList[T]') -> 'PList[T]':
+        """
+        Evaluate the pending skeletons of a list in lazy mode.
+
+        :return: a parallel list that is not in lazy mode
+        """
+        p_list = self.__get_shape()
+        p_list.__content = self.__content.force()
         return p_list
 
     def map(self: 'PList[T]', unary_op: Callable[[T], V]) -> 'PList[V]':
         p_list = self.__get_shape()
-        p_list.__content = self.__content.map(unary_op)
+        values = workers.map(unary_op, self.__content)
+        p_list.__content = self.__content.map(unary_op) if values is None else SList(values)
         return p_list
 
     def mapi(self: 'PList[T]', binary_op: Callable[[int, T], V]) -> 'PList[V]':
         p_list = self.__get_shape()
-        p_list.__content = self.__content.mapi(lambda i, x: binary_op(i + self.__start_index, x))
+        values = workers.map(binary_op, self.__indices(), self.__content)
+        p_list.__content = SList(values) if values is not None else \
+            self.__content.mapi(lambda i, x: binary_op(i + self.__start_index, x))
         return p_list
 
     def map2(self: 'PList[T]', binary_op: Callable[[T, U], V], a_list: 'PList[U]') -> 'PList[V]':
         assert self.__distribution == a_list.__distribution
         res = self.__get_shape()
-        res.__content = self.__content.map2(binary_op, a_list.__content)
+        values = workers.map(binary_op, self.__content, a_list.__content)
+        res.__content = SList(values) if values is not None else \
+            self.__content.map2(binary_op, a_list.__content)
         return res
 
     def map2i(self: 'PList[T]', ternary_op: Callable[[int, T, U], V],
               a_list: 'PList[U]') -> 'PList[V]':
         assert self.__distribution == a_list.__distribution
         res = self.__get_shape()
-        res.__content = self.__content.map2i(lambda i, x, y:
-                                             ternary_op(i + self.__start_index, x, y),
-                                             a_list.__content)
+        values = workers.map(ternary_op, self.__indices(), self.__content, a_list.__content)
+        res.__content = SList(values) if values is not None else \
+            self.__content.map2i(lambda i, x, y: ternary_op(i + self.__start_index, x, y),
+                                 a_list.__content)
         return res
 
     def map3(self: 'PList[T]', ternary_op: Callable[[T, U, V], R],
@@ -145,7 +195,9 @@ class PList(interface.List, Generic[T]):
         assert self.__distribution == a_list.__distribution
         assert self.__distribution == b_list.__distribution
         res = self.__get_shape()
-        res.__content = self.__content.map3(ternary_op, a_list.__content, b_list.__content)
+        values = workers.map(ternary_op, self.__content, a_list.__content, b_list.__content)
+        res.__content = SList(values) if values is not None else \
+            self.__content.map3(ternary_op, a_list.__content, b_list.__content)
         return res
 
     def zip(self: 'PList[T]', a_list: 'PList[U]') -> 'PList[Tuple[T, U]]':
@@ -153,15 +205,21 @@ class PList(interface.List, Generic[T]):
         return res
 
     def filter(self: 'PList[T]', predicate: Callable[[T], bool]) -> 'PList[T]':
-        return self.get_partition().map(lambda l: l.filter(predicate)).flatten()
+        values = workers.filter(predicate, self.__content)
+        # in lazy mode, the predicate is a stage of the pending pipeline, run in one pass
+        content = self.__content.filter(predicate).force() if values is None else SList(values)
+        return PList.__from_content(content, Distribution(_COMM.allgather(len(content))))
+
+    def __indices(self: 'PList[T]') -> range:
+        return range(self.__start_index, self.__start_index + self.__local_size)
 
     def get_partition(self: 'PList[T]') -> 'PList[SList[T]]':
         p_list = PList()
-        p_list.__content = SList([self.__content])
+        p_list.__content = SList([self.__content.force()])
         p_list.__global_size = _NPROCS
         p_list.__local_size = 1
         p_list.__start_index = _PID
-        p_list.__distribution = [1 for _ in par.procs()]
+        p_list.__distribution = Distribution([1 for _ in par.procs()])
         return p_list
 
     def flatten(self: 'PList[SList[T]]', new_distr: Distribution = None) -> 'PList[T]':
@@ -169,7 +227,7 @@ class PList(interface.List, Generic[T]):
         p_list.__content = self.__content.flatten()
         p_list.__local_size = len(p_list.__content)
         if new_distr is None:
-            p_list.__distribution = _COMM.allgather(p_list.__local_size)
+            p_list.__distribution = Distribution(_COMM.allgather(p_list.__local_size))
         else:
             p_list.__distribution = new_distr
             assert new_distr[_PID] == p_list.__local_size
@@ -177,29 +235,93 @@ class PList(interface.List, Generic[T]):
         p_list.__global_size = SList(p_list.__distribution).reduce(add)
         return p_list
 
-    def reduce(self: 'PList[T]', binary_op: Callable[[T, T], T], neutral: Optional[T] = None) -> T:
+    def reduce(self: 'PList[T]', binary_op: Callable[[T, T], T], neutral: Optional[T] = None,
+               root: Optional[int] = None) -> T:
+        """
+        Reduce a list of value to one value (see ``interface.List.reduce``).
+
+        The partial results of the processors are combined along a binomial
+        tree, in ceil(log2(NPROCS)) steps.
+
+        :param binary_op: a binary associative operation
+        :param neutral: (optional) a neutral element for the operation.
+            If this argument is omitted the list should not be empty.
+        :param root: (optional) if given, the result is only returned at
+            processor ``root``, the other processors get ``None``.
+        :return: a value
+        """
+        return parimpl.reduce(binary_op, self.__partial(binary_op, neutral), root)
+
+    def __partial(self: 'PList[T]', binary_op: Callable[[T, T], T], neutral: Optional[T]):
         if neutral is None:
             assert self.__global_size >= 1
-            partial = None if self.__local_size == 0 else SList(self.__content).reduce(binary_op)
-            partials = SList(_COMM.allgather(partial)).filter(lambda x: x is not None)
-        else:
-            # assert: (binary_op, neutral) form a monoid
-            partial = SList(self.__content).reduce(binary_op, neutral)
-            partials = SList(_COMM.allgather(partial))
-        return partials.reduce(binary_op, neutral)
+            return None if self.__local_size == 0 else self.__content.reduce(binary_op)
+        # assert: (binary_op, neutral) form a monoid
+        return self.__content.reduce(binary_op, neutral)
+
+    def reduce_async(self: 'PList[T]', binary_op: Callable[[T, T], T],
+                     neutral: Optional[T] = None,
+                     root: Optional[int] = None) -> 'parimpl.Future[T]':
+        """
+        Start the reduction of a list of values to one value.
+
+        The local partial result is computed immediately and sent to
+        ``root`` (processor 0 if ``root`` is omitted) without waiting.
+        The reduction is completed by the ``result`` method of the returned
+        future. If ``root`` is omitted, the root then sends the result to the
+        other processors without waiting: 2 * (NPROCS - 1) messages in total.
+
+        Example::
+
+            >>> future = PList.init(lambda i: i, 4).reduce_async(add)
+            >>> future.result()
+            6
+
+        :param binary_op: a binary associative operation
+        :param neutral: (optional) a neutral element for the operation.
+            If this argument is omitted the list should not be empty.
+        :param root: (optional) if given, the result is only available at
+            processor ``root``, the other processors get ``None``.
+        :return: a future of a value
+        """
+        partial = self.__partial(binary_op, neutral)
+        everywhere = root is None
+        root = 0 if everywhere else root
+        assert root in par.procs()
+        if _PID != root:
+            sources = [root] if everywhere else []
+            return parimpl.Future({root: partial}, sources, lambda received: received.get(root))
+
+        def complete(received):
+            partials = [received[pid] for pid in par.procs() if received[pid] is not None]
+            return functools.reduce(binary_op, partials) if partials else None
+
+        return parimpl.Future({root: partial}, par.procs(), complete,
+                              forward=par.procs() if everywhere else ())
 
     def map_reduce(self: 'PList[T]', unary_op: Callable[[T], V],
-                   binary_op: Callable[[V, V], V], neutral: Optional[V] = None) -> V:
-        if neutral is None:
+                   binary_op: Callable[[V, V], V], neutral: Optional[V] = None,
+                   root: Optional[int] = None) -> V:
+        """
+        Combination of a map and a reduce (see ``interface.List.map_reduce``).
+
+        :param unary_op: unary operation.
+        :param binary_op: binary associative operation.
+        :param neutral: (optional) neutral element for the binary operation.
+            If this argument is omitted the list should not be empty.
+        :param root: (optional) if given, the result is only returned at
+            processor ``root``, the other processors get ``None``.
+        :return: a value.
+        """
+        reduced, partial = workers.map_reduce(unary_op, binary_op, self.__content, neutral)
+        if not reduced and neutral is None:
             assert self.__global_size >= 1
             partial = None if self.__local_size == 0 \
                 else self.__content.map_reduce(unary_op, binary_op)
-            partials = SList(_COMM.allgather(partial)).filter(lambda x: x is not None)
-            return functools.reduce(binary_op, partials)
-        # assert: (binary_op, neutral) form a monoid
-        partial = self.__content.map_reduce(unary_op, binary_op, neutral)
-        partials = _COMM.allgather(partial)
-        return functools.reduce(binary_op, partials, neutral)
+        elif not reduced:
+            # assert: (binary_op, neutral) form a monoid
+            partial = self.__content.map_reduce(unary_op, binary_op, neutral)
+        return parimpl.reduce(binary_op, partial, root)
 
     def scanr(self: 'PList[T]', binary_op: Callable[[T, T], T]) -> 'PList[T]':
         assert self.__global_size > 0
@@ -229,46 +351,130 @@ class PList(interface.List, Generic[T]):
         return res
 
     def distribute(self: 'PList[T]', target_distr: Distribution) -> 'PList[T]':
+        """
+        Only the processors holding elements that should be moved
+        communicate, by point-to-point communications.
+        If the target distribution is the current one, no communication occurs.
+        """
         assert Distribution.is_valid(target_distr, self.__global_size)
-        source_distr = self.__distribution
-        source_bounds = interval.bounds(source_distr)
-        target_bounds = interval.bounds(target_distr)
-        local_interval = source_bounds[_PID]
-        bounds_to_send = target_bounds.map(lambda i: interval.intersection(i, local_interval))
-        msgs = [interval.to_slice(self.__content, interval.shift(inter, -self.__start_index))
-                for inter in bounds_to_send]
-        slices = _COMM.alltoall(msgs)
-        p_list = PList()
-        p_list.__content = SList(slices).flatten()
-        p_list.__local_size = target_distr[_PID]
-        p_list.__global_size = self.__global_size
-        p_list.__start_index = SList(target_distr).scanl(add, 0)[_PID]
-        p_list.__distribution = target_distr
-        return p_list
+        target_distr = Distribution(target_distr)
+        if target_distr == self.__distribution:
+            p_list = self.__get_shape()
+            p_list.__content = self.__content
+            p_list.__distribution = target_distr
+            return p_list
+        return self.distribute_async(target_distr).result()
+
+    def distribute_async(self: 'PList[T]', target_distr: Distribution) \
+            -> 'parimpl.Future[PList[T]]':
+        """
+        Start the redistribution of a list.
+
+        The elements to move are sent without waiting. The redistributed
+        list is returned by the ``result`` method of the returned future.
+
+        :param target_distr: a distribution of the list
+        :return: a future of a list with distribution ``target_distr``
+        """
+        assert Distribution.is_valid(target_distr, self.__global_size)
+        target_distr = Distribution(target_distr)
+        if target_distr == self.__distribution:
+            return parimpl.Future({}, [], lambda _: PList.__from_content(self.__content,
+                                                                          target_distr))
+        source_distr = Distribution(self.__distribution)
+        start = self.__start_index
+        content = self.__content.force()
+        messages = {pid: content[lower - start:upper - start] for (pid, lower, upper)
+                    in target_distr.overlaps(start, start + self.__local_size)}
+        target_start = target_distr.bounds()[_PID]
+        sources = [pid for (pid, _, _)
+                   in source_distr.overlaps(target_start, target_start + target_distr[_PID])]
+
+        def complete(received):
+            content = SList(received[pid] for pid in sources).flatten()
+            return PList.__from_content(content, target_distr)
+
+        return parimpl.Future(messages, sources, complete)
 
     def balance(self: 'PList[T]') -> 'PList[T]':
         return self.distribute(Distribution.balanced(self.length()))
 
+    def balance_async(self: 'PList[T]') -> 'parimpl.Future[PList[T]]':
+        """
+        Start the balancing of a list (see ``distribute_async``).
+
+        Example::
+
+            >>> future = a_list.filter(p).balance_async()
+            >>> other = b_list.map(f)  # overlapped with the communications
+            >>> balanced = future.result()
+
+        :return: a future of a balanced list
+        """
+        return self.distribute_async(Distribution.balanced(self.length()))
+
     def gather(self: 'PList[T]', pid: int) -> 'PList[T]':
+        """
+        The content is gathered by one collective communication.
+        """
         assert pid in par.procs()
-        d_list = [self.length() if i == pid else 0 for i in par.procs()]
-        distr = Distribution(d_list)
-        return self.distribute(distr)
+        distr = Distribution([self.length() if i == pid else 0 for i in par.procs()])
+        content = self.gather_to_root(pid)
+        return PList.__from_content(SList() if content is None else content, distr)
 
-    def scatter(self: 'PList[T]', pid: int) -> 'PList[T]':
+    def gather_to_root(self: 'PList[T]', pid: int = 0) -> Optional['SList[T]']:
+        """
+        Return the content of the list at one processor.
+
+        The chunks of all the processors are gathered at processor ``pid``
+        by one collective communication, and concatenated in linear time.
+        Contrary to ``to_seq``, the other processors do not receive the content.
+
+        Example::
+
+            >>> PList.init(int, 4).gather_to_root(0)  # at processor 0
+            [0, 1, 2, 3]
+
+        :param pid: (default: 0) a processor identifier
+        :return: a sequential list at processor ``pid``, None at the other processors
+        """
         assert pid in par.procs()
+        chunks = _COMM.gather(self.__content.force(), root=pid)
+        if _PID != pid:
+            return None
+        return SList(itertools.chain.from_iterable(chunks))
 
-        def select(index, a_list):
-            if index == pid:
-                return a_list
-            return []
+    def gather_async(self: 'PList[T]', pid: int) -> 'parimpl.Future[PList[T]]':
+        """
+        Start gathering the content of a list at one processor.
+
+        The non-empty chunks are sent to processor ``pid`` without waiting.
+        The gathered list is returned by the ``result`` method of the
+        returned future.
+
+        :param pid: a processor identifier
+        :return: a future of a list with all its elements at processor ``pid``
+        """
+        assert pid in par.procs()
+        distr = Distribution([self.length() if i == pid else 0 for i in par.procs()])
+        messages = {pid: self.__content.force()} if self.__local_size > 0 else {}
+        sources = [i for i in par.procs() if self.__distribution[i] > 0] if _PID == pid else []
 
-        select_distr = Distribution([size if index == pid else 0
-                                     for (index, size) in enumerate(self.distribution)])
-        at_pid = self.get_partition().mapi(select).flatten(select_distr)
+        def complete(received):
+            content = SList(itertools.chain.from_iterable(received[i] for i in sources))
+            return PList.__from_content(content, distr)
 
-        distr = Distribution.balanced(at_pid.length())
-        return at_pid.distribute(distr)
+        return parimpl.Future(messages, sources, complete)
+
+    def scatter(self: 'PList[T]', pid: int) -> 'PList[T]':
+        """
+        The elements of processor ``pid`` are sent by blocks,
+        with a bounded number of blocks in flight.
+        """
+        assert pid in par.procs()
+        distr = Distribution.balanced(self.__distribution[pid])
+        values = self.__content.force() if _PID == pid else None
+        return PList.__from_content(SList(parimpl.scatter_stream(values, distr, pid)), distr)
 
     def scatter_range(self: 'PList[T]', rng) -> 'PList[T]':
 
@@ -297,17 +503,179 @@ class PList(interface.List, Generic[T]):
         p_list.__start_index = SList(p_list.__distribution).scanl(add, 0)[_PID]
         return p_list
 
+    @staticmethod
+    def from_iterable(iterable: Iterable[T], size: Optional[int] = None,
+                      block_size: int = parimpl.BLOCK_SIZE) -> 'PList[T]':
+        """
+        Return a balanced parallel list containing the values of an iterable
+        read at processor 0.
+
+        Processor 0 consumes the iterable by blocks, and sends the blocks
+        to the other processors with a bounded number of blocks in flight:
+        it never holds more than its own share and a window of the values.
+        If the number of values is known, from ``size`` or the length of the
+        iterable, each value is sent directly to its processor. Otherwise
+        the blocks are dealt to the processors in a round-robin way,
+        then moved to their final processors.
+
+        Example::
+
+            >>> PList.from_iterable(range(0, 5)).to_seq()
+            [0, 1, 2, 3, 4]
+
+        :param iterable: at processor 0, an iterable. Ignored at the other processors.
+        :param size: (optional) the number of values of the iterable
+        :param block_size: (optional) the number of values in a message
+        :return: a parallel list
+        """
+        if size is None and _PID == 0 and hasattr(iterable, '__len__'):
+            size = len(iterable)
+        size = _COMM.bcast(size, 0)
+        if size is not None:
+            distr = Distribution.balanced(size)
+            content = parimpl.scatter_stream(iterable, distr, 0, block_size)
+            return PList.__from_content(SList(content), distr)
+        blocks, size = parimpl.deal_stream(iterable, 0, block_size)
+        distr = Distribution.balanced(size)
+        messages = defaultdict(list)
+        for (block_start, block) in blocks:
+            for (pid, lower, upper) in distr.overlaps(block_start, block_start + len(block)):
+                messages[pid].append((lower, block[lower - block_start:upper - block_start]))
+        # The k-th block, of the indices from k * block_size, was dealt to processor
+        # k % NPROCS: the senders of the current processor are the owners of the
+        # blocks that overlap its part of the list.
+        (start, stop) = distr.bounds()[_PID:_PID + 2]
+        first_block = start // block_size
+        last_block = min(-(-stop // block_size), first_block + _NPROCS)
+        sources = sorted({block % _NPROCS for block in range(first_block, last_block)})
+        received = parimpl.exchange(messages, sources)
+        content = SList([None] * distr[_PID])
+        for slices in received.values():
+            for (lower, values) in slices:
+                content[lower - start:lower - start + len(values)] = values
+        return PList.__from_content(content, distr)
+
+    @staticmethod
+    def from_text_lines(filename: str, parser: Optional[Callable[[str], T]] = None,
+                        encoding: str = 'utf-8') -> 'PList[T]':
+        """
+        Create a balanced parallel list from the lines of a text file.
+
+        The file should be accessible by all the processors. Each processor
+        reads and parses only the lines that start in its share of the bytes
+        of the file, then the list is balanced.
+
+        :param filename: the name of the file
+        :param parser: (optional) a function applied to each line,
+            without its line terminator. By default the lines are kept as strings.
+        :param encoding: (default: 'utf-8') the encoding of the file
+        :return: a parallel list with one element per line
+        """
+        bounds = Distribution.balanced(os.path.getsize(filename)).bounds()
+        lines = SList(files.read_lines(filename, bounds[_PID], bounds[_PID + 1], encoding))
+        if parser is not None:
+            lines = lines.map(parser)
+        distr = Distribution(_COMM.allgather(len(lines)))
+        return PList.__from_content(lines, distr).balance()
+
+    @staticmethod
+    def from_binary(filename: str, fmt: str) -> 'PList[T]':
+        """
+        Create a balanced parallel list from the fixed-size records of a binary file.
+
+        The file should be accessible by all the processors. Each processor
+        reads only its records: no communication is needed.
+
+        :param filename: the name of the file
+        :param fmt: the format of a record, as in module ``struct``, e.g. ``'<d'``.
+            A record with one field is represented by the value of this field,
+            a record with several fields by a tuple.
+        :return: a parallel list with one element per record
+        """
+        distr = Distribution.balanced(files.number_of_records(filename, fmt))
+        bounds = distr.bounds()
+        records = files.read_records(filename, fmt, bounds[_PID], bounds[_PID + 1])
+        return PList.__from_content(SList(records), distr)
+
+    @staticmethod
+    def from_file(filename: str, parser: Optional[Callable[[str], T]] = None,
+                  encoding: str = 'utf-8', fmt: Optional[str] = None) -> 'PList[T]':
+        """
+        Create a balanced parallel list from a file.
+
+        If ``fmt`` is given, the file is read as a binary file by ``from_binary``,
+        otherwise as a text file by ``from_text_lines``.
+        """
+        if fmt is not None:
+            return PList.from_binary(filename, fmt)
+        return PList.from_text_lines(filename, parser, encoding)
+
+    def save(self: 'PList[T]', filename: str, fmt: str) -> None:
+        """
+        Save the list in a binary file of fixed-size records.
+
+        The file starts with a header giving the record format, the size
+        and the distribution of the list. The file should be accessible
+        by all the processors: each processor writes its own records
+        at their place.
+
+        :param filename: the name of the file
+        :param fmt: the format of a record, as in module ``struct``, e.g. ``'<d'``.
+            Elements are either values, for formats with one field, or tuples.
+        """
+        offset = files.write_header(filename, fmt, self.__distribution) if _PID == 0 else None
+        offset = _COMM.bcast(offset, 0)
+        files.write_records(filename, fmt, offset, self.__start_index, self.__content)
+        _COMM.barrier()
+
+    @staticmethod
+    def load(filename: str) -> 'PList[T]':
+        """
+        Load a list saved by ``save``.
+
+        Each processor maps its own records in memory: they are read from
+        the file only when they are used, and the list is lazy
+        (see ``lazy``). If the list was saved with the same number of
+        processors, it has its saved distribution, otherwise it is balanced.
+
+        :param filename: the name of the file
+        :return: a parallel list
+        """
+        fmt, distribution, offset = files.read_header(filename)
+        if len(distribution) == _NPROCS:
+            distr = Distribution(distribution)
+        else:
+            distr = Distribution.balanced(sum(distribution))
+        bounds = distr.bounds()
+        records = files.map_records(filename, fmt, offset, bounds[_PID], bounds[_PID + 1])
+        return PList.__from_content(LazySList(records), distr)
+
     def to_seq(self: 'PList[T]') -> 'SList[T]':
-        return SList(self.get_partition().reduce(concat, []))
+        """
+        The content is gathered at all the processors, by one collective
+        communication. To get the content at one processor only,
+        use ``gather_to_root``.
+        """
+        chunks = _COMM.allgather(self.__content.force())
+        return SList(itertools.chain.from_iterable(chunks))
 
     def permute(self: 'PList[T]', bij: Callable[[int], int]) -> 'PList[T]':
+        """
+        The destination of each element is found by bisection in the bounds
+        of the distribution. Each processor only sends elements to the processors
+        that receive some, and receives elements from any processor until it has
+        as many elements as before: ``bij`` being a bijection, no processor needs
+        to know where its elements come from. The received elements are placed
+        at their index.
+        """
+        bounds = Distribution(self.__distribution).bounds()
+        messages = defaultdict(list)
+        for (index, value) in enumerate(self.__content.force(), self.__start_index):
+            new_index = bij(index)
+            messages[bisect.bisect_right(bounds, new_index) - 1].append((new_index, value))
+        content = SList([None] * self.__local_size)
+        for (new_index, value) in parimpl.route(messages, self.__local_size):
+            content[new_index - self.__start_index] = value
         p_list = self.__get_shape()
-        distr = Distribution(self.__distribution)
-        new_indices = self.mapi(lambda i, x: distr.to_pid(bij(i), x)).get_partition().map(_group_by)
-        mapping = new_indices.__content[0]
-        keys = mapping.keys()
-        messages = [mapping[pid] if pid in keys else [] for pid in par.procs()]
-        exchanged = SList(parimpl.COMM.alltoall(messages)).flatten()
-        exchanged.sort()
-        p_list.__content = exchanged.map(lambda pair: pair[1])
+        p_list.__content = content
         return p_list
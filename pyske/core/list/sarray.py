@@ -0,0 +1,252 @@
+"""
+A module of sequential arrays and associated primitives
+
+class SArray: sequential lists stored in contiguous NumPy arrays.
+"""
+import builtins
+import functools
+from typing import TypeVar, Callable, Sequence, Tuple, Optional, Generic
+import numpy
+
+from pyske.core import interface
+from pyske.core.list.slist import SList
+from pyske.core.support.array import to_array
+from pyske.core.support.list import scan
+from pyske.core.util import vectorize
+
+__all__ = ['SArray']
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+R = TypeVar('R')  # pylint: disable=invalid-name
+U = TypeVar('U')  # pylint: disable=invalid-name
+V = TypeVar('V')  # pylint: disable=invalid-name
+
+
+class SArray(interface.List, Generic[T]):
+    # pylint: disable=too-many-public-methods
+    """
+    Sequential array.
+
+    The content is stored in a one-dimensional NumPy array. Numbers are
+    therefore stored unboxed, in a contiguous memory area. Values that
+    cannot be stored as NumPy scalars are stored as Python objects.
+
+    When the elements are numbers and the function given to ``map``, ``mapi``,
+    ``map2``, ``map2i``, ``map3``, ``reduce`` or ``map_reduce`` has a kernel
+    registered in ``pyske.core.util.vectorize``, the kernel is applied
+    to the whole array at once.
+
+    Static methods from interface IList:
+        init, from_seq.
+
+    Methods from interface IList:
+        length, to_seq,
+        map, mapi, map2, map2i, zip, filter,
+        reduce, map_reduce, scanl, scanl_last, scanr,
+        get_partition, flatten,
+        distribute, balance,
+        gather, scatter, scatter_range,
+        invariant.
+
+    Methods:
+        lazy, force.
+
+    Properties:
+        array, dtype.
+    """
+
+    def __init__(self: 'SArray[T]', values=None, dtype=None):
+        # pylint: disable=super-init-not-called
+        self.__values: numpy.ndarray = to_array([] if values is None else values, dtype)
+
+    @property
+    def array(self: 'SArray[T]') -> numpy.ndarray:
+        """Return the underlying NumPy array"""
+        return self.__values
+
+    @property
+    def dtype(self: 'SArray[T]') -> numpy.dtype:
+        """Return the data type of the elements"""
+        return self.__values.dtype
+
+    def __len__(self: 'SArray[T]') -> int:
+        return len(self.__values)
+
+    def __iter__(self: 'SArray[T]'):
+        return iter(self.__values.tolist())
+
+    def __getitem__(self: 'SArray[T]', index):
+        if isinstance(index, slice):
+            return SArray(self.__values[index])
+        return self.__values[index].item() if self.__values.dtype != object \
+            else self.__values[index]
+
+    def __eq__(self: 'SArray[T]', other) -> bool:
+        if isinstance(other, SArray):
+            other = other.array
+        if not isinstance(other, (list, tuple, numpy.ndarray)):
+            return NotImplemented
+        return len(self) == len(other) and self.__values.tolist() == list(other)
+
+    def __str__(self: 'SArray[T]') -> str:
+        return str(self.__values.tolist())
+
+    def __repr__(self: 'SArray[T]') -> str:
+        return "SArray(" + str(self) + ")"
+
+    @staticmethod
+    def init(value_at: Callable[[int], T], size: int, dtype=None) -> 'SArray[T]':
+        assert size >= 0
+        if dtype is not None:
+            return SArray(numpy.fromiter(map(value_at, range(0, size)), dtype, size))
+        return SArray([value_at(i) for i in range(0, size)])
+
+    def lazy(self: 'SArray[T]') -> 'SArray[T]':
+        """
+        Return the array itself: array-backed lists are never lazy.
+
+        :return: self
+        """
+        return self
+
+    def force(self: 'SArray[T]') -> 'SArray[T]':
+        """
+        Return the array itself: array-backed lists are never lazy.
+
+        :return: self
+        """
+        return self
+
+    def length(self: 'SArray[T]') -> int:
+        return len(self.__values)
+
+    def filter(self: 'SArray[T]', predicate: Callable[[T], bool]) -> 'SArray[T]':
+        size = len(self.__values)
+        mask = numpy.fromiter(map(predicate, self.__values.tolist()), bool, size)
+        return SArray(self.__values[mask])
+
+    def map(self: 'SArray[T]', unary_op: Callable[[T], R]) -> 'SArray[R]':
+        result = vectorize.apply(unary_op, self.__values)
+        if result is not None:
+            return SArray(result)
+        return SArray(map(unary_op, self.__values.tolist()))
+
+    def mapi(self: 'SArray[T]', binary_op: Callable[[int, T], R]) -> 'SArray[R]':
+        result = vectorize.apply(binary_op, numpy.arange(0, len(self.__values)), self.__values)
+        if result is not None:
+            return SArray(result)
+        return SArray(map(binary_op, range(0, len(self.__values)), self.__values.tolist()))
+
+    def map_reduce(self: 'SArray[T]', unary_op: Callable[[T], R],
+                   binary_op: Callable[[R, R], R], neutral: Optional[T] = None) -> R:
+        if len(self.__values) == 0:
+            return neutral
+        mapped = vectorize.apply(unary_op, self.__values)
+        if mapped is not None:
+            return SArray(mapped).reduce(binary_op, neutral)
+        if neutral is None:
+            return functools.reduce(binary_op, map(unary_op, self.__values.tolist()))
+        return functools.reduce(binary_op, map(unary_op, self.__values.tolist()), neutral)
+
+    def reduce(self: 'SArray[T]', binary_op: Callable[[T, T], T],
+               neutral: Optional[T] = None) -> T:
+        if len(self.__values) > 0:
+            reduced, result = vectorize.reduce(binary_op, self.__values)
+            if reduced:
+                return result if neutral is None else binary_op(neutral, result)
+        if neutral is None:
+            return functools.reduce(binary_op, self.__values.tolist())
+        return functools.reduce(binary_op, self.__values.tolist(), neutral)
+
+    def scanl(self: 'SArray[T]', binary_op: Callable[[R, T], R], neutral: R) -> 'SArray[R]':
+        res, _ = self.scanl_last(binary_op, neutral)
+        return res
+
+    def scanr(self: 'SArray[T]', binary_op: Callable[[R, T], R]) -> 'SArray[R]':
+        assert len(self.__values) > 0
+        values = self.__values.tolist()
+        res = scan(values[1:], binary_op, values[0])
+        return SArray(res)
+
+    def scanl_last(self: 'SArray[T]', binary_op: Callable[[R, T], R], neutral: R) \
+            -> 'Tuple[SArray[R], R]':
+        res = scan(self.__values.tolist(), binary_op, neutral)
+        last: R = res.pop()
+        return SArray(res), last
+
+    def zip(self: 'SArray[T]', a_list: 'SArray[U]') -> 'SArray[Tuple[T, U]]':
+        assert len(self) == len(a_list)
+        return SArray(builtins.zip(self, a_list))
+
+    def map2(self: 'SArray[T]', binary_op: Callable[[T, U], R],
+             a_list: 'SArray[U]') -> 'SArray[R]':
+        assert len(self) == len(a_list)
+        result = vectorize.apply(binary_op, self.__values, a_list.array)
+        if result is not None:
+            return SArray(result)
+        return SArray(map(binary_op, self, a_list))
+
+    def map2i(self: 'SArray[T]', ternary_op: Callable[[int, T, U], R],
+              a_list: 'SArray[U]') -> 'SArray[R]':
+        assert len(self) == len(a_list)
+        result = vectorize.apply(ternary_op, numpy.arange(0, len(self)),
+                                 self.__values, a_list.array)
+        if result is not None:
+            return SArray(result)
+        return SArray(map(ternary_op, range(0, len(self)), self, a_list))
+
+    def map3(self: 'SArray[T]', ternary_op: 'Callable[[T, U, V], R]',
+             a_list: 'SArray[U]', b_list: 'SArray[V]') -> 'SArray[R]':
+        assert len(self) == len(a_list)
+        assert len(self) == len(b_list)
+        result = vectorize.apply(ternary_op, self.__values, a_list.array, b_list.array)
+        if result is not None:
+            return SArray(result)
+        return SArray(map(ternary_op, self, a_list, b_list))
+
+    def get_partition(self: 'SArray[T]') -> 'SArray[SArray[T]]':
+        res = numpy.empty(1, dtype=object)
+        res[0] = self
+        return SArray(res)
+
+    def flatten(self: 'SArray[SArray[T]]',
+                new_distr: interface.Distribution = None) -> 'SArray[T]':
+        arrays = [to_array(a_list.array if isinstance(a_list, SArray) else a_list)
+                  for a_list in self.__values]
+        if not arrays:
+            return SArray()
+        return SArray(numpy.concatenate(arrays))
+
+    def distribute(self: 'SArray[T]', _: interface.Distribution) -> 'SArray[T]':
+        return self
+
+    def balance(self: 'SArray[T]') -> 'SArray[T]':
+        return self
+
+    @staticmethod
+    def from_seq(sequence: Sequence[T]) -> 'SArray[T]':
+        return SArray(sequence)
+
+    def to_seq(self: 'SArray[T]') -> 'SList[T]':
+        return SList(self.__values.tolist())
+
+    def gather(self: 'SArray[T]', pid: int) -> 'SArray[T]':
+        assert pid == 0
+        return self
+
+    def invariant(self: 'SArray[T]') -> bool:
+        return self.__values.ndim == 1
+
+    def scatter(self: 'SArray[T]', pid: int) -> 'SArray[T]':
+        assert pid == 0
+        return self
+
+    def scatter_range(self: 'SArray[T]', rng: range) -> 'SArray[T]':
+        return SArray(self.__values[rng.start:rng.stop:rng.step])
+
+    def permute(self: 'SArray[T]', bij: Callable[[int], int]) -> 'SArray[T]':
+        size = len(self.__values)
+        indices = numpy.fromiter(map(bij, range(0, size)), numpy.int64, size)
+        res = numpy.empty_like(self.__values)
+        res[indices] = self.__values
+        return SArray(res)
@@ -5,9 +5,11 @@ class SList: sequential lists.
 """
 import builtins
 import functools
-from operator import concat
+import itertools
+import os
 from typing import TypeVar, Callable, Sequence, Tuple, Optional, Generic, Iterator
 from pyske.core import interface
+from pyske.core.support import files
 from pyske.core.support.list import scan
 
 __all__ = ['SList']
@@ -36,10 +38,10 @@ class SList(list, interface.List, Generic[T]):
         invariant.
 
     Static methods:
-        from_str.
+        from_str, from_file, from_text_lines, from_binary.
 
     Methods:
-        scanp.
+        scanp, lazy, force.
     """
 
     @staticmethod
@@ -73,6 +75,35 @@ class SList(list, interface.List, Generic[T]):
     def length(self: 'SList[T]') -> int:
         return len(self)
 
+    def lazy(self: 'SList[T]') -> 'LazySList[T]':
+        """
+        Return a lazy list with the same content.
+
+        The element-wise skeletons (map, mapi, map2, map2i, map3, zip, filter)
+        of the lazy list are not evaluated immediately: a chain of such skeletons
+        is evaluated in one pass when the list is forced, for example by a
+        reduction, without building the intermediate lists.
+
+        Example::
+
+            >>> from operator import add
+            >>> SList([1, 2, 3, 4]).lazy().map(lambda x: x * x).reduce(add)
+            30
+
+        :return: a lazy list
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyske.core.list.lazy import LazySList
+        return LazySList(self)
+
+    def force(self: 'SList[T]') -> 'SList[T]':
+        """
+        Return the list itself: a sequential list is never lazy.
+
+        :return: self
+        """
+        return self
+
     def filter(self: 'SList[T]', predicate: Callable[[T], bool]):
         return SList(filter(predicate, self))
 
@@ -167,8 +198,7 @@ class SList(list, interface.List, Generic[T]):
 
     def flatten(self: 'SList[SList[T]]',
                 new_distr: interface.Distribution = None) -> 'SList[T]':
-        a_list = functools.reduce(concat, self, [])
-        return SList(a_list)
+        return SList(itertools.chain.from_iterable(self))
 
     def distribute(self: 'SList[T]', _: interface.Distribution) -> 'SList[T]':
         return self
@@ -176,6 +206,48 @@ class SList(list, interface.List, Generic[T]):
     def balance(self: 'SList[T]') -> 'SList[T]':
         return self
 
+    @staticmethod
+    def from_text_lines(filename: str, parser: Optional[Callable[[str], T]] = None,
+                        encoding: str = 'utf-8') -> 'SList[T]':
+        """
+        Create a list from the lines of a text file.
+
+        :param filename: the name of the file
+        :param parser: (optional) a function applied to each line,
+            without its line terminator. By default the lines are kept as strings.
+        :param encoding: (default: 'utf-8') the encoding of the file
+        :return: a list with one element per line
+        """
+        size = os.path.getsize(filename)
+        lines = SList(files.read_lines(filename, 0, size, encoding))
+        return lines if parser is None else lines.map(parser)
+
+    @staticmethod
+    def from_binary(filename: str, fmt: str) -> 'SList[T]':
+        """
+        Create a list from the fixed-size records of a binary file.
+
+        :param filename: the name of the file
+        :param fmt: the format of a record, as in module ``struct``, e.g. ``'<d'``.
+            A record with one field is represented by the value of this field,
+            a record with several fields by a tuple.
+        :return: a list with one element per record
+        """
+        return SList(files.read_records(filename, fmt, 0, files.number_of_records(filename, fmt)))
+
+    @staticmethod
+    def from_file(filename: str, parser: Optional[Callable[[str], T]] = None,
+                  encoding: str = 'utf-8', fmt: Optional[str] = None) -> 'SList[T]':
+        """
+        Create a list from a file.
+
+        If ``fmt`` is given, the file is read as a binary file by ``from_binary``,
+        otherwise as a text file by ``from_text_lines``.
+        """
+        if fmt is not None:
+            return SList.from_binary(filename, fmt)
+        return SList.from_text_lines(filename, parser, encoding)
+
     @staticmethod
     def from_seq(sequence: Sequence[T]) -> 'SList[T]':
         return SList(sequence)
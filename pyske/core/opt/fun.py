@@ -1,7 +1,8 @@
 """
 Module of basic function for composition optimization.
 """
-__all__ = ['Fun', 'idt', 'compose', 'curry', 'uncurry']
+__all__ = ['Fun', 'idt', 'compose', 'compose_index', 'index_compose',
+           'compose_left', 'compose_right', 'curry', 'uncurry']
 
 from pyske.core.opt.terms import Var, Term, RULES_DB, Rule
 from pyske.core.util import fun
@@ -20,6 +21,26 @@ def compose(fun_f, fun_g):
     return Fun(fun.compose, [fun_f, fun_g])
 
 
+def compose_index(fun_g, fun_f):
+    """Composition of an indexed function and a function"""
+    return Fun(fun.compose_index, [fun_g, fun_f])
+
+
+def index_compose(fun_g, fun_f):
+    """Composition of a function and an indexed function"""
+    return Fun(fun.index_compose, [fun_g, fun_f])
+
+
+def compose_left(fun_g, fun_f):
+    """Composition of a binary function and a function on its first argument"""
+    return Fun(fun.compose_left, [fun_g, fun_f])
+
+
+def compose_right(fun_g, fun_f):
+    """Composition of a binary function and a function on its second argument"""
+    return Fun(fun.compose_right, [fun_g, fun_f])
+
+
 def curry(fun_f):
     """Currying"""
     return Fun(fun.curry, [fun_f])
@@ -1,15 +1,15 @@
 """
 Terms representing list expressions
 """
-import importlib
 import operator
 from abc import ABC, abstractmethod
 
-from pyske.core.opt.fun import compose, curry
+from pyske.core.opt.fun import compose, compose_index, index_compose, \
+    compose_left, compose_right, curry
 from pyske.core.opt.terms import MODULES, Var, Term, RULES_DB, Rule
 
-MODULES.update({'PList': importlib.import_module('pyske.core.list.plist')})
-MODULES.update({'SList': importlib.import_module('pyske.core.list.slist')})
+MODULES.register('PList', 'pyske.core.list.plist')
+MODULES.register('SList', 'pyske.core.list.slist')
 
 __all__ = ['PList', 'SList']
 
@@ -80,7 +80,7 @@ class SList(Term, _List):
 
 _MAP_MAP = \
     Rule(left=Term('map', [Term('map', [Var('PL'), Var('f')]), Var('g')], False),
-         right=Term('map', [Var('PL'), compose(Var('f'), Var('g'))], False),
+         right=Term('map', [Var('PL'), compose(Var('g'), Var('f'))], False),
          name="map map",
          type=_List)
 
@@ -109,5 +109,95 @@ _AND_NOT_NOT_OR = \
          name="and not not or",
          type=_List)
 
+_MAPI_MAP = \
+    Rule(left=Term('mapi', [Term('map', [Var('PL'), Var('f')]), Var('g')], False),
+         right=Term('mapi', [Var('PL'), compose_index(Var('g'), Var('f'))], False),
+         name="mapi map",
+         type=_List)
+
+_MAP_MAPI = \
+    Rule(left=Term('map', [Term('mapi', [Var('PL'), Var('f')]), Var('g')], False),
+         right=Term('mapi', [Var('PL'), index_compose(Var('g'), Var('f'))], False),
+         name="map mapi",
+         type=_List)
+
+_MAP2_MAP_LEFT = \
+    Rule(left=Term('map2', [Term('map', [Var('PL1'), Var('f')]), Var('g'), Var('PL2')], False),
+         right=Term('map2', [Var('PL1'), compose_left(Var('g'), Var('f')), Var('PL2')], False),
+         name="map2 map left",
+         type=_List)
+
+_MAP2_MAP_RIGHT = \
+    Rule(left=Term('map2', [Var('PL1'), Var('g'), Term('map', [Var('PL2'), Var('f')])], False),
+         right=Term('map2', [Var('PL1'), compose_right(Var('g'), Var('f')), Var('PL2')], False),
+         name="map2 map right",
+         type=_List)
+
+_MAP_MAP_REDUCE = \
+    Rule(left=Term('map_reduce',
+                   [Term('map', [Var('PL'), Var('f')]), Var('g'), Var('binary_op')], False),
+         right=Term('map_reduce', [Var('PL'), compose(Var('g'), Var('f')), Var('binary_op')],
+                    False),
+         name="map map_reduce",
+         type=_List)
+
+_MAP_MAP_REDUCE_NEUTRAL = \
+    Rule(left=Term('map_reduce',
+                   [Term('map', [Var('PL'), Var('f')]), Var('g'), Var('binary_op'), Var('e')],
+                   False),
+         right=Term('map_reduce',
+                    [Var('PL'), compose(Var('g'), Var('f')), Var('binary_op'), Var('e')], False),
+         name="map map_reduce",
+         type=_List)
+
+
+def _is_not_lazy(substitution):
+    a_list = substitution[Var('PL')]
+    return not (isinstance(a_list, Term) and a_list.function == 'lazy')
+
+
+_MAP_FILTER = \
+    Rule(left=Term('filter', [Term('map', [Var('PL'), Var('f')]), Var('p')], False),
+         right=Term('force',
+                    [Term('filter', [Term('map', [Term('lazy', [Var('PL')]), Var('f')]),
+                                     Var('p')])], False),
+         name="map filter",
+         type=_List,
+         condition=_is_not_lazy)
+
+_PARTITION_FLATTEN = \
+    Rule(left=Term('flatten', [Term('get_partition', [Var('PL')])], False),
+         right=Var('PL'),
+         name="get_partition flatten",
+         type=_List)
+
+_DISTRIBUTE_DISTRIBUTE = \
+    Rule(left=Term('distribute', [Term('distribute', [Var('PL'), Var('d1')]), Var('d2')], False),
+         right=Term('distribute', [Var('PL'), Var('d2')], False),
+         name="distribute distribute",
+         type=_List)
+
+_BALANCE_DISTRIBUTE = \
+    Rule(left=Term('distribute', [Term('balance', [Var('PL')]), Var('d')], False),
+         right=Term('distribute', [Var('PL'), Var('d')], False),
+         name="balance distribute",
+         type=_List)
+
+_DISTRIBUTE_BALANCE = \
+    Rule(left=Term('balance', [Term('distribute', [Var('PL'), Var('d')])], False),
+         right=Term('balance', [Var('PL')], False),
+         name="distribute balance",
+         type=_List)
+
+_BALANCE_BALANCE = \
+    Rule(left=Term('balance', [Term('balance', [Var('PL')])], False),
+         right=Term('balance', [Var('PL')], False),
+         name="balance balance",
+         type=_List)
+
 RULES_DB.extend([_AND_NOT_NOT_OR, _MAP_REDUCE_NEUTRAL,
-                 _MAP_REDUCE, _ZIP_MAP, _MAP_MAP])
+                 _MAP_REDUCE, _ZIP_MAP, _MAP_MAP,
+                 _MAPI_MAP, _MAP_MAPI, _MAP2_MAP_LEFT, _MAP2_MAP_RIGHT,
+                 _MAP_MAP_REDUCE, _MAP_MAP_REDUCE_NEUTRAL, _MAP_FILTER,
+                 _PARTITION_FLATTEN, _DISTRIBUTE_DISTRIBUTE, _BALANCE_DISTRIBUTE,
+                 _DISTRIBUTE_BALANCE, _BALANCE_BALANCE])
@@ -2,15 +2,53 @@
 Term rewriting systems
 """
 import functools
+import importlib
 from functools import reduce
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+import keyword
 import types
 
-__all__ = ['MODULES', 'Var', 'Term', 'Rule', 'RULES_DB']
+__all__ = ['MODULES', 'Var', 'Term', 'Rule', 'RULES_DB', 'MAX_STEPS', 'PLAN_CACHE_SIZE']
 
-MODULES = {}
 RULES_DB = []
 
+# Maximal number of rule applications during the optimization of a term.
+MAX_STEPS = 10000
+
+# Maximal number of compiled plans kept by Term.run.
+PLAN_CACHE_SIZE = 256
+
+
+class _Modules(dict):
+    """
+    Modules of the classes of the terms, by class name.
+
+    A module registered by ``register`` is imported when it is first used.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__names = {}
+
+    def register(self, class_name: str, module_name: str) -> None:
+        """
+        Register the module of a class, without importing it.
+
+        :param class_name: the name of a class
+        :param module_name: the name of the module defining the class
+        """
+        self.__names[class_name] = module_name
+
+    def __missing__(self, class_name):
+        if class_name not in self.__names:
+            raise KeyError(class_name)
+        module = importlib.import_module(self.__names[class_name])
+        self[class_name] = module
+        return module
+
+
+MODULES = _Modules()
+
 
 class Var(str):
     """Representation of term variables"""
@@ -44,13 +82,22 @@ class Term:
             return cls_obj(*vargs)
         return getattr(cls_obj, self.function)(*vargs)
 
-    def opt(self):
-        """Optimized a term."""
-        return inner_most_strategy(self)
+    def opt(self, max_steps=None):
+        """Optimized a term.
+
+        :param max_steps: (optional) maximal number of rule applications,
+            ``MAX_STEPS`` by default
+        """
+        return inner_most_strategy(self, max_steps)
 
     def run(self):
-        """Execute an optimized term."""
-        return self.opt().eval()
+        """Execute an optimized term.
+
+        The optimized and compiled form of the term is cached: running
+        a term with the same structure and the same functions, but with
+        other raw values, neither rewrites nor interprets the term again.
+        """
+        return compile_term(self)()
 
     @staticmethod
     def __match(obj, pattern):
@@ -106,14 +153,15 @@ def merge(dict1: dict, dict2: dict):
     return dict_r
 
 
-Rule = namedtuple('Rule', 'left right name type')
+Rule = namedtuple('Rule', 'left right name type condition', defaults=(None,))
 
 
 def apply_rule(term: Term, rule: Rule):
     """Apply a rule to a term."""
     if isinstance(term, rule.type):
         substitution = term.match(rule.left)
-        if substitution is not None:
+        if substitution is not None and \
+                (rule.condition is None or rule.condition(substitution)):
             new_t = subst(rule.right, substitution)
             if isinstance(new_t, Term):
                 new_t = term.__class__(new_t.function, new_t.arguments, new_t.static)
@@ -126,24 +174,302 @@ def apply_rules(term: Term, rules):
     return functools.reduce(apply_rule, rules, term)
 
 
-def inner_most_strategy(term: Term):
-    """Apply all available rules on a term (inner most strategy)."""
-    if term.function == "__raw__":
+def index_rules(rules):
+    """Index rules by the function symbol at the head of their left-hand side.
+
+    :param rules: a sequence of rules
+    :return: a dictionary from function symbols to lists of pairs
+        (position of the rule in ``rules``, rule). Rules whose left-hand side
+        is a variable are indexed by None.
+    """
+    index = {}
+    for (position, rule) in enumerate(rules):
+        head = rule.left.function if isinstance(rule.left, Term) else None
+        index.setdefault(head, []).append((position, rule))
+    return index
+
+
+def _candidates(index, head):
+    try:
+        rules = index.get(head, [])
+    except TypeError:
+        rules = []
+    if None in index:
+        rules = sorted(rules + index[None], key=lambda pair: pair[0])
+    return rules
+
+
+def _apply_indexed(term, index, max_steps):
+    """Apply indexed rules to a term, in the order of the rule database.
+
+    Only the rules whose head is the head of the current term are tried.
+
+    :return: a pair (new term, number of rules applied)
+    """
+    steps = 0
+    position = -1
+    while isinstance(term, Term) and steps < max_steps:
+        for (rule_position, rule) in _candidates(index, term.function):
+            if rule_position > position:
+                new_t = apply_rule(term, rule)
+                if new_t is not term:
+                    term = new_t
+                    position = rule_position
+                    steps += 1
+                    break
+        else:
+            break
+    return term, steps
+
+
+def _ref(value):
+    """Return a hashable reference to a shared term or to a constant."""
+    if isinstance(value, Term):
+        return 'term', id(value)
+    try:
+        hash(value)
+    except TypeError:
+        return 'id', id(value)
+    return type(value), value
+
+
+class _Rewriter:
+    """Inner most rewriting with hash-consed terms and memoized normal forms.
+
+    Structurally equal terms are represented by a single shared term,
+    whose key is its function symbol and the references to its (shared)
+    arguments. Each shared term is normalized only once.
+    """
+
+    def __init__(self, rules, max_steps):
+        self.__index = index_rules(rules)
+        self.__steps = max_steps
+        self.__shared = {}
+        self.__seen = {}
+
+    def normalize(self, term):
+        """Return the normal form of a term."""
+        if not isinstance(term, Term):
+            return term
+        seen = self.__seen.get(id(term))
+        if seen is not None and seen[0] is term:
+            return seen[1]
+        if term.function == "__raw__":
+            key = (type(term), "__raw__", _ref(term.arguments[0]))
+            result = self.__shared.setdefault(key, term)
+        else:
+            arguments = [self.normalize(e) for e in term.arguments]
+            key = (type(term), _ref(term.function), term.static, tuple(map(_ref, arguments)))
+            shared = self.__shared.get(key)
+            if shared is None:
+                shared = type(term)(term.function, arguments, term.static)
+                self.__shared[key] = shared
+                result = self.__rewrite(shared)
+            else:
+                result = self.__seen[id(shared)][1]
+        self.__seen[id(term)] = (term, result)
+        return result
+
+    def __rewrite(self, term):
+        # Recorded before rewriting: a term rewritten into itself is normal.
+        self.__seen[id(term)] = (term, term)
+        if self.__steps > 0:
+            new_t, steps = _apply_indexed(term, self.__index, self.__steps)
+            self.__steps -= steps
+            if steps > 0:
+                result = self.normalize(new_t)
+                self.__seen[id(term)] = (term, result)
+                return result
         return term
-    condition = True
-    prev_args = term.arguments
-    new_args = []
-    while condition:
-        new_args = [inner_most_strategy(e) if isinstance(e, Term) else e for e in prev_args]
-        matches = [new_args[i].match(prev_args[i])
-                   if isinstance(new_args[i], Term) else {} for i in range(0, len(new_args))]
-        changes = functools.reduce(merge, matches, {})
-        condition = changes != {}
-        prev_args = new_args
-    new_t = type(term)(term.function, new_args, term.static)
-    new_t = apply_rules(new_t, RULES_DB)
-    if isinstance(new_t, Term):
-        if new_t.match(term) == {}:
-            return new_t
-        return inner_most_strategy(new_t)
-    return new_t
+
+
+def inner_most_strategy(term: Term, max_steps=None, rules=None):
+    """Apply all available rules on a term (inner most strategy).
+
+    Rules are indexed by their head symbol, subterms are hash-consed
+    and their normal forms are memoized, so the optimization time
+    is roughly linear in the size of the term.
+
+    :param term: a term
+    :param max_steps: (optional) maximal number of rule applications,
+        ``MAX_STEPS`` by default. When it is reached, the remaining
+        subterms are left as they are.
+    :param rules: (optional) the rules to apply, ``RULES_DB`` by default
+    :return: a term equivalent to ``term``
+    """
+    if max_steps is None:
+        max_steps = MAX_STEPS
+    if rules is None:
+        rules = RULES_DB
+    return _Rewriter(rules, max_steps).normalize(term)
+
+
+class _Param:
+    """Placeholder for a value given to a compiled plan."""
+    __slots__ = ['index']
+
+    def __init__(self, index):
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, _Param) and other.index == self.index
+
+    def __hash__(self):
+        return hash((_Param, self.index))
+
+    def __repr__(self):
+        return "PARAM(" + str(self.index) + ")"
+
+
+_CONSTANT_TYPES = (str, bytes, int, float, complex, bool, type(None), type,
+                   types.BuiltinFunctionType, functools.partial)
+
+
+def _is_constant(value):
+    # Python functions, as lambdas, are usually created anew for each term:
+    # they are parameters.
+    if isinstance(value, tuple):
+        return all(_is_constant(e) for e in value)
+    return isinstance(value, _CONSTANT_TYPES)
+
+
+class _Template:
+    """The structure of a term, its raw values being replaced by parameters.
+
+    Constants (numbers, strings, built-in functions, ...) are part of
+    the structure. Other values, including Python functions and the
+    content of raw terms, are parameters.
+    """
+
+    def __init__(self, term):
+        self.params = []
+        self.__param_ids = {}
+        self.__nodes = {}
+        self.__key = []
+        self.term, _ = self.__visit(term)
+        self.key = tuple(self.__key)
+
+    def __param(self, value):
+        index = self.__param_ids.get(id(value))
+        if index is None:
+            index = len(self.params)
+            self.__param_ids[id(value)] = index
+            self.params.append(value)
+        return _Param(index)
+
+    def __visit(self, value):
+        if not isinstance(value, Term):
+            if _is_constant(value):
+                return value, ('c', type(value), value)
+            param = self.__param(value)
+            return param, ('p', param.index)
+        node = self.__nodes.get(id(value))
+        if node is not None and node[0] is value:
+            return node[1]
+        if value.function == "__raw__":
+            param = self.__param(value.arguments[0])
+            template = type(value)("__raw__", [param], value.static)
+            key = (type(value), "__raw__", value.static, (('p', param.index),))
+        else:
+            visited = [self.__visit(e) for e in value.arguments]
+            template = type(value)(value.function, [e for (e, _) in visited], value.static)
+            key = (type(value), type(value.function), value.function, value.static,
+                   tuple(e_key for (_, e_key) in visited))
+        self.__key.append(key)
+        result = (template, ('n', len(self.__key) - 1))
+        self.__nodes[id(value)] = (value, result)
+        return result
+
+
+class _Compiler:
+    """Compile an optimized term into a Python function of its parameters.
+
+    Each (shared) subterm is evaluated once, and method calls
+    are resolved when the function is compiled.
+    """
+
+    def __init__(self):
+        self.__lines = []
+        self.__constants = {}
+        self.__names = {}
+
+    def compile(self, term):
+        """Return a function taking the list of parameters of the term."""
+        result = self.__emit(term)
+        source = "def _plan(_p):\n" + "".join(self.__lines) + "    return " + result + "\n"
+        namespace = dict(self.__constants)
+        exec(source, namespace)  # pylint: disable=exec-used
+        return namespace['_plan']
+
+    def __constant(self, value):
+        name = "_c" + str(len(self.__constants))
+        self.__constants[name] = value
+        return name
+
+    def __emit(self, value):
+        if isinstance(value, _Param):
+            return "_p[" + str(value.index) + "]"
+        if not isinstance(value, Term):
+            return self.__constant(value)
+        name = self.__names.get(id(value))
+        if name is not None:
+            return name
+        if value.function == "__raw__":
+            expr = self.__emit(value.arguments[0])
+        elif isinstance(value.function,
+                        (types.FunctionType, types.BuiltinFunctionType, functools.partial)):
+            args = [self.__emit(e) for e in value.arguments]
+            expr = self.__constant(value.function) + "(" + ", ".join(args) + ")"
+        else:
+            expr = self.__emit_method(value)
+        name = "_v" + str(len(self.__names))
+        self.__lines.append("    " + name + " = " + expr + "\n")
+        self.__names[id(value)] = name
+        return name
+
+    def __emit_method(self, term):
+        ocn = term.arguments[0]
+        if term.static and isinstance(ocn, str):
+            target = self.__constant(getattr(MODULES[ocn], ocn))
+        elif term.static:
+            modules = self.__constant(MODULES)
+            target = self.__emit(ocn)
+            target = "getattr(" + modules + "[" + target + "], " + target + ")"
+        else:
+            target = self.__emit(ocn)
+        args = "(" + ", ".join(self.__emit(e) for e in term.arguments[1:]) + ")"
+        if term.function == '__init__':
+            return target + args
+        if term.function.isidentifier() and not keyword.iskeyword(term.function):
+            return target + "." + term.function + args
+        return "getattr(" + target + ", " + self.__constant(term.function) + ")" + args
+
+
+_PLANS = OrderedDict()
+
+
+def compile_term(term: Term):
+    """Optimize and compile a term.
+
+    Compiled plans are cached, indexed by the structure of the term where
+    raw values are parameters: the terms built by successive iterations
+    of a program share the same plan. At most ``PLAN_CACHE_SIZE`` plans
+    are kept, the least recently used being discarded first.
+
+    :param term: a term
+    :return: a function without argument, that evaluates the optimized term
+    """
+    template = _Template(term)
+    try:
+        plan = _PLANS.get(template.key)
+    except TypeError:
+        optimized = term.opt()
+        return optimized.eval if isinstance(optimized, Term) else lambda: optimized
+    if plan is None:
+        plan = _Compiler().compile(template.term.opt())
+        _PLANS[template.key] = plan
+        while len(_PLANS) > PLAN_CACHE_SIZE:
+            _PLANS.popitem(last=False)
+    else:
+        _PLANS.move_to_end(template.key)
+    return functools.partial(plan, template.params)
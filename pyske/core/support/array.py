@@ -0,0 +1,251 @@
+"""
+Internal module providing NumPy helpers and buffer-based collective operations
+
+When enough processors run on the same host, ``allgatherv`` builds large
+concatenations in shared memory: each processor writes its part once in a
+single segment, a mapped file of ``/dev/shm``, instead of receiving the
+parts of all the other processors in its own copy. The segment is unlinked
+as soon as all the processors have mapped it: its memory is released when
+the last of the arrays built on it is garbage collected.
+"""
+__all__ = ['to_array', 'is_buffer', 'common_dtype', 'allgatherv', 'gatherv', 'exchange']
+
+import mmap
+import os
+import socket
+import tempfile
+from typing import Iterable, Sequence, Tuple, Optional, List
+import numpy
+
+from pyske.core.support import parallel
+
+# Kinds of NumPy data types that can be communicated as raw MPI buffers:
+# booleans, signed and unsigned integers, floating point and complex numbers.
+_BUFFER_KINDS = 'biufc'
+
+_EXCHANGE_TAG = 3
+
+# Minimal number of bytes of a concatenation, and minimal number of processors,
+# for allgatherv to go through shared memory. None disables shared memory.
+SHARED_THRESHOLD: Optional[int] = 1 << 25
+SHARED_NPROCS = 4
+
+_SHARED_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+_SHARED = {'segments': 0}
+
+
+def to_array(values: Iterable, dtype=None) -> numpy.ndarray:
+    """
+    Return a one-dimensional array containing the given values.
+
+    If no data type is given, and the values cannot be stored in a
+    one-dimensional array of booleans or numbers (for example if they are
+    tuples, lists, strings, or numbers mixed with other values), an array
+    of Python objects is returned: the values are kept as they are.
+
+    Examples::
+
+        >>> to_array([1, 2, 3]).dtype.kind
+        'i'
+        >>> to_array([(1, 2), (3, 4)]).shape
+        (2,)
+        >>> to_array([1, 'a']).tolist()
+        [1, 'a']
+
+    :param values: an iterable
+    :param dtype: (optional) the data type of the array
+    :return: a one-dimensional array
+    """
+    if isinstance(values, numpy.ndarray) and values.ndim == 1:
+        return values if dtype is None else values.astype(dtype, copy=False)
+    values = list(values)
+    try:
+        array = numpy.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        array = None
+    if array is None or array.ndim != 1 or (dtype is None and not is_buffer(array.dtype)):
+        array = numpy.empty(len(values), dtype=object)
+        for (index, value) in enumerate(values):
+            array[index] = value
+    return array
+
+
+def is_buffer(dtype: numpy.dtype) -> bool:
+    """
+    Check whether arrays of the given data type can be sent as raw buffers.
+
+    :param dtype: a NumPy data type
+    :return: bool
+    """
+    return dtype.kind in _BUFFER_KINDS
+
+
+def common_dtype(array: numpy.ndarray) -> numpy.dtype:
+    """
+    Return a data type agreed upon by all the processors.
+
+    Processors with empty arrays do not take part to the choice.
+    The result is the same on all the processors.
+
+    :param array: each processor possess such an array
+    :return: a data type
+    """
+    dtypes = parallel.COMM.allgather(array.dtype.str if array.size > 0 else None)
+    dtypes = [numpy.dtype(dtype) for dtype in dtypes if dtype is not None]
+    if not dtypes:
+        return array.dtype
+    if any(not is_buffer(dtype) for dtype in dtypes):
+        return numpy.dtype(object)
+    return numpy.result_type(*dtypes)
+
+
+def _displacements(counts: Sequence[int]) -> numpy.ndarray:
+    displacements = numpy.zeros(len(counts), dtype=numpy.int64)
+    numpy.cumsum(counts[:-1], out=displacements[1:])
+    return displacements
+
+
+def _hosts() -> List[str]:
+    """
+    Return the host name of each processor.
+    All the processors should call this function the first time.
+    """
+    if 'hosts' not in _SHARED:
+        _SHARED['hosts'] = parallel.COMM.allgather(socket.gethostname())
+    return _SHARED['hosts']
+
+
+def _create_segment(nbytes: int) -> str:
+    """Return the name of a new shared memory segment of ``nbytes`` bytes."""
+    _SHARED['segments'] += 1
+    name = os.path.join(_SHARED_DIR, 'pyske-' + str(os.getpid()) + '-' +
+                        str(_SHARED['segments']))
+    descriptor = os.open(name, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+    try:
+        os.ftruncate(descriptor, nbytes)
+    finally:
+        os.close(descriptor)
+    return name
+
+
+def _open_segment(name: str) -> mmap.mmap:
+    """Return a mapping of a shared memory segment."""
+    descriptor = os.open(name, os.O_RDWR)
+    try:
+        return mmap.mmap(descriptor, 0, flags=mmap.MAP_SHARED)
+    finally:
+        os.close(descriptor)
+
+
+def _is_shared(nbytes: int) -> bool:
+    """
+    Tell if a concatenation of ``nbytes`` bytes goes through shared memory.
+    All the processors should call this function.
+    """
+    return SHARED_THRESHOLD is not None and parallel.NPROCS >= max(SHARED_NPROCS, 2) and \
+        nbytes >= max(SHARED_THRESHOLD, 1) and len(set(_hosts())) == 1
+
+
+def allgatherv(array: numpy.ndarray, counts: Sequence[int]) -> numpy.ndarray:
+    """
+    Concatenate the arrays of all processors, on all processors.
+
+    If there are at least ``SHARED_NPROCS`` processors, all on the same
+    host, and the concatenation has at least ``SHARED_THRESHOLD`` bytes,
+    the result is a read-only array in shared memory, the same for all
+    the processors.
+
+    :param array: a one-dimensional array
+    :param counts: the size of the array on each processor
+    :return: a new array
+    """
+    counts = numpy.asarray(counts, dtype=numpy.int64)
+    displs = _displacements(counts)
+    size = int(counts.sum())
+    if is_buffer(array.dtype) and _is_shared(size * array.itemsize):
+        return _allgatherv_shared(array, size, int(displs[parallel.PID]))
+    result = numpy.empty(size, dtype=array.dtype)
+    if is_buffer(array.dtype):
+        parallel.COMM.Allgatherv(numpy.ascontiguousarray(array),
+                                 [result, (counts, displs)])
+        return result
+    for (start, received) in zip(displs, parallel.COMM.allgather(array)):
+        result[start:start + len(received)] = received
+    return result
+
+
+def _allgatherv_shared(array: numpy.ndarray, size: int, start: int) -> numpy.ndarray:
+    name = parallel.COMM.bcast(_create_segment(size * array.itemsize)
+                               if parallel.PID == 0 else None, 0)
+    result = numpy.frombuffer(_open_segment(name), dtype=array.dtype, count=size)
+    result[start:start + len(array)] = array
+    # all the processors have mapped the segment and written their part
+    parallel.COMM.barrier()
+    if parallel.PID == 0:
+        os.unlink(name)
+    result.flags.writeable = False
+    return result
+
+
+def gatherv(array: numpy.ndarray, counts: Sequence[int], root: int) -> Optional[numpy.ndarray]:
+    """
+    Concatenate the arrays of all processors, on one processor.
+
+    :param array: a one-dimensional array
+    :param counts: the size of the array on each processor
+    :param root: the processor receiving the concatenation
+    :return: a new array at processor ``root``, None at the other processors
+    """
+    counts = numpy.asarray(counts, dtype=numpy.int64)
+    displs = _displacements(counts)
+    result = numpy.empty(int(counts.sum()), dtype=array.dtype) if parallel.PID == root else None
+    if is_buffer(array.dtype):
+        parallel.COMM.Gatherv(numpy.ascontiguousarray(array),
+                              [result, (counts, displs)] if result is not None else None, root)
+        return result
+    chunks = parallel.COMM.gather(array, root=root)
+    if result is not None:
+        for (start, received) in zip(displs, chunks):
+            result[start:start + len(received)] = received
+    return result
+
+
+def exchange(array: numpy.ndarray, sends: Sequence[Tuple[int, int, int]],
+             receives: Sequence[Tuple[int, int]]) -> numpy.ndarray:
+    """
+    Exchange slices of an array between some of the processors.
+
+    Only non-empty slices are communicated, by point-to-point communications.
+    Slices sent by a processor to itself are copied.
+    The data type of ``array`` should be the same on all processors.
+
+    :param array: a one-dimensional array
+    :param sends: triples ``(pid, start, stop)``: ``array[start:stop]``
+        is sent to processor ``pid``
+    :param receives: pairs ``(pid, count)``: ``count`` elements
+        are received from processor ``pid``
+    :return: a new array: the concatenation of the received slices,
+        in the order of ``receives``
+    """
+    result = numpy.empty(sum(count for (_, count) in receives), dtype=array.dtype)
+    local = {pid: array[start:stop] for (pid, start, stop) in sends}
+    if not is_buffer(array.dtype):
+        received = parallel.exchange(local, [pid for (pid, _) in receives])
+        offset = 0
+        for (pid, count) in receives:
+            result[offset:offset + count] = received[pid]
+            offset += count
+        return result
+    requests = [parallel.COMM.Isend(numpy.ascontiguousarray(chunk), dest=pid, tag=_EXCHANGE_TAG)
+                for (pid, chunk) in local.items() if pid != parallel.PID]
+    offset = 0
+    for (pid, count) in receives:
+        if pid == parallel.PID:
+            result[offset:offset + count] = local[pid]
+        else:
+            requests.append(parallel.COMM.Irecv(result[offset:offset + count],
+                                                source=pid, tag=_EXCHANGE_TAG))
+        offset += count
+    parallel.MPI.Request.Waitall(requests)
+    return result
@@ -0,0 +1,365 @@
+"""
+Internal module providing communications between the processes of one machine
+
+This module is a replacement for ``mpi4py.MPI``, restricted to what
+``pyske.core.support.parallel`` and the other PySke modules use:
+``COMM_WORLD``, ``PROC_NULL``, ``ANY_SOURCE``, ``Request`` and ``Wtime``. It is used when
+a program is launched by ``python -m pyske.run``, or when mpi4py is not
+installed (then with only one processor).
+
+Each process owns a ``multiprocessing`` queue: the messages sent to it,
+pickled when they are sent, are put in its queue. Messages from one
+process to another are received in the order they were sent.
+Collective operations are implemented by point-to-point communications.
+"""
+__all__ = ['COMM_WORLD', 'PROC_NULL', 'ANY_SOURCE', 'Request', 'Message', 'Comm', 'Wtime',
+           'LAUNCHED', 'ENVIRONMENT', 'start']
+
+import collections
+import os
+import pickle
+import queue
+import time
+from typing import Any, Callable, Optional, Sequence, List
+
+PROC_NULL = -1
+
+ANY_SOURCE = -2
+
+# Environment variable set by ``pyske.run`` in the processes it launches,
+# to the identifier of the process and the number of processes: ``rank/size``.
+ENVIRONMENT = 'PYSKE_COMMUNICATOR'
+
+# Tag of the messages of the collective operations.
+# Tags of point-to-point messages are non-negative.
+_COLLECTIVE_TAG = -1
+
+
+def Wtime() -> float:  # pylint: disable=invalid-name
+    """
+    :return: the current time as a floating point number, in seconds.
+    """
+    return time.perf_counter()
+
+
+class Request:
+    """
+    A communication request.
+
+    Sends are buffered: they are completed when they start. A receive is
+    completed when its ``wait`` method is called.
+    """
+
+    def __init__(self, complete: Optional[Callable[[], Any]] = None):
+        self.__complete = complete
+        self.__result = None
+
+    def wait(self) -> Any:
+        """
+        Wait for the completion of the request.
+
+        :return: the received message, None for a send
+        """
+        if self.__complete is not None:
+            self.__result = self.__complete()
+            self.__complete = None
+        return self.__result
+
+    def Wait(self) -> None:  # pylint: disable=invalid-name
+        """Wait for the completion of the request."""
+        self.wait()
+
+    def test(self) -> bool:
+        """
+        :return: True if the request is completed
+        """
+        return self.__complete is None
+
+    def Test(self) -> bool:  # pylint: disable=invalid-name
+        """
+        :return: True if the request is completed
+        """
+        return self.test()
+
+    @staticmethod
+    def waitall(requests: Sequence['Request']) -> List[Any]:
+        """
+        Wait for the completion of requests.
+
+        :param requests: a sequence of requests
+        :return: the list of their results
+        """
+        return [request.wait() for request in requests]
+
+    @staticmethod
+    def Waitall(requests: Sequence['Request']) -> None:  # pylint: disable=invalid-name
+        """
+        Wait for the completion of requests.
+
+        :param requests: a sequence of requests
+        """
+        Request.waitall(requests)
+
+    @staticmethod
+    def Testall(requests: Sequence['Request']) -> bool:  # pylint: disable=invalid-name
+        """
+        :param requests: a sequence of requests
+        :return: True if all the requests are completed
+        """
+        return all(request.test() for request in requests)
+
+
+class Message:
+    """A message that has arrived, but is not received yet."""
+
+    def __init__(self, data: bytes):
+        self.__data = data
+
+    def recv(self) -> Any:
+        """
+        :return: the content of the message
+        """
+        return pickle.loads(self.__data)
+
+
+class Comm:
+    # pylint: disable=invalid-name
+    """
+    A communicator between the processes of one machine.
+
+    The methods have the names and the parameters of their counterparts
+    in ``mpi4py.MPI.Comm``. Lower-case methods communicate Python objects,
+    upper-case methods communicate NumPy arrays, without sending them as
+    raw buffers.
+    """
+
+    def __init__(self, rank: int = 0, size: int = 1):
+        assert 0 <= rank < size
+        self.__rank = rank
+        self.__queues: List[Any] = [queue.SimpleQueue() for _ in range(0, size)]
+        self.__pending = collections.defaultdict(collections.deque)
+
+    def connect(self, queues: Sequence) -> None:
+        """
+        Connect the communicator to the other processes.
+
+        :param queues: the queues of all the processes
+        """
+        assert len(queues) == len(self.__queues)
+        self.__queues = list(queues)
+
+    @property
+    def rank(self) -> int:
+        """The identifier of the current process"""
+        return self.__rank
+
+    @property
+    def size(self) -> int:
+        """The number of processes"""
+        return len(self.__queues)
+
+    def Get_rank(self) -> int:
+        """
+        :return: the identifier of the current process
+        """
+        return self.__rank
+
+    def Get_size(self) -> int:
+        """
+        :return: the number of processes
+        """
+        return len(self.__queues)
+
+    def __arrived(self, source: int, tag: int):
+        if source != ANY_SOURCE:
+            return self.__pending[(source, tag)]
+        for ((_, tg), pending) in self.__pending.items():
+            if tg == tag and pending:
+                return pending
+        return None
+
+    def __receive(self, source: int, tag: int, block: bool = True) -> Optional[bytes]:
+        inbox = self.__queues[self.__rank]
+        pending = self.__arrived(source, tag)
+        while not pending:
+            try:
+                (src, tg, data) = inbox.get(block)
+            except queue.Empty:
+                return None
+            self.__pending[(src, tg)].append(data)
+            pending = self.__arrived(source, tag)
+        return pending.popleft()
+
+    def send(self, obj: Any, dest: int, tag: int = 0) -> None:
+        """
+        Send an object to a process.
+
+        :param obj: the object
+        :param dest: the identifier of the destination process
+        :param tag: the tag of the message
+        """
+        if dest != PROC_NULL:
+            self.__queues[dest].put((self.__rank, tag,
+                                     pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)))
+
+    def recv(self, buf=None, source: int = 0, tag: int = 0) -> Any:
+        # pylint: disable=unused-argument
+        """
+        Receive an object from a process.
+
+        :param buf: ignored
+        :param source: the identifier of the source process, or ANY_SOURCE
+        :param tag: the tag of the message
+        :return: the object
+        """
+        if source == PROC_NULL:
+            return None
+        return pickle.loads(self.__receive(source, tag))
+
+    def isend(self, obj: Any, dest: int, tag: int = 0) -> Request:
+        """
+        Send an object to a process, without waiting.
+
+        :return: a completed request
+        """
+        self.send(obj, dest, tag)
+        return Request()
+
+    def sendrecv(self, sendobj: Any, dest: int, sendtag: int = 0, recvbuf=None,
+                 source: int = 0, recvtag: int = 0) -> Any:
+        # pylint: disable=too-many-arguments, unused-argument
+        """
+        Send an object to a process and receive an object from a process.
+
+        :return: the received object
+        """
+        self.send(sendobj, dest, sendtag)
+        return self.recv(source=source, tag=recvtag)
+
+    def improbe(self, source: int = 0, tag: int = 0) -> Optional[Message]:
+        """
+        Check, without waiting, if a message has arrived.
+
+        :param source: the identifier of the source process
+        :param tag: the tag of the message
+        :return: the message, or None if no message has arrived
+        """
+        data = self.__receive(source, tag, block=False)
+        return None if data is None else Message(data)
+
+    def bcast(self, obj: Any, root: int = 0) -> Any:
+        """
+        Broadcast an object from a process to all processes.
+        """
+        if self.__rank == root:
+            for pid in range(0, self.size):
+                if pid != root:
+                    self.send(obj, pid, _COLLECTIVE_TAG)
+            return obj
+        return self.recv(source=root, tag=_COLLECTIVE_TAG)
+
+    def gather(self, sendobj: Any, root: int = 0) -> Optional[List[Any]]:
+        """
+        Gather the objects of all processes at one process.
+        """
+        if self.__rank != root:
+            self.send(sendobj, root, _COLLECTIVE_TAG)
+            return None
+        return [sendobj if pid == root else self.recv(source=pid, tag=_COLLECTIVE_TAG)
+                for pid in range(0, self.size)]
+
+    def scatter(self, sendobj: Optional[Sequence[Any]], root: int = 0) -> Any:
+        """
+        Send the i-th object of one process to process i.
+        """
+        if self.__rank != root:
+            return self.recv(source=root, tag=_COLLECTIVE_TAG)
+        assert len(sendobj) == self.size
+        for (pid, obj) in enumerate(sendobj):
+            if pid != root:
+                self.send(obj, pid, _COLLECTIVE_TAG)
+        return sendobj[root]
+
+    def allgather(self, sendobj: Any) -> List[Any]:
+        """
+        Gather the objects of all processes at all processes.
+        """
+        return self.alltoall([sendobj] * self.size)
+
+    def alltoall(self, sendobj: Sequence[Any]) -> List[Any]:
+        """
+        Send the i-th object of each process to process i.
+        """
+        assert len(sendobj) == self.size
+        for (pid, obj) in enumerate(sendobj):
+            if pid != self.__rank:
+                self.send(obj, pid, _COLLECTIVE_TAG)
+        return [sendobj[pid] if pid == self.__rank
+                else self.recv(source=pid, tag=_COLLECTIVE_TAG)
+                for pid in range(0, self.size)]
+
+    def barrier(self) -> None:
+        """
+        Wait for all processes.
+        """
+        self.allgather(None)
+
+    def Alltoall(self, sendbuf, recvbuf) -> None:
+        """
+        Send the i-th element of the array of each process to process i.
+        """
+        recvbuf[:] = self.alltoall(list(sendbuf))
+
+    def Allgatherv(self, sendbuf, recvbuf) -> None:
+        """
+        Concatenate the arrays of all processes, at all processes.
+        ``recvbuf`` is ``[array, (counts, displacements)]``.
+        """
+        self.__store(self.allgather(sendbuf), recvbuf)
+
+    def Gatherv(self, sendbuf, recvbuf, root: int = 0) -> None:
+        """
+        Concatenate the arrays of all processes, at one process.
+        At ``root``, ``recvbuf`` is ``[array, (counts, displacements)]``.
+        """
+        received = self.gather(sendbuf, root)
+        if received is not None:
+            self.__store(received, recvbuf)
+
+    @staticmethod
+    def __store(arrays, recvbuf) -> None:
+        (result, (_, displs)) = recvbuf
+        for (start, array) in zip(displs, arrays):
+            result[start:start + len(array)] = array
+
+    def Isend(self, buf, dest: int, tag: int = 0) -> Request:
+        """
+        Send an array to a process, without waiting.
+
+        :return: a completed request
+        """
+        return self.isend(buf, dest, tag)
+
+    def Irecv(self, buf, source: int = 0, tag: int = 0) -> Request:
+        """
+        Receive an array from a process, in a given array.
+
+        :return: a request, completed when the array is received
+        """
+        def complete():
+            buf[:] = self.recv(source=source, tag=tag)
+        return Request(complete)
+
+
+LAUNCHED = ENVIRONMENT in os.environ
+
+COMM_WORLD = Comm(*map(int, os.environ[ENVIRONMENT].split('/'))) if LAUNCHED else Comm()
+
+
+def start(queues: Sequence) -> None:
+    """
+    Connect ``COMM_WORLD`` to the other processes launched by ``pyske.run``.
+
+    :param queues: the queues of all the processes
+    """
+    COMM_WORLD.connect(queues)
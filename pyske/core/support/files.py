@@ -0,0 +1,201 @@
+"""
+Supporting functions to read parts of files.
+"""
+__all__ = ['read_lines', 'read_records', 'number_of_records',
+           'Records', 'write_header', 'read_header', 'write_records', 'map_records']
+
+import mmap
+import os
+import struct
+from typing import List, Any, Iterator, Sequence, Tuple
+
+
+def _decode(line: bytes, encoding: str) -> str:
+    if line.endswith(b'\n'):
+        line = line[:-1]
+        if line.endswith(b'\r'):
+            line = line[:-1]
+    return line.decode(encoding)
+
+
+def read_lines(filename: str, start: int, stop: int, encoding: str = 'utf-8') -> List[str]:
+    """
+    Read the lines of a text file that start in a byte range.
+
+    A line belongs to the range that contains its first byte: if a file
+    is split into consecutive byte ranges, each line is read exactly once.
+    The line terminators are removed.
+
+    :param filename: the name of a text file
+    :param start: the first byte of the range
+    :param stop: the byte after the last byte of the range
+    :param encoding: the encoding of the file
+    :return: a list of lines
+    """
+    lines = []
+    with open(filename, 'rb') as file:
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        while position < stop:
+            line = file.readline()
+            if not line:
+                break
+            lines.append(_decode(line, encoding))
+            position += len(line)
+    return lines
+
+
+def number_of_records(filename: str, fmt: str) -> int:
+    """
+    Return the number of fixed-size records of a binary file.
+
+    :param filename: the name of a binary file
+    :param fmt: the format of a record, as in module ``struct``
+    :return: the number of records
+    """
+    size = os.path.getsize(filename)
+    record_size = struct.calcsize(fmt)
+    assert size % record_size == 0
+    return size // record_size
+
+
+def read_records(filename: str, fmt: str, start: int, stop: int) -> List[Any]:
+    """
+    Read a range of the fixed-size records of a binary file.
+
+    :param filename: the name of a binary file
+    :param fmt: the format of a record, as in module ``struct``
+    :param start: the index of the first record
+    :param stop: the index after the index of the last record
+    :return: a list of records. A record with one field is represented
+        by the value of this field, a record with several fields by a tuple.
+    """
+    record = struct.Struct(fmt)
+    with open(filename, 'rb') as file:
+        file.seek(start * record.size)
+        data = file.read((stop - start) * record.size)
+    assert len(data) == (stop - start) * record.size
+    if len(record.unpack(bytes(record.size))) == 1:
+        return [fields[0] for fields in record.iter_unpack(data)]
+    return list(record.iter_unpack(data))
+
+
+class Records:
+    """
+    A read-only sequence of fixed-size records stored in a buffer.
+
+    Records are unpacked only when they are accessed: iterating over the
+    records of a memory-mapped file reads the file without copying it first.
+    A record with one field is represented by the value of this field,
+    a record with several fields by a tuple.
+    """
+
+    def __init__(self, buffer, fmt: str, start: int = 0, stop: int = None):
+        self.__record = struct.Struct(fmt)
+        self.__single = len(self.__record.unpack(bytes(self.__record.size))) == 1
+        if stop is None:
+            stop = len(buffer) // self.__record.size
+        self.__buffer = memoryview(buffer)[start * self.__record.size:
+                                           stop * self.__record.size]
+
+    def __len__(self) -> int:
+        return len(self.__buffer) // self.__record.size
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.__single:
+            return (fields[0] for fields in self.__record.iter_unpack(self.__buffer))
+        return self.__record.iter_unpack(self.__buffer)
+
+    def __getitem__(self, index: int) -> Any:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        fields = self.__record.unpack_from(self.__buffer, (index % len(self)) * self.__record.size)
+        return fields[0] if self.__single else fields
+
+
+# Header of the files written by ``write_header``: magic number, offset of the records,
+# number of records, number of processors, length of the record format.
+# It is followed by the number of records of each processor and the record format.
+_MAGIC = b'PYSKE\x00L\x01'
+_HEADER = struct.Struct('<8sQQQQ')
+_ALIGNMENT = 64
+
+
+def write_header(filename: str, fmt: str, distribution: Sequence[int]) -> int:
+    """
+    Create a file of records, with a header describing its content.
+
+    The file is created with its final size: the records can then be
+    written at their place by different processors.
+
+    :param filename: the name of the file
+    :param fmt: the format of a record, as in module ``struct``
+    :param distribution: the number of records of each processor
+    :return: the offset of the first record in the file
+    """
+    encoded = fmt.encode()
+    header_size = _HEADER.size + 8 * len(distribution) + len(encoded)
+    offset = -(-header_size // _ALIGNMENT) * _ALIGNMENT
+    size = sum(distribution)
+    with open(filename, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, offset, size, len(distribution), len(encoded)))
+        file.write(struct.pack('<' + str(len(distribution)) + 'Q', *distribution))
+        file.write(encoded)
+        file.truncate(offset + size * struct.calcsize(fmt))
+    return offset
+
+
+def read_header(filename: str) -> Tuple[str, List[int], int]:
+    """
+    Read the header of a file created by ``write_header``.
+
+    :param filename: the name of the file
+    :return: a triple: format of a record, number of records
+        of each processor, offset of the first record
+    """
+    with open(filename, 'rb') as file:
+        magic, offset, size, nprocs, fmt_size = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(filename + " is not a PySke list file")
+        distribution = list(struct.unpack('<' + str(nprocs) + 'Q', file.read(8 * nprocs)))
+        fmt = file.read(fmt_size).decode()
+    assert sum(distribution) == size
+    return fmt, distribution, offset
+
+
+def write_records(filename: str, fmt: str, offset: int, start: int, values: Sequence) -> None:
+    """
+    Write records at their place in an existing file.
+
+    :param filename: the name of the file
+    :param fmt: the format of a record, as in module ``struct``
+    :param offset: the offset of the first record of the file
+    :param start: the index of the first record to write
+    :param values: the records. A record with one field can be represented
+        by the value of this field.
+    """
+    record = struct.Struct(fmt)
+    with open(filename, 'r+b') as file:
+        file.seek(offset + start * record.size)
+        file.write(b"".join(record.pack(*value) if isinstance(value, tuple)
+                            else record.pack(value) for value in values))
+
+
+def map_records(filename: str, fmt: str, offset: int, start: int, stop: int) -> Records:
+    """
+    Map a range of the records of a file in memory.
+
+    :param filename: the name of the file
+    :param fmt: the format of a record, as in module ``struct``
+    :param offset: the offset of the first record of the file
+    :param start: the index of the first record of the range
+    :param stop: the index after the index of the last record of the range
+    :return: the records, read from the file when they are accessed
+    """
+    if start == stop:
+        return Records(b"", fmt)
+    with open(filename, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Records(memoryview(mapped)[offset:], fmt, start, stop)
@@ -48,7 +48,7 @@ def union(inter1, inter2):
 
 def is_valid_intersection(inter1, inter2):
     """Test if intersect of two intervals is possible."""
-    return upper(inter1) >= lower(inter2) or upper(inter2) >= lower(inter1)
+    return upper(inter1) >= lower(inter2) and upper(inter2) >= lower(inter1)
 
 
 def intersection(inter1, inter2):
@@ -1,10 +1,27 @@
 """
 Internal module providing basic parallel functions
+
+The communications use mpi4py, except for the programs launched by
+``python -m pyske.run``, or if mpi4py is not installed: then ``MPI`` is the
+module ``pyske.core.support.communicator``, that provides the same operations
+between the processes of one machine.
 """
-__all__ = ['COMM', 'PID', 'NPROCS', 'local_size', 'scan']
+__all__ = ['MPI', 'COMM', 'PID', 'NPROCS', 'local_size', 'scan', 'reduce', 'exchange',
+           'route', 'scatter_stream', 'deal_stream', 'Future']
+
+import collections
+import itertools
+from typing import Callable, TypeVar, Tuple, Optional, Dict, Iterable, Sequence, List, \
+    Generic, Any
+from pyske.core.support import communicator
 
-from typing import Callable, TypeVar, Tuple
-from mpi4py import MPI
+if communicator.LAUNCHED:
+    MPI = communicator
+else:
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        MPI = communicator
 
 T = TypeVar('T')    # pylint: disable=invalid-name
 
@@ -12,6 +29,26 @@ COMM = MPI.COMM_WORLD  # pylint: disable=c-extension-no-member
 PID = COMM.Get_rank()
 NPROCS = COMM.Get_size()
 
+_REDUCE_TAG = 1
+_EXCHANGE_TAG = 2
+_STREAM_TAG = 4
+
+# Number of elements sent in one message by the streaming functions.
+BLOCK_SIZE = 4096
+
+# Maximal number of messages in flight from the root of the streaming functions.
+_STREAM_WINDOW = 2
+
+# Each future uses its own tag, taken in a range starting at _FUTURE_TAG.
+_FUTURE_TAG = 16
+_FUTURE_TAGS = 4096
+_FUTURES = [0]
+
+# Each routing uses its own tag, taken in a range starting at _ROUTE_TAG.
+_ROUTE_TAG = _FUTURE_TAG + _FUTURE_TAGS
+_ROUTE_TAGS = 4096
+_ROUTES = [0]
+
 
 def local_size(pid: int, size: int) -> int:
     """
@@ -27,17 +64,305 @@ def local_size(pid: int, size: int) -> int:
 
 def scan(binary_op: Callable[[T, T], T], value: T) -> Tuple[T, T]:
     """
-    :param binary_op: a binary operation
+    The prefix is computed by recursive doubling: at each of the
+    ceil(log2(NPROCS)) steps, each processor sends its accumulated
+    value to the processor ``distance`` ranks above it. The operation
+    only needs to be associative: values are always combined
+    from left to right.
+
+    :param binary_op: a binary associative operation
     :param value: each processor possess such a value
-    :return: prefix sum
-    """
-    values = COMM.alltoall([value for _ in range(0, NPROCS)])
-    pre = values[0]
-    for i in range(1, PID):
-        pre = binary_op(pre, values[i])
-    res = values[PID]
-    for i in range(PID + 1, NPROCS):
-        res = binary_op(res, values[i])
-    if PID != 0:
-        return pre, binary_op(pre, res)
-    return pre, res
+    :return: a pair containing the combination of the values of the processors
+        strictly before the current one (at processor 0, its own value),
+        and the combination of all the values.
+    """
+    pre = value
+    acc = value
+    distance = 1
+    while distance < NPROCS:
+        dest = PID + distance if PID + distance < NPROCS else MPI.PROC_NULL
+        source = PID - distance if PID - distance >= 0 else MPI.PROC_NULL
+        received = COMM.sendrecv(acc, dest=dest, source=source)
+        if source != MPI.PROC_NULL:
+            pre = received if distance == 1 else binary_op(received, pre)
+            acc = binary_op(received, acc)
+        distance *= 2
+    return pre, COMM.bcast(acc, NPROCS - 1)
+
+
+def reduce(binary_op: Callable[[T, T], T], value: Optional[T],
+           root: Optional[int] = None) -> Optional[T]:
+    """
+    The reduction is computed along a binomial tree rooted at processor 0:
+    at each of the ceil(log2(NPROCS)) steps, half of the remaining processors
+    send their accumulated value to a processor of lower rank. Each processor
+    receives at most one value per step. The operation only needs to be
+    associative: values are always combined from left to right.
+
+    :param binary_op: a binary associative operation
+    :param value: each processor possess such a value. ``None`` stands for
+        the absence of value: it is not passed to the binary operation.
+    :param root: (optional) if omitted, the result is returned at all the
+        processors. Otherwise it is returned only at processor ``root``,
+        and ``None`` is returned at the other processors.
+    :return: the combination of all the values
+    """
+    assert root is None or 0 <= root < NPROCS
+    acc = value
+    distance = 1
+    while distance < NPROCS:
+        if PID % (2 * distance) != 0:
+            COMM.send(acc, dest=PID - distance, tag=_REDUCE_TAG)
+            break
+        if PID + distance < NPROCS:
+            received = COMM.recv(source=PID + distance, tag=_REDUCE_TAG)
+            if acc is None:
+                acc = received
+            elif received is not None:
+                acc = binary_op(acc, received)
+        distance *= 2
+    if root is None:
+        return COMM.bcast(acc, 0)
+    if root != 0:
+        if PID == 0:
+            COMM.send(acc, dest=root, tag=_REDUCE_TAG)
+        elif PID == root:
+            acc = COMM.recv(source=0, tag=_REDUCE_TAG)
+    return acc if PID == root else None
+
+
+def exchange(messages: Dict[int, T], sources: Iterable[int]) -> Dict[int, T]:
+    """
+    Sparse exchange of messages between processors.
+
+    Only the given messages are communicated, by point-to-point
+    communications. The message of a processor to itself is not communicated.
+    All the processors should call this function, and each processor
+    in ``sources`` should have a message for the current processor.
+
+    :param messages: a dictionary from the identifiers of the destination
+        processors to the messages to send them
+    :param sources: the identifiers of the processors to receive a message from
+    :return: a dictionary from the identifiers of the source processors
+        to the received messages
+    """
+    requests = [COMM.isend(message, dest=pid, tag=_EXCHANGE_TAG)
+                for (pid, message) in messages.items() if pid != PID]
+    received = {pid: messages[PID] if pid == PID else COMM.recv(source=pid, tag=_EXCHANGE_TAG)
+                for pid in sources}
+    MPI.Request.waitall(requests)
+    return received
+
+
+def route(messages: Dict[int, List[T]], count: int) -> List[T]:
+    """
+    Sparse exchange of elements between processors that do not know
+    where their elements come from.
+
+    Each processor only sends its non-empty lists of elements, by
+    point-to-point communications, and receives lists from any processor
+    until it has ``count`` elements: no processor communicates with the
+    processors it does not exchange elements with. The list of a processor
+    to itself is not communicated.
+    All the processors should call this function.
+
+    :param messages: a dictionary from the identifiers of the destination
+        processors to the lists of elements to send them
+    :param count: the number of elements the current processor receives,
+        including the ones it sends to itself
+    :return: the received elements, in an unspecified order of their lists
+    """
+    tag = _ROUTE_TAG + _ROUTES[0] % _ROUTE_TAGS
+    _ROUTES[0] += 1
+    requests = [COMM.isend(message, dest=pid, tag=tag)
+                for (pid, message) in messages.items() if pid != PID and message]
+    received = list(messages.get(PID, ()))
+    while len(received) < count:
+        received.extend(COMM.recv(source=MPI.ANY_SOURCE, tag=tag))
+    MPI.Request.waitall(requests)
+    return received
+
+
+class _Window:
+    """Non-blocking sends, with a bounded number of messages in flight."""
+
+    def __init__(self):
+        self.__requests = collections.deque()
+
+    def send(self, message, dest: int) -> None:
+        """Send a message, after waiting for old messages if too many are in flight."""
+        self.__requests.append(COMM.isend(message, dest=dest, tag=_STREAM_TAG))
+        if len(self.__requests) > _STREAM_WINDOW:
+            self.__requests.popleft().wait()
+
+    def wait(self) -> None:
+        """Wait for all the messages to be sent."""
+        MPI.Request.waitall(list(self.__requests))
+        self.__requests.clear()
+
+
+def scatter_stream(values: Optional[Iterable[T]], counts: Sequence[int],
+                   root: int = 0, block_size: int = BLOCK_SIZE) -> List[T]:
+    """
+    Scatter values from a processor, by blocks.
+
+    Processor ``root`` sends the first ``counts[0]`` values to processor 0,
+    the next ``counts[1]`` values to processor 1, etc. The values are read
+    and sent by blocks of at most ``block_size`` values, with a bounded number
+    of blocks in flight: besides its own share, the root only holds a window
+    of the values.
+
+    :param values: at processor ``root``, an iterable containing at least
+        ``sum(counts)`` values. Ignored at the other processors.
+    :param counts: the number of values for each processor,
+        the same on all the processors
+    :param root: the processor that holds the values
+    :param block_size: the maximal number of values in a message
+    :return: the values of the current processor
+    """
+    assert block_size > 0
+    if PID != root:
+        local = []
+        for _ in range(0, -(-counts[PID] // block_size)):
+            local.extend(COMM.recv(source=root, tag=_STREAM_TAG))
+        return local
+    values = iter(values)
+    window = _Window()
+    local = []
+    for (pid, count) in enumerate(counts):
+        if pid == root:
+            local = list(itertools.islice(values, count))
+            assert len(local) == count
+            continue
+        while count > 0:
+            block = list(itertools.islice(values, min(count, block_size)))
+            assert len(block) == min(count, block_size)
+            window.send(block, pid)
+            count -= len(block)
+    window.wait()
+    return local
+
+
+def deal_stream(values: Optional[Iterable[T]], root: int = 0,
+                block_size: int = BLOCK_SIZE) -> Tuple[List[Tuple[int, List[T]]], int]:
+    """
+    Deal values of unknown number from a processor, by blocks.
+
+    Processor ``root`` reads the values by blocks of ``block_size`` values
+    and deals the blocks to the processors in a round-robin way, with
+    a bounded number of blocks in flight: the root only holds its own blocks
+    and a window of the values.
+
+    :param values: at processor ``root``, an iterable. Ignored at the other processors.
+    :param root: the processor that holds the values
+    :param block_size: the number of values in a block
+    :return: a pair containing the list of blocks received by the current
+        processor, each block being a pair (index of its first value, values),
+        and the total number of values
+    """
+    assert block_size > 0
+    if PID != root:
+        blocks = []
+        while True:
+            (start, block) = COMM.recv(source=root, tag=_STREAM_TAG)
+            if block is None:
+                return blocks, start
+            blocks.append((start, block))
+    values = iter(values)
+    window = _Window()
+    blocks = []
+    size = 0
+    for pid in itertools.cycle(range(0, NPROCS)):
+        block = list(itertools.islice(values, block_size))
+        if not block:
+            break
+        if pid == root:
+            blocks.append((size, block))
+        else:
+            window.send((size, block), pid)
+        size += len(block)
+    for pid in range(0, NPROCS):
+        if pid != root:
+            window.send((size, None), pid)
+    window.wait()
+    return blocks, size
+
+
+class Future(Generic[T]):
+    """
+    The result of a non-blocking exchange of messages.
+
+    The messages are sent, without waiting, when the future is created.
+    They are received by ``done``, which does not block, or ``result``,
+    which waits for the end of the exchange. Local computations can thus
+    be performed while the messages are in transit. Once computed, the result
+    can itself be sent, without waiting, to other processors.
+
+    Futures should be created by all the processors, in the same order.
+    """
+
+    def __init__(self, messages: Dict[int, Any], sources: Iterable[int],
+                 complete: Callable[[Dict[int, Any]], T], forward: Iterable[int] = ()):
+        """
+        :param messages: a dictionary from the identifiers of the destination
+            processors to the messages to send them
+        :param sources: the identifiers of the processors to receive a message from
+        :param complete: a function computing the result
+            from the dictionary of the received messages
+        :param forward: (optional) the identifiers of the processors the result
+            is sent to, without waiting, once it is computed
+        """
+        self.__tag = _FUTURE_TAG + _FUTURES[0] % _FUTURE_TAGS
+        _FUTURES[0] += 1
+        self.__requests = [COMM.isend(message, dest=pid, tag=self.__tag)
+                           for (pid, message) in messages.items() if pid != PID]
+        self.__pending = []
+        self.__received = {}
+        for pid in sources:
+            if pid == PID:
+                self.__received[pid] = messages[PID]
+            else:
+                self.__pending.append(pid)
+        self.__complete = complete
+        self.__forward = [pid for pid in forward if pid != PID]
+        self.__done = False
+        self.__result = None
+
+    def done(self) -> bool:
+        """
+        Receive the messages that have arrived, without blocking.
+
+        :return: True if the result is available
+        """
+        if not self.__done:
+            for pid in list(self.__pending):
+                message = COMM.improbe(source=pid, tag=self.__tag)
+                if message is not None:
+                    self.__received[pid] = message.recv()
+                    self.__pending.remove(pid)
+            if not self.__pending:
+                self.__compute()
+                self.__done = MPI.Request.Testall(self.__requests)
+        return self.__done
+
+    def result(self) -> T:
+        """
+        Wait for the end of the exchange.
+
+        :return: the result
+        """
+        if not self.__done:
+            for pid in self.__pending:
+                self.__received[pid] = COMM.recv(source=pid, tag=self.__tag)
+            self.__pending = []
+            self.__compute()
+            MPI.Request.Waitall(self.__requests)
+            self.__done = True
+        return self.__result
+
+    def __compute(self) -> None:
+        if self.__received is not None:
+            self.__result = self.__complete(self.__received)
+            self.__received = None
+            self.__requests.extend(COMM.isend(self.__result, dest=pid, tag=self.__tag)
+                                   for pid in self.__forward)
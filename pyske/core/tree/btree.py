@@ -92,6 +92,64 @@ class BTree(ABC):
         pass
 
 
+def _postorder(tree):
+    """Return the subtrees of a tree in post-order, computed with an explicit stack
+    """
+    order = []
+    stack = [tree]
+    while stack:
+        current = stack.pop()
+        order.append(current)
+        if current.__class__ is Node:
+            stack.append(current.left)
+            stack.append(current.right)
+    order.reverse()
+    return order
+
+
+def _postorder_down(tree, gl, gr, c):
+    """Return the subtrees of a tree in post-order, and their downward accumulations
+    """
+    order = []
+    accs = []
+    stack = [(tree, c)]
+    while stack:
+        (current, acc) = stack.pop()
+        order.append(current)
+        accs.append(acc)
+        if current.__class__ is Node:
+            stack.append((current.left, gl(acc, current.value)))
+            stack.append((current.right, gr(acc, current.value)))
+    order.reverse()
+    accs.reverse()
+    return order, accs
+
+
+def _postorder_zip(tree, other):
+    """Return the subtrees of two trees of the same shape in post-order
+    """
+    order = []
+    others = []
+    stack = [(tree, other)]
+    while stack:
+        (current, twin) = stack.pop()
+        order.append(current)
+        others.append(twin)
+        if current.__class__ is Node:
+            assert twin.is_node(), "A node can only be zipped with another node"
+            stack.append((current.left, twin.left))
+            stack.append((current.right, twin.right))
+        else:
+            assert twin.is_leaf(), "A leaf can only be zipped with another leaf"
+    order.reverse()
+    others.reverse()
+    return order, others
+
+
+def _continue(result, tail_recursive, acc):
+    return acc(result) if tail_recursive else result
+
+
 class Leaf(BTree):
     """A class that overrides BTree used to represent a Leaf
 
@@ -173,7 +231,7 @@ class Leaf(BTree):
         kn : callable
             A function to apply to every node values of the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -192,7 +250,7 @@ class Leaf(BTree):
         kn : callable
             The function to apply to every node subtrees of the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -210,7 +268,7 @@ class Leaf(BTree):
         k : callable
             The function used to reduce a BTree into a single value
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -228,7 +286,7 @@ class Leaf(BTree):
         k : callable
             The function used to reduce a BTree into a single value
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -248,7 +306,7 @@ class Leaf(BTree):
         c :
             Accumulator for the downward computation
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -268,7 +326,7 @@ class Leaf(BTree):
         t : :obj:`BTree`
             The BTree to zip with the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -291,7 +349,7 @@ class Leaf(BTree):
         f : callable
             A function to zip values
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -308,7 +366,7 @@ class Leaf(BTree):
         c
             The default value for elements that doesn't have left children
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -324,7 +382,7 @@ class Leaf(BTree):
         c
             The default value for elements that doesn't have right children
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
@@ -336,6 +394,10 @@ class Leaf(BTree):
 class Node(BTree):
     """A class that overrides BTree used to represent a Node
 
+    The skeletons traverse the tree with an explicit stack instead of
+    recursive calls: they are not limited by the recursion limit of Python,
+    and are applicable to ill-balanced trees.
+
     ...
 
     Attributes
@@ -387,13 +449,36 @@ class Node(BTree):
         self.size = 1 + left.size + right.size
 
     def __str__(self):
-        return "node " + str(self.value) + " (" + str(self.left) + ") (" + str(self.right) + ")"
+        # The fragments of the string are produced in order, and joined once
+        fragments = []
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            if current.__class__ is str:
+                fragments.append(current)
+            elif current.__class__ is Node:
+                fragments.append("node " + str(current.value) + " (")
+                stack.append(")")
+                stack.append(current.right)
+                stack.append(") (")
+                stack.append(current.left)
+            else:
+                fragments.append(str(current))
+        return "".join(fragments)
 
     def __eq__(self, other):
-        if isinstance(other, Node):
-            return (self.get_value() == other.get_value()) and \
-                   (self.get_left() == other.get_left()) and (self.get_right() == other.get_right())
-        return False
+        stack = [(self, other)]
+        while stack:
+            (current, twin) = stack.pop()
+            if not isinstance(current, Node):
+                if not current == twin:
+                    return False
+            elif not isinstance(twin, Node) or not current.value == twin.value:
+                return False
+            else:
+                stack.append((current.right, twin.right))
+                stack.append((current.left, twin.left))
+        return True
 
     def is_node(self):
         """Indicates if the BTree is a node
@@ -435,18 +520,18 @@ class Node(BTree):
         kn : callable
             A function to apply to every node values of the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-               .map(kl, kn, lambda lm: self.get_right()
-                    .map(kl, kn, lambda rm: acc(Node(kn(self.get_value()), lm, rm))))
-        new_val = kn(self.get_value())
-        left = self.get_left().map(kl, kn)
-        right = self.get_right().map(kl, kn)
-        return Node(new_val, left, right)
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(kn(current.value), results.pop(), right))
+            else:
+                results.append(Leaf(kl(current.value)))
+        return _continue(results[0], tail_recursive, acc)
 
     def mapt(self, kl, kn, tail_recursive=False, acc=lambda x: x):
         """Applies kl to every leaf values the current instance, and kn to every subtrees that are
@@ -459,41 +544,42 @@ class Node(BTree):
         kn : callable
             The function to apply to every node subtrees of the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-               .mapt(kl, kn, lambda lm: self.get_right()
-                     .mapt(kl, kn, lambda rm: acc(Node(kn(self.get_value(), self.get_left(),
-                                                          self.get_right()), lm, rm))))
-        new_val = kn(self.get_value(), self.get_left(), self.get_right())
-        left = self.get_left().mapt(kl, kn)
-        right = self.get_right().mapt(kl, kn)
-        return Node(new_val, left, right)
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(kn(current.value, current.left, current.right),
+                                    results.pop(), right))
+            else:
+                results.append(Leaf(kl(current.value)))
+        return _continue(results[0], tail_recursive, acc)
 
     def reduce(self, k, tail_recursive=False, acc=lambda x: x):
         """Reduces a BTree into a single value using a function k
 
-        We use recursive calls of sub-reduction to make a total reduction.
+        The values are reduced bottom-up, in one traversal of the tree.
 
         Parameters
         ----------
         k : callable
             The function used to reduce a BTree into a single value
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-                .reduce(k, lambda lm: self.get_right()
-                        .reduce(k, lambda rm: acc(k(lm, self.get_value(), rm))))
-        left = self.get_left().reduce(k)
-        right = self.get_right().reduce(k)
-        return k(left, self.get_value(), right)
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(k(results.pop(), current.value, right))
+            else:
+                results.append(current.value)
+        return _continue(results[0], tail_recursive, acc)
 
     def uacc(self, k, tail_recursive=False, acc=lambda x: x):
         """Makes an upward accumulation of the values in the current instance using a function k
@@ -506,17 +592,19 @@ class Node(BTree):
         k : callable
             The function used to reduce a BTree into a single value
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-               .uacc(k, lambda lm: self.get_right()
-                     .uacc(k, lambda rm: acc(Node(k(lm.get_value(), self.get_value(),
-                                                    rm.get_value()), lm, rm))))
-        r = self.reduce(k)
-        return Node(r, self.get_left().uacc(k), self.get_right().uacc(k))
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(k(results[-1].value, current.value, right.value),
+                                    results.pop(), right))
+            else:
+                results.append(Leaf(current.value))
+        return _continue(results[0], tail_recursive, acc)
 
     def dacc(self, gl, gr, c, tail_recursive=False, acc=lambda x: x):
         """Makes an downward accumulation of the values in a BTree using gl, gr and c
@@ -530,18 +618,18 @@ class Node(BTree):
         c
             Accumulator for the downward computation
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-                .dacc(gl, gr, gl(c, self.get_value()), lambda lm: self.get_right()
-                      .dacc(gl, gr, gr(c, self.get_value()), lambda rm: acc(Node(c, lm, rm))))
-        b = self.get_value()
-        left = self.get_left().dacc(gl, gr, gl(c, b))
-        right = self.get_right().dacc(gl, gr, gr(c, b))
-        return Node(c, left, right)
+        results = []
+        for (current, down) in zip(*_postorder_down(self, gl, gr, c)):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(down, results.pop(), right))
+            else:
+                results.append(Leaf(down))
+        return _continue(results[0], tail_recursive, acc)
 
     def zip(self, t, tail_recursive=False, acc=lambda x: x):
         """Zip the values contained in t with the ones in the current instance
@@ -555,20 +643,19 @@ class Node(BTree):
         t : :obj:`BTree`
             The BTree to zip with the current instance
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
         assert t.is_node(), "A node can only be zipped with another node"
-        if tail_recursive:
-            return self.get_left()\
-                .zip(t.get_left(), lambda lm: self.get_right()
-                     .zip(t.get_right(), lambda rm: acc(Node((self.get_value(),
-                                                              t.get_value()), lm, rm))))
-        v = (self.get_value(), t.get_value())
-        left = self.get_left().zip(t.get_left())
-        right = self.get_right().zip(t.get_right())
-        return Node(v, left, right)
+        results = []
+        for (current, other) in zip(*_postorder_zip(self, t)):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node((current.value, other.value), results.pop(), right))
+            else:
+                results.append(Leaf((current.value, other.value)))
+        return _continue(results[0], tail_recursive, acc)
 
     def map2(self, f, t, tail_recursive=False, acc=lambda x: x):
         """Zip the values contained in a tree with the ones in the current instance using a function
@@ -584,20 +671,19 @@ class Node(BTree):
         f : callable
             A function to zip values
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
         assert t.is_node(), "A node can only be zipped with another node"
-        if tail_recursive:
-            return self.get_left()\
-                .map2(f, t.get_left(), lambda lm: self.get_right()
-                      .map2(f, t.get_right(), lambda rm: acc(Node(f(self.get_value(),
-                                                                    t.get_value()), lm, rm))))
-        v = f(self.get_value(), t.get_value())
-        left = self.get_left().map2(f, t.get_left())
-        right = self.get_right().map2(f, t.get_right())
-        return Node(v, left, right)
+        results = []
+        for (current, other) in zip(*_postorder_zip(self, t)):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(f(current.value, other.value), results.pop(), right))
+            else:
+                results.append(Leaf(f(current.value, other.value)))
+        return _continue(results[0], tail_recursive, acc)
 
     def getchl(self, c, tail_recursive=False, acc=lambda x: x):
         """Shift all the values contained in the current instance by the left
@@ -607,18 +693,18 @@ class Node(BTree):
         c
             The default value for elements that doesn't have left children
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-                .getchl(c, lambda lm: self.get_right()
-                        .getchl(c, lambda rm: acc(Node(self.get_left().get_value(), lm, rm))))
-        v = self.get_left().get_value()
-        left = self.get_left().getchl(c)
-        right = self.get_right().getchl(c)
-        return Node(v, left, right)
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(current.left.value, results.pop(), right))
+            else:
+                results.append(Leaf(c))
+        return _continue(results[0], tail_recursive, acc)
 
     def getchr(self, c, tail_recursive=False, acc=lambda x: x):
         """Shift all the values contained in the current instance by the right
@@ -628,15 +714,15 @@ class Node(BTree):
         c
             The default value for elements that doesn't have right children
         tail_recursive: bool
-            Indicates if the call should be tail recursive
+            Indicates if the result should be passed to the continuation
         acc: callable
             Continuation
         """
-        if tail_recursive:
-            return self.get_left()\
-                .getchr(c, lambda lm: self.get_right()
-                        .getchr(c, lambda rm: acc(Node(self.get_right().get_value(), lm, rm))))
-        v = self.get_right().get_value()
-        left = self.get_left().getchr(c)
-        right = self.get_right().getchr(c)
-        return Node(v, left, right)
+        results = []
+        for current in _postorder(self):
+            if current.__class__ is Node:
+                right = results.pop()
+                results.append(Node(current.right.value, results.pop(), right))
+            else:
+                results.append(Leaf(c))
+        return _continue(results[0], tail_recursive, acc)
@@ -0,0 +1,342 @@
+"""
+CBTree Module
+"""
+from array import array
+
+from pyske.core.support.errors import EmptyError, IllFormedError, NotSameTagError
+from pyske.core.tree.btree import Leaf, Node
+from pyske.core.tree.ltree import LTree, Segment, TAG_LEAF, TAG_NODE, TAG_CRITICAL
+
+# Index of the right child of a leaf
+NO_CHILD = -1
+
+
+class CBTree:
+    """A class used to represent a compact Binary Tree
+
+    The elements of the tree are stored in preorder in parallel arrays:
+    their values, their tags (TAG_LEAF or TAG_NODE), and for nodes the index
+    of their right child (the left child of the node at index i is at index i + 1).
+    There is no object per element, and the skeletons are loops over the arrays.
+    The tags and the indices are never modified: the trees built by the skeletons
+    share them with the current instance.
+
+    ...
+
+    Attributes
+    ----------
+    values : list
+        The values of the elements, in preorder
+    tags : bytes
+        The tags of the elements, in preorder
+    rights : :obj:`array`
+        The indices of the right children of the elements, NO_CHILD for leaves
+
+    Methods
+    -------
+    init_from_bt(bt)
+        Create a CBTree from a BTree
+    init_from_lt(lt)
+        Create a CBTree from a LTree
+    to_bt()
+        Get the BTree representing the current instance
+    to_lt(m)
+        Get the LTree representing the current instance
+    map(kl, kn)
+        Applies functions to every leaf and to every node values
+    reduce(k)
+        Reduces the current instance into a single value using a function k
+    uacc(k)
+        Makes an upward accumulation of the values in the current instance using a function k
+    dacc(gl, gr, c)
+        Makes an downward accumulation of the values in the current instance using gl, gr and c
+    zip(t)
+        Zip the values contained in t with the ones in the current instance
+    map2(f, t)
+        Zip the values contained in a tree with the ones in the current instance using a function
+    """
+
+    def __init__(self, values, tags, rights):
+        assert len(values) == len(tags) == len(rights), "The arrays have not the same length"
+        if not values:
+            raise EmptyError("A CBTree cannot be empty")
+        self.values = values
+        self.tags = tags
+        self.rights = rights
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def size(self):
+        """The number of elements in the current instance"""
+        return len(self.values)
+
+    def __eq__(self, other):
+        if isinstance(other, CBTree):
+            return self.tags == other.tags and self.values == other.values
+        return False
+
+    def __str__(self):
+        return str(self.to_bt())
+
+    def __same_shape(self, other):
+        if self.tags is not other.tags and self.tags != other.tags:
+            raise NotSameTagError("Two zipped values have not the same tag")
+
+    def __with_values(self, values):
+        return CBTree(values, self.tags, self.rights)
+
+    @staticmethod
+    def __rights(tags):
+        rights = array('l', [NO_CHILD]) * len(tags)
+        roots = []
+        for i in range(len(tags) - 1, -1, -1):
+            if tags[i] != TAG_LEAF:
+                if len(roots) < 2:
+                    raise IllFormedError("A ill-formed linearized tree cannot be transformed "
+                                         "into a CBTree")
+                roots.pop()
+                rights[i] = roots.pop()
+            roots.append(i)
+        if len(roots) != 1:
+            raise IllFormedError("A ill-formed linearized tree cannot be transformed "
+                                 "into a CBTree")
+        return rights
+
+    @staticmethod
+    def __elements(segment):
+        return zip(segment.values, segment.tags)
+
+    @staticmethod
+    def init_from_bt(bt):
+        """Create a CBTree from a BTree
+
+        Parameters
+        ----------
+        bt : :obj:`BTree`
+            The BTree to transform into a CBTree
+        """
+        values = []
+        tags = bytearray()
+        rights = array('l')
+        stack = [bt]
+        while stack:
+            current = stack.pop()
+            values.append(current.value)
+            if current.__class__ is Node:
+                tags.append(TAG_NODE)
+                rights.append(len(values) + current.left.size)
+                stack.append(current.right)
+                stack.append(current.left)
+            else:
+                tags.append(TAG_LEAF)
+                rights.append(NO_CHILD)
+        return CBTree(values, bytes(tags), rights)
+
+    @staticmethod
+    def init_from_lt(lt):
+        """Create a CBTree from a LTree
+
+        The segments of the LTree are ordered as the preorder of their roots:
+        the segments below a critical value are the next ones.
+
+        Parameters
+        ----------
+        lt : :obj:`LTree`
+            The LTree to transform into a CBTree
+
+        Raises
+        ------
+        EmptyError
+            If lt is empty
+        IllFormedError
+            If lt is not the linear representation of a binary tree
+        """
+        if not lt:
+            raise EmptyError("An empty LTree cannot be transformed into a CBTree")
+        values = []
+        tags = bytearray()
+        segments = iter(lt)
+        # None stands for the next segment, that is the right subtree of a critical value
+        stack = [CBTree.__elements(next(segments))]
+        while stack:
+            top = stack[-1]
+            if top is None:
+                top = stack[-1] = CBTree.__elements(next(segments, Segment()))
+            (value, tag) = next(top, (None, None))
+            if tag is None:
+                stack.pop()
+                continue
+            values.append(value)
+            if tag == TAG_LEAF:
+                tags.append(TAG_LEAF)
+            else:
+                tags.append(TAG_NODE)
+                if tag == TAG_CRITICAL:
+                    stack.append(None)
+                    stack.append(CBTree.__elements(next(segments, Segment())))
+        if next(segments, None) is not None:
+            raise IllFormedError("A ill-formed LTree cannot be transformed into a CBTree")
+        tags = bytes(tags)
+        return CBTree(values, tags, CBTree.__rights(tags))
+
+    def to_bt(self):
+        """Get the BTree representing the current instance
+        """
+        values = self.values
+        tags = self.tags
+        stack = []
+        for i in range(len(values) - 1, -1, -1):
+            if tags[i] == TAG_LEAF:
+                stack.append(Leaf(values[i]))
+            else:
+                left = stack.pop()
+                stack.append(Node(values[i], left, stack.pop()))
+        return stack[0]
+
+    def to_lt(self, m):
+        """Get the LTree representing the current instance
+
+        The critical nodes are the ones of ``LTree.init_from_bt(self.to_bt(), m)``.
+
+        Parameters
+        ----------
+        m : int
+            Variable to define the critical nodes of the current instance
+        """
+        def up_div(n, m_val):
+            return int(n / m_val) + (0 if n % m_val == 0 else 1)
+
+        values = self.values
+        tags = self.tags
+        rights = self.rights
+        sizes = self.map(lambda x: 1, lambda x: 1).uacc(lambda x, y, z: x + y + z).values
+        segments = []
+        # Index of the segment of each element, known when its parent is visited.
+        # The children of a critical node are the roots of new segments.
+        owners = [NO_CHILD] * len(values)
+        for i, value in enumerate(values):
+            if owners[i] == NO_CHILD:
+                owners[i] = len(segments)
+                segments.append(Segment())
+            segment = segments[owners[i]]
+            segment.values.append(value)
+            if tags[i] == TAG_LEAF:
+                segment.tags.append(TAG_LEAF)
+                continue
+            right = rights[i]
+            size = up_div(sizes[i], m)
+            if size > up_div(sizes[i + 1], m) and size > up_div(sizes[right], m):
+                segment.tags.append(TAG_CRITICAL)
+            else:
+                segment.tags.append(TAG_NODE)
+                owners[i + 1] = owners[right] = owners[i]
+        return LTree(segments)
+
+    def map(self, kl, kn):
+        """Applies functions to every leaf and to every node values
+
+        Parameters
+        ----------
+        kl : callable
+            A function to apply to every leaf values of the current instance
+        kn : callable
+            A function to apply to every node values of the current instance
+        """
+        return self.__with_values([kl(value) if tag == TAG_LEAF else kn(value)
+                                   for (value, tag) in zip(self.values, self.tags)])
+
+    def reduce(self, k):
+        """Reduces the current instance into a single value using a function k
+
+        Parameters
+        ----------
+        k : callable
+            The function used to reduce a node value and the reductions of its children
+        """
+        values = self.values
+        tags = self.tags
+        stack = []
+        for i in range(len(values) - 1, -1, -1):
+            if tags[i] == TAG_LEAF:
+                stack.append(values[i])
+            else:
+                left = stack.pop()
+                stack.append(k(left, values[i], stack.pop()))
+        return stack[0]
+
+    def uacc(self, k):
+        """Makes an upward accumulation of the values in the current instance using a function k
+
+        Parameters
+        ----------
+        k : callable
+            The function used to reduce a node value and the accumulations of its children
+        """
+        values = self.values
+        tags = self.tags
+        rights = self.rights
+        res = list(values)
+        for i in range(len(values) - 1, -1, -1):
+            if tags[i] != TAG_LEAF:
+                res[i] = k(res[i + 1], values[i], res[rights[i]])
+        return self.__with_values(res)
+
+    def dacc(self, gl, gr, c):
+        """Makes an downward accumulation of the values in the current instance using gl, gr and c
+
+        Parameters
+        ----------
+        gl : callable
+            The function used to make an accumulation to the left children
+        gr : callable
+            The function used to make an accumulation to the right children
+        c
+            Initial value of accumulation
+        """
+        values = self.values
+        tags = self.tags
+        rights = self.rights
+        res = [c] * len(values)
+        for i, value in enumerate(values):
+            if tags[i] != TAG_LEAF:
+                acc = res[i]
+                res[i + 1] = gl(acc, value)
+                res[rights[i]] = gr(acc, value)
+        return self.__with_values(res)
+
+    def zip(self, t):
+        """Zip the values contained in t with the ones in the current instance
+
+        Parameters
+        ----------
+        t : :obj:`CBTree`
+            The CBTree to zip with the current instance
+
+        Raises
+        ------
+        NotSameTagError
+            If the trees have not the same shape
+        """
+        self.__same_shape(t)
+        return self.__with_values(list(zip(self.values, t.values)))
+
+    def map2(self, f, t):
+        """Zip the values contained in a tree with the ones in the current instance using a
+        function
+
+        Parameters
+        ----------
+        f : callable
+            A function to zip values
+        t : :obj:`CBTree`
+            The CBTree to zip with the current instance
+
+        Raises
+        ------
+        NotSameTagError
+            If the trees have not the same shape
+        """
+        self.__same_shape(t)
+        return self.__with_values(list(map(f, self.values, t.values)))
@@ -12,6 +12,8 @@ MINUS_INFINITY = int((-sys.maxsize - 1) / 2)
 TAG_LEAF = 1
 TAG_NODE = 2
 TAG_CRITICAL = 3
+# Tag of an element of a Segment that is not set
+TAG_NONE = 0
 
 SEPARATOR_TV = "^"
 LEFT_TV = "("
@@ -57,6 +59,7 @@ class TaggedValue:
     """
     A class used to represent a Value in a linearized tree
 
+    A Segment does not store TaggedValues: it builds them when its elements are read.
     ...
 
     Attributes
@@ -79,6 +82,7 @@ class TaggedValue:
     is_node()
         Indicates if the current instance is tagged by the Node tag
     """
+    __slots__ = ('val', 'tag')
 
     def __init__(self, val, t):
         self.val = val
@@ -132,11 +136,22 @@ class TaggedValue:
         return self.tag == TAG_NODE
 
 
-class Segment(__List):
+class Segment:
     """A list of TaggedValue
 
+    The values and the tags are stored in two arrays: a list of values, and a
+    bytearray of tags. The local skeletons work on these arrays directly. Reading an
+    element gives a TaggedValue built from the arrays (None for an element not set yet),
+    and writing an element stores the value and the tag of a TaggedValue.
+
     ...
 
+    Attributes
+    ----------
+    values : list
+        The values of the elements
+    tags : bytearray
+        The tags of the elements (TAG_NONE for an element not set yet)
 
     Methods
     -------
@@ -172,27 +187,98 @@ class Segment(__List):
         Zip the values contained in a second Segment with the ones in the current instance
         using a function
     """
+    __slots__ = ('values', 'tags')
+
+    def __init__(self, tvs=()):
+        self.values = []
+        self.tags = bytearray()
+        self.extend(tvs)
+
+    @staticmethod
+    def __of(values, tags):
+        seg = Segment()
+        seg.values = values
+        seg.tags = tags
+        return seg
+
+    @staticmethod
+    def __empty_of_length(n):
+        return Segment.__of([None] * n, bytearray(n))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Segment.__of(self.values[i], self.tags[i])
+        tag = self.tags[i]
+        return None if tag == TAG_NONE else TaggedValue(self.values[i], tag)
+
+    def __setitem__(self, i, tv):
+        if isinstance(i, slice):
+            tvs = Segment(tv)
+            self.values[i] = tvs.values
+            self.tags[i] = tvs.tags
+        elif tv is None:
+            self.values[i] = None
+            self.tags[i] = TAG_NONE
+        else:
+            self.values[i] = tv.val
+            self.tags[i] = tv.tag
+
+    def __iter__(self):
+        for (val, tag) in zip(self.values, self.tags):
+            yield None if tag == TAG_NONE else TaggedValue(val, tag)
 
     def __eq__(self, other):
         if isinstance(other, Segment):
-            if self.length() != other.length():
-                return False
-            for i in range(0, self.length()):
-                if self[i] != other[i]:
-                    return False
-            return True
+            return self.tags == other.tags and self.values == other.values
         return False
 
+    def __str__(self):
+        return LEFT_SEG + SEPARATOR_SEG.join(str(tv) for tv in self) + RIGHT_SEG
+
+    def length(self):
+        """Get the length of the current instance"""
+        return len(self.values)
+
+    def append(self, tv):
+        """Add a TaggedValue at the end of the current instance
+
+        Parameters
+        ----------
+        tv : :obj:`TaggedValue`
+            The value to add, or None for an element not set yet
+        """
+        if tv is None:
+            self.values.append(None)
+            self.tags.append(TAG_NONE)
+        else:
+            self.values.append(tv.val)
+            self.tags.append(tv.tag)
+
+    def extend(self, tvs):
+        """Add TaggedValues at the end of the current instance
+
+        Parameters
+        ----------
+        tvs
+            An iterable of TaggedValue, or a Segment
+        """
+        if isinstance(tvs, Segment):
+            self.values.extend(tvs.values)
+            self.tags.extend(tvs.tags)
+        else:
+            for tv in tvs:
+                self.append(tv)
+
     def empty(self):
-        return self == []
+        return not self.values
 
     def has_critical(self):
         """Indicates if the current instance contains a value tagged by the Critical tag
         """
-        for v in self:
-            if v.is_critical():
-                return True
-        return False
+        return TAG_CRITICAL in self.tags
 
     def map_local(self, kl, kn):
         """Applies function kl to each leaf and function kn to each internal node
@@ -206,15 +292,9 @@ class Segment(__List):
         kn : callable
             The function to apply to every values tagged by CRITICAL or NODE of the current instance
         """
-        res = Segment([None] * self.length())
-        for i in range(self.length()):
-            tv = self[i]
-            if tv.is_leaf():
-                v = TaggedValue(kl(tv.get_value()), tv.get_tag())
-            else:  # v.is_node() or v.is_critical()
-                v = TaggedValue(kn(tv.get_value()), tv.get_tag())
-            res[i] = v
-        return res
+        tags = self.tags
+        values = [kl(val) if tag == TAG_LEAF else kn(val) for (val, tag) in zip(self.values, tags)]
+        return Segment.__of(values, bytearray(tags))
 
     @staticmethod
     def __node_reduce_local_compute(stack, d, k, psi_l, phi, v, psi_r):
@@ -230,16 +310,16 @@ class Segment(__List):
             # The current node is an ancestor of a critical value by the left
             # That is, there is a critical value on its left children in a BTree representation
             # We process and stack a partial reduction
-            stack.append(psi_l(lv, phi(v.get_value()), rv))
+            stack.append(psi_l(lv, phi(v), rv))
         elif d == 1:
             # The current node is an ancestor of a critical value by the right
             # That is, there is a critical value on its right children in a BTree representation
             # We process and stack a partial reduction
-            stack.append(psi_r(lv, phi(v.get_value()), rv))
+            stack.append(psi_r(lv, phi(v), rv))
             d = 0
         else:
             # We did not meet a critical value, we process and stack a normal reduction
-            stack.append(k(lv, v.get_value(), rv))
+            stack.append(k(lv, v, rv))
         return stack, d
 
     def reduce_local(self, k, phi, psi_l, psi_r):
@@ -267,30 +347,30 @@ class Segment(__List):
             That is there is a node that does not have two children which can be either
             a leaf value or a critical value
         """
-        assert self != [], "reduce_local cannot be applied to an empty Segment"
+        assert not self.empty(), "reduce_local cannot be applied to an empty Segment"
         stack = []
         d = MINUS_INFINITY
         has_critical = False
-        for v in reversed(self):
+        for (v, tag) in zip(reversed(self.values), reversed(self.tags)):
             # Starts by the end, that is the most deep leaves
             # We stack every elements we already reduced
-            if v.is_leaf():
+            if tag == TAG_LEAF:
                 # We cannot reduce a leaf value
-                stack.append(v.get_value())
+                stack.append(v)
                 d = d + 1
-            elif v.is_node():
+            elif tag == TAG_NODE:
                 stack, d = self.__node_reduce_local_compute(stack, d, k, psi_l, phi, v, psi_r)
-            else:  # v.is_critical()
+            else:  # tag == TAG_CRITICAL
                 # we process and stack the reduction of critical value
-                stack.append(phi(v.get_value()))
+                stack.append(phi(v))
                 has_critical = True
                 d = 0
         top = stack.pop()
         if has_critical:
             # The current instance represented a node in the global structure of a linearized tree
-            return TaggedValue(top, "N")
+            return TaggedValue(top, TAG_NODE)
             # The current instance represented a leaf in the global structure of a linearized tree
-        return TaggedValue(top, "L")
+        return TaggedValue(top, TAG_LEAF)
 
     def reduce_global(self, psi_n):
         """Makes a global reduction using local reductions of Segments
@@ -315,14 +395,14 @@ class Segment(__List):
         """
         assert not self.has_critical(), "reduce_global cannot be applied to a" \
                                         "Segments which contains a critical"
-        assert self != [], "reduce_global cannot be applied to an empty Segment"
+        assert not self.empty(), "reduce_global cannot be applied to an empty Segment"
         stack = []
-        for g in reversed(self):
+        for (g, tag) in zip(reversed(self.values), reversed(self.tags)):
             # We stack every value we already reduced
-            if g.is_leaf():
+            if tag == TAG_LEAF:
                 # Nothing to calculate, we only stack the value
-                stack.append(g.get_value())
-            else:  # g.is_node()
+                stack.append(g)
+            else:  # tag == TAG_NODE
                 # We get two sub reductions to make a total reduction of the current node
                 if len(stack) < 2:
                     raise IllFormedError(
@@ -331,7 +411,7 @@ class Segment(__List):
                 lv = stack.pop()
                 rv = stack.pop()
                 # We process and stack a reduction
-                stack.append(psi_n(lv, g.get_value(), rv))
+                stack.append(psi_n(lv, g, rv))
         top = stack.pop()
         return top
 
@@ -349,21 +429,20 @@ class Segment(__List):
             # The current node is an ancestor of a critical value by the left
             # That is, there is a critical value on its left children in a BTree representation
             # We process and stack the value of a partial accumulation
-            val = phi(v.get_value())
+            val = phi(v)
             stack.append(psi_l(lv, val, rv))
-            res[i] = None
         elif d == 1:
             # The current node is an ancestor of a critical value by the left
             # That is, there is a critical value on its left children in a BTree representation
             # We process and stack the value of a partial accumulation
-            val = phi(v.get_value())
+            val = phi(v)
             stack.append(psi_r(lv, val, rv))
-            res[i] = None
             d = 0
         else:
             # We did not meet a critical value, we can process a normal upward accumulation with k
-            val = k(lv, v.get_value(), rv)
-            res[i] = TaggedValue(val, v.get_tag())
+            val = k(lv, v, rv)
+            res.values[i] = val
+            res.tags[i] = TAG_NODE
             stack.append(val)
             d = d - 1
         return d, stack, res
@@ -393,32 +472,36 @@ class Segment(__List):
             That is there is a node that doesn't have two children which can be either a leaf
             value or a critical value
         """
-        assert self != [], "uacc_local cannot be applied to an empty Segment"
+        assert not self.empty(), "uacc_local cannot be applied to an empty Segment"
         stack = []
         d = MINUS_INFINITY
-        res = Segment([None] * self.length())
+        values = self.values
+        tags = self.tags
+        # The elements of the partial accumulations are not set
+        res = Segment.__empty_of_length(len(values))
         has_crit = False
-        for i in reversed(range(self.length())):
-            v = self[i]
+        for i in reversed(range(len(values))):
+            v = values[i]
+            tag = tags[i]
             # We stack all the values of previous accumulation
-            if v.is_leaf():
-                res[i] = v
-                stack.append(v.get_value())
+            if tag == TAG_LEAF:
+                res.values[i] = v
+                res.tags[i] = TAG_LEAF
+                stack.append(v)
                 d = d + 1
-            elif v.is_node():
+            elif tag == TAG_NODE:
                 d, stack, res = self.__node_uacc_local_compute(stack, d,
                                                                phi, v, psi_l,
                                                                res, psi_r, i, k)
-            else:  # v.is_critical()
+            else:  # tag == TAG_CRITICAL
                 # The current value is critical.
                 # We make a partial accumulation with phi and stack the result
-                stack.append(phi(v.get_value()))
-                res[i] = None
+                stack.append(phi(v))
                 d = 0
                 has_crit = True
 
         top = stack.pop()
-        tag = "N" if has_crit else "L"
+        tag = TAG_NODE if has_crit else TAG_LEAF
         # We return both the top values for following global upward accumulation, and the current
         # accumulated subtree
         return TaggedValue(top, tag), res
@@ -445,26 +528,23 @@ class Segment(__List):
         assert not self.has_critical(), "uacc_global cannot be applied to a " \
                                         "Segments which contains a critical"
         stack = []
-        res = Segment([None] * self.length())
-        for i in reversed(range(self.length())):
-            g = self[i]
+        values = self.values
+        tags = self.tags
+        res = list(values)
+        for i in reversed(range(len(values))):
             # We process a global accumulation using a stack to store previous accumulation,
             # to get them for the accumulation on nodes
-            if g.is_leaf():
-                res[i] = g
-                val = g.get_value()
-            else:  # g.is_node()
+            if tags[i] != TAG_LEAF:  # tags[i] == TAG_NODE
                 if len(stack) < 2:
                     raise IllFormedError(
                         "uacc_global cannot be applied if there is a node that "
                         "does not have two children in the current instance")
                 lv = stack.pop()
                 rv = stack.pop()
-                val = psi_n(lv, g.get_value(), rv)
-                res[i] = TaggedValue(val, g.get_tag())
-            stack.append(val)
+                res[i] = psi_n(lv, values[i], rv)
+            stack.append(res[i])
         # We get the top value of the accumulation
-        return res
+        return Segment.__of(res, bytearray(tags))
 
     @staticmethod
     def __node_uacc_update_compute(stack, d, res, k, v1, v2, i):
@@ -478,14 +558,14 @@ class Segment(__List):
         rv = stack.pop()
         if d in (0, 1):
             # We met a critical value before, so the accumulation is not completed yet
-            val = k(lv, v1.get_value(), rv)
-            res[i] = TaggedValue(val, v1.get_tag())
+            val = k(lv, v1, rv)
+            res[i] = val
             stack.append(val)
             d = 0
         else:
             # We did not meet a critical value before, so the accumulation is completed yet
             res[i] = v2
-            stack.append(v2.get_value())
+            stack.append(v2)
             d = d - 1
         return res, stack, d
 
@@ -518,20 +598,23 @@ class Segment(__List):
                                                "Segment of same size as input"
         stack = [rc, lc]
         d = MINUS_INFINITY
-        res = Segment([None] * self.length())
-        for i in reversed(range(seg2.length())):
-            v1 = self[i]
-            v2 = seg2[i]
+        values = self.values
+        tags = self.tags
+        values2 = seg2.values
+        res = [None] * len(values)
+        for i in reversed(range(len(values))):
+            tag = tags[i]
             # We update the accumulation from seg2
             # We stack the values already updated to process updates on nodes
-            if v1.is_leaf():
+            if tag == TAG_LEAF:
                 # The result of the accumulation is the node made in seg2
-                res[i] = v2
-                stack.append(v2.get_value())
+                res[i] = values2[i]
+                stack.append(values2[i])
                 d = d + 1
-            elif v1.is_node():
-                res, stack, d = self.__node_uacc_update_compute(stack, d, res, k, v1, v2, i)
-            else:  # v1.is_critical()
+            elif tag == TAG_NODE:
+                res, stack, d = self.__node_uacc_update_compute(stack, d, res, k, values[i],
+                                                                values2[i], i)
+            else:  # tag == TAG_CRITICAL
                 if len(stack) < 2:
                     raise IllFormedError(
                         "uacc_update cannot be applied if there is a node that "
@@ -539,11 +622,11 @@ class Segment(__List):
                 # We need two sub accumulation values to process the accumulation of a critical node
                 lv = stack.pop()
                 rv = stack.pop()
-                val = k(lv, v1.get_value(), rv)
-                res[i] = TaggedValue(val, v1.get_tag())
+                val = k(lv, values[i], rv)
+                res[i] = val
                 stack.append(val)
                 d = 0
-        return res
+        return Segment.__of(res, bytearray(tags))
 
     @staticmethod
     def __node_dacc_path_compute(d, psi_u, phi_l, v, to_l, to_r):
@@ -552,14 +635,14 @@ class Segment(__List):
             # The current node is an ancestor of a critical value by the left
             # That is, there is a critical value on its left children in a BTree representation
             # We process and stack the value of a partial downward accumulation
-            to_l = psi_u(phi_l(v.get_value()), to_l)
-            to_r = psi_u(phi_l(v.get_value()), to_r)
+            to_l = psi_u(phi_l(v), to_l)
+            to_r = psi_u(phi_l(v), to_r)
         elif d == 1:
             # The current node is an ancestor of a critical value by the right
             # That is, there is a critical value on its right children in a BTree representation
             # We process and stack the value of a partial downward accumulation
-            to_l = psi_u(phi_l(v.get_value()), to_l)
-            to_r = psi_u(phi_l(v.get_value()), to_r)
+            to_l = psi_u(phi_l(v), to_l)
+            to_r = psi_u(phi_l(v), to_r)
             d = 0
         else:
             d = d - 1
@@ -589,27 +672,27 @@ class Segment(__List):
         ApplicationError
             If the current instance does not contain a critical value
         """
-        assert self != [], "dacc_path cannot be applied to an empty Segment"
+        assert not self.empty(), "dacc_path cannot be applied to an empty Segment"
         d = MINUS_INFINITY
         # The value to pass to the left children for a total downward accumulation
         to_l = None
         # The value to pass to the right children for a total downward accumulation
         to_r = None
         has_critical = False
-        for v in reversed(self):
-            if v.is_leaf():
+        for (v, tag) in zip(reversed(self.values), reversed(self.tags)):
+            if tag == TAG_LEAF:
                 d = d + 1
-            elif v.is_node():
+            elif tag == TAG_NODE:
                 to_l, to_r, d = self.__node_dacc_path_compute(d, psi_u, phi_l, v, to_l, to_r)
-            else:  # v.is_critical()
+            else:  # tag == TAG_CRITICAL
                 has_critical = True
-                to_l = phi_l(v.get_value())
-                to_r = phi_r(v.get_value())
+                to_l = phi_l(v)
+                to_r = phi_r(v)
                 d = 0
         if not has_critical:
             raise ApplicationError("dacc_path must be imperatively applied to a "
                                    "Segment which contains a critical node")
-        return TaggedValue((to_l, to_r), "N")
+        return TaggedValue((to_l, to_r), TAG_NODE)
 
     def dacc_global(self, psi_d, c):
         """Performs sequential downwards accumulation
@@ -633,26 +716,27 @@ class Segment(__List):
             That is there are several leaves that doesn't have a parent in a BTree representation
         """
         stack = [c]
-        res = Segment([None] * self.length())
+        values = self.values
+        tags = self.tags
+        res = [None] * len(values)
         assert not self.has_critical(), "dacc_global cannot be applied to " \
                                         "Segment which contains a critical node"
-        for i in range(self.length()):
-            v = self[i]
+        for i in range(len(values)):
             if len(stack) == 0:
                 raise IllFormedError(
                     "dacc_global cannot be applied to ill-formed "
                     "Segments that is two leaf values do not have a parent")
             # We add the previous accumulation as a new value of our result
             val = stack.pop()
-            res[i] = TaggedValue(val, v.get_tag())
+            res[i] = val
             # If the current value is node, we need to update
             # the value to pass to the right, and left children
             # These values are contained in the stack
-            if v.is_node():
-                (to_l, to_r) = v.get_value()
+            if tags[i] == TAG_NODE:
+                (to_l, to_r) = values[i]
                 stack.append(psi_d(val, to_r))
                 stack.append(psi_d(val, to_l))
-        return res
+        return Segment.__of(res, bytearray(tags))
 
     def dacc_local(self, gl, gr, c):
         """Computes local downward accumulation for the current instance using an
@@ -677,18 +761,18 @@ class Segment(__List):
         # We update not finished accumulation locally using the value from the parent in the global
         # representation of a linearized tree
         stack = [c]
-        res = Segment([None] * self.length())
-        for i in range(self.length()):
-            v = self[i]
-            if v.is_leaf() or v.is_critical():
+        values = self.values
+        tags = self.tags
+        res = [None] * len(values)
+        for i in range(len(values)):
+            if tags[i] != TAG_NODE:  # leaf or critical value
                 if len(stack) == 0:
                     raise IllFormedError(
                         "dacc_local cannot be applied if there are two leaf values, or critical "
                         "values that do not have a parent")
                 # We get the accumulated value passed from the last parent
-                val = stack.pop()
-                res[i] = TaggedValue(val, v.get_tag())
-            else:  # v.is_node()
+                res[i] = stack.pop()
+            else:  # tags[i] == TAG_NODE
                 if len(stack) == 0:
                     raise IllFormedError(
                         "dacc_local cannot be applied if there is not a value to accumulate from "
@@ -697,10 +781,10 @@ class Segment(__List):
                 # We get the accumulated value passed from the last parent
                 # And two new ones, one for the left children, and one to the right, using
                 # the gr and gl functions
-                res[i] = TaggedValue(val, v.get_tag())
-                stack.append(gr(val, v.get_value()))
-                stack.append(gl(val, v.get_value()))
-        return res
+                res[i] = val
+                stack.append(gr(val, values[i]))
+                stack.append(gl(val, values[i]))
+        return Segment.__of(res, bytearray(tags))
 
     def get_left(self, i):
         """Get the left children of a value at the i-th index
@@ -717,7 +801,7 @@ class Segment(__List):
         """
         assert not self.has_critical(), "The left children of a value in a non-global Segment " \
                                         "cannot be found "
-        assert not self[i].is_leaf(), "A leaf value doesn't have a left children"
+        assert self.tags[i] != TAG_LEAF, "A leaf value doesn't have a left children"
         assert i < self.length() - 1, "Cannot get the left children of a node in an ill-formed " \
                                       "Segment "
         return self[i + 1]
@@ -738,18 +822,23 @@ class Segment(__List):
         """
         assert not self.has_critical(), "The right children of a value in a non-global Segment " \
                                         "cannot be found "
-        assert not self[i].is_leaf(), "A leaf value doesn't have a right children"
+        assert self.tags[i] != TAG_LEAF, "A leaf value doesn't have a right children"
         assert i < self.length() - 2, "Cannot get the left children of a node in an ill-formed " \
                                       "Segment "
-
-        def get_right_index(gt, idx):
-            if gt[idx + 1].is_leaf():
-                return idx + 2
-            return 1 + get_right_index(gt, idx + 1)
-
-        j = get_right_index(self, i)
+        # The right children follows the left subtree, that is the first index where
+        # the number of leaves exceeds the number of nodes since i + 1
+        j = i + 1
+        pending = 1
+        while pending > 0:
+            pending = pending + (1 if self.tags[j] == TAG_NODE else -1)
+            j = j + 1
         return self[j]
 
+    def __check_same_tags(self, seg):
+        assert self.length() == seg.length(), "The linearized trees have not the same shape"
+        if self.tags != seg.tags:
+            raise NotSameTagError("Two zipped values have not the same tag")
+
     def zip(self, seg):
         """Zip the values contained in a second Segment with the ones in the current instance
 
@@ -767,16 +856,8 @@ class Segment(__List):
         NotSameTagError
             If two values with not the same tag are trying to be zipped together
         """
-        assert self.length() == seg.length(), "The linearized trees have not the same shape"
-        res = Segment([None] * self.length())
-        for j in range(self.length()):
-            tv1 = self[j]
-            tv2 = seg[j]
-            if tv1.get_tag() != tv2.get_tag():
-                raise NotSameTagError("Two zipped values have not the same tag")
-            tv = TaggedValue((tv1.get_value(), tv2.get_value()), tv1.get_tag())
-            res[j] = tv
-        return res
+        self.__check_same_tags(seg)
+        return Segment.__of(list(zip(self.values, seg.values)), bytearray(self.tags))
 
     def map2(self, f, seg):
         """Zip the values contained in a second Segment with the ones in the current instance
@@ -798,16 +879,8 @@ class Segment(__List):
         NotSameTagError
             If two values with not the same tag are trying to be zipped together
         """
-        assert self.length() == seg.length(), "The linearized trees have not the same shape"
-        res = Segment([None] * self.length())
-        for j in range(self.length()):
-            tv1 = self[j]
-            tv2 = seg[j]
-            if tv1.get_tag() != tv2.get_tag():
-                raise NotSameTagError("Two zipped values have not the same tag")
-            tv = TaggedValue(f(tv1.get_value(), tv2.get_value()), tv1.get_tag())
-            res[j] = tv
-        return res
+        self.__check_same_tags(seg)
+        return Segment.__of(list(map(f, self.values, seg.values)), bytearray(self.tags))
 
     @staticmethod
     def from_str(s, parser=int):
@@ -827,7 +900,8 @@ class Segment(__List):
             v = v.replace(LEFT_TV, "")
             v = v.replace(RIGHT_TV, "")
             tv = v.split(SEPARATOR_TV)
-            res.append(TaggedValue(parser(tv[0]), parse_tag(tv[1])))
+            res.values.append(parser(tv[0]))
+            res.tags.append(parse_tag(tv[1]))
         return res
 
 
@@ -897,14 +971,14 @@ class LTree(__List):
 
         def __tv2lv(bt_value):
             val = bt_value.get_value()
-            res = Segment()
+            res = []
             res_0 = Segment()
             if bt_value.is_leaf():
                 res_0.append(val)
                 res.append(res_0)
             else:  # bt_val.is_node()
-                res_left = Segment(__tv2lv(bt_value.get_left()))
-                res_right = Segment(__tv2lv(bt_value.get_right()))
+                res_left = __tv2lv(bt_value.get_left())
+                res_right = __tv2lv(bt_value.get_right())
                 if val.is_critical():
                     res_0.append(val)
                     res.append(res_0)
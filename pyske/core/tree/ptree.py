@@ -1,33 +1,11 @@
 """
 PTree Module
 """
-import logging
-
 from pyske.core.tree.ltree import TaggedValue, Segment, LTree
 from pyske.core.support.parallel import COMM, PID, NPROCS
 from pyske.core.support.separate import distribute_tree
 from pyske.core.list.slist import SList
-from pyske.core.util import par
-
-TAG_BASE = "270995"
-TAG_COMM_REDUCE = int(TAG_BASE + "11")
-TAG_COMM_UACC_1 = int(TAG_BASE + "21")
-TAG_COMM_UACC_2 = int(TAG_BASE + "22")
-TAG_COMM_DACC_1 = int(TAG_BASE + "31")
-TAG_COMM_DACC_2 = int(TAG_BASE + "32")
-TAG_COMM_MERGE = int(TAG_BASE + "00")
-TAG_TO_SEQ = int(TAG_BASE + "01")
-
-logging.basicConfig(filename='run_ptree.log', level=logging.DEBUG)
-with open('run_ptree.log', 'w'):
-    pass
-logger = logging.getLogger('ptree')
-logger.setLevel(logging.DEBUG)
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(funcName)s - %(levelname)s - %(message)s')
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+from pyske.core.util import trace
 
 
 class PTree:
@@ -40,7 +18,7 @@ class PTree:
     __global_index: num seg -> (start, offset)
     __start_index: index of first index for the current PID in global_index
     __nb_segs: nb of indexes for the current PID in global_index
-    __content: concatenation of the segments contained in the current instance
+    __content: concatenation of the segments contained in the current instance, as a Segment
     """
 
     def __init__(self, lt=None):
@@ -48,7 +26,7 @@ class PTree:
         self.__global_index = SList([])
         self.__start_index = 0
         self.__nb_segs = 0
-        self.__content = SList([])
+        self.__content = Segment()
         if lt is not None:
             (distribution, global_index) = distribute_tree(lt, NPROCS)
             self.__distribution = distribution
@@ -127,7 +105,7 @@ class PTree:
         ----------
         pt : :obj:`PTree`
             A parallel tree that we want to copy the distribution
-        content : :obj:`SList`
+        content : :obj:`Segment`
             The content of the resulting PTree
         """
         p = PTree()
@@ -159,7 +137,7 @@ class PTree:
             return int(ss[0]), int(ss[1])
 
         p = PTree()
-        content = SList([])
+        content = Segment()
         with open(filename, "r") as f:
             count_line = 0
             for line in f:
@@ -191,12 +169,24 @@ class PTree:
         """Browse the linearized distributed tree contained in the current processor
         """
         res = "PID[" + str(PID) + "] "
-        for (start, offset) in \
-                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]:
-            seg = Segment(self.__content[start:start + offset])
+        for seg in self.__local_segments():
             res = res + "\n   " + str(seg)
         return res
 
+    def __local_segments(self):
+        """The segments of the current processor, sliced from the content"""
+        content = self.__content
+        return [content[start:start + offset] for (start, offset) in
+                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]]
+
+    @staticmethod
+    def __concat(segments):
+        """The content made of the given segments of the current processor"""
+        content = Segment()
+        for seg in segments:
+            content.extend(seg)
+        return content
+
     def map(self, kl, kn):
         """Map skeleton for distributed tree
 
@@ -207,17 +197,9 @@ class PTree:
         kn : callable
             Function to apply to every node value of the current instance
         """
-        content = SList([None] * self.__content.length())
-        logger.debug(
-            '[START] PID[%s] map skeleton', PID)
-        for (start, offset) in \
-                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]:
-            logger.debug('[START] PID[%s] map_local from %s to %s', PID, start, start + offset)
-            content[start:start + offset] = Segment(self.__content[start:start +
-                                                    offset]).map_local(kl, kn)
-            logger.debug('[END] PID[%s] map_local from %s to %s', PID, start, start + offset)
+        with trace.phase('map', 'local'):
+            content = self.__concat(seg.map_local(kl, kn) for seg in self.__local_segments())
         res = PTree.init(self, content)
-        logger.debug('[END] PID[%s] map skeleton', PID)
         return res
 
     # pylint: disable=too-many-arguments
@@ -242,96 +224,71 @@ class PTree:
         psi_r : callable
             A function used to respect the closure property to make partial computation on the right
         """
-        logger.debug('[START] PID[%s] reduce skeleton', PID)
         # Step 1 : Local Reduction
         gt = Segment([None] * self.__nb_segs)
-        i = 0
-        for (start, offset) in \
-                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]:
-            logger.debug('[START] PID[%s] reduce_local from %s to %s', PID, start, start + offset)
-            gt[i] = Segment(self.__content[start:start + offset]).reduce_local(k, phi, psi_l, psi_r)
-            logger.debug('[END] PID[%s] reduce_local from %s to %s', PID, start, start + offset)
-            i = i + 1
+        with trace.phase('reduce', 'local'):
+            for (i, seg) in enumerate(self.__local_segments()):
+                gt[i] = seg.reduce_local(k, phi, psi_l, psi_r)
         # Step 2 : Gather local Results
-        self.__gather_local_result(gt, i, TAG_COMM_UACC_1)
+        self.__gather_local_result(gt, 'reduce')
         # Step 3 : Global Reduction
-        par.at_root(lambda: logger.debug('[START] PID[%s] reduce_global', PID))
-        res = gt.reduce_global(psi_n) if PID == 0 else None
-        par.at_root(lambda: logger.debug('[END] PID[%s] reduce_global', PID))
-        logger.debug('[END] PID[%s] reduce skeleton', PID)
+        res = None
+        if PID == 0:
+            with trace.phase('reduce', 'global'):
+                res = gt.reduce_global(psi_n)
         return res
 
     def __local_upwards_accumulation(self, k, phi, psi_l, psi_r):
         gt = Segment([None] * self.__nb_segs)
         lt2 = SList([None] * self.__nb_segs)
-        i = 0
-        for (start, offset) in \
-                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]:
-            logger.debug('[START] PID[%s] uacc_local from %s to %s', PID, start, start + offset)
-            (top, res) = Segment(self.__content[start:start +
-                                                offset]).uacc_local(k, phi, psi_l, psi_r)
-            logger.debug('[END] PID[%s] uacc_local from %s to %s', PID, start, start + offset)
-            gt[i] = top
-            lt2[i] = res
-            i = i + 1
-        return i, gt, lt2
+        for (i, seg) in enumerate(self.__local_segments()):
+            (gt[i], lt2[i]) = seg.uacc_local(k, phi, psi_l, psi_r)
+        return self.__nb_segs, gt, lt2
 
     @staticmethod
-    def __gather_local_result(gt, i, tag):
-        if PID == 0:
-            for iproc in range(1, NPROCS):
-                logger.debug('[START] PID[%s] reception local from %s', PID, i)
-                gt.extend(COMM.recv(source=iproc, tag=tag)['c'])
-                logger.debug('[END] PID[%s] reception local from %s', PID, i)
-        else:
-            logger.debug('[START] PID[%s] emission local to %s', PID, 0)
-            COMM.send({'c': gt}, dest=0, tag=tag)
-            logger.debug('[END] PID[%s] emission local to %s', PID, 0)
+    def __gather_local_result(gt, skeleton):
+        """Concatenates at the root the local results of all the processors"""
+        with trace.phase(skeleton, 'gather'):
+            gts = COMM.gather(gt, root=0)
+            if PID == 0:
+                for gt_iproc in gts[1:]:
+                    gt.extend(gt_iproc)
 
     @staticmethod
     def __global_upwards_accumulation(psi_n, gt):
         gt2 = None
         if PID == 0:
-            par.at_root(lambda: logger.debug('[START] PID[%s] uacc_global', PID))
-            gt2 = gt.uacc_global(psi_n)
-            for i, _ in enumerate(gt2):
-                if gt2[i].is_node():
-                    gt2[i] = TaggedValue((gt2.get_left(i).get_value(),
-                                          gt2.get_right(i).get_value()), gt2[i].get_tag())
-            par.at_root(lambda: logger.debug('[END] PID[%s] uacc_global', PID))
+            with trace.phase('uacc', 'global'):
+                gt2 = gt.uacc_global(psi_n)
+                for i, _ in enumerate(gt2):
+                    if gt2[i].is_node():
+                        gt2[i] = TaggedValue((gt2.get_left(i).get_value(),
+                                              gt2.get_right(i).get_value()), gt2[i].get_tag())
         return gt2
 
-    def __distribute_global_result(self, gt2, tag):
-        start = 0
-        if PID == 0:
-            for iproc in range(NPROCS):
-                iproc_off = self.__distribution[iproc]
-                if iproc != 0:
-                    logger.debug('[START] PID[%s] emission global to %s', PID, iproc)
-                    COMM.send({'g': gt2[start: start + iproc_off]}, dest=iproc, tag=tag)
-                    logger.debug('[END] PID[%s] emission global to %s', PID, iproc)
-                start = start + iproc_off
-        else:
-            logger.debug('[START] PID[%s] reception global from %s', PID, 0)
-            gt2 = COMM.recv(source=0, tag=tag)['g']
-            logger.debug('[END] PID[%s] reception global from %s', PID, 0)
+    def __distribute_global_result(self, gt2, skeleton):
+        """Scatters from the root the global results of the segments of each processor"""
+        with trace.phase(skeleton, 'scatter'):
+            slices = None
+            if PID == 0:
+                slices = []
+                start = 0
+                for iproc in range(NPROCS):
+                    iproc_off = self.__distribution[iproc]
+                    slices.append(gt2[start: start + iproc_off])
+                    start = start + iproc_off
+            gt2 = COMM.scatter(slices, root=0)
         return gt2
 
     def __local_updates(self, gt, gt2, lt2, k):
-        content = SList([None] * self.__content.length())
-        for i in range(len(self.__global_index[self.__start_index: self.__start_index +
-                                               self.__nb_segs])):
-            (start, offset) = self.__global_index[self.__start_index: self.__start_index +
-                                                  self.__nb_segs][i]
-            logger.debug('[START] PID[%s] uacc_update from %s to %s', PID, start, start + offset)
+        segments = []
+        for (i, seg) in enumerate(self.__local_segments()):
             if gt[i].is_node():
                 (lc, rc) = gt2[i].get_value()
-                val = Segment(self.__content[start:start + offset]).uacc_update(lt2[i], k, lc, rc)
+                segments.append(seg.uacc_update(lt2[i], k, lc, rc))
             else:
-                val = lt2[i]
-            logger.debug('[END] PID[%s] uacc_update from %s to %s', PID, start, start + offset)
-            content[start:start + offset] = val
-        return content
+                segments.append(lt2[i])
+        return self.__concat(segments)
 
     def uacc(self, k, phi, psi_n, psi_l, psi_r):
         """Upward accumulation skeleton for distributed tree
@@ -354,25 +311,25 @@ class PTree:
         psi_r : callable
             A function used to respect the closure property to make partial computation on the right
         """
-        logger.debug('[START] PID[%s] uAcc skeleton', PID)
         assert self.__distribution != []
         # Step 1 : Local Upwards Accumulation
-        i, gt, lt2 = self.__local_upwards_accumulation(k, phi, psi_l, psi_r)
+        with trace.phase('uacc', 'local'):
+            _, gt, lt2 = self.__local_upwards_accumulation(k, phi, psi_l, psi_r)
 
         # Step 2 : Gather local Results
-        self.__gather_local_result(gt, i, TAG_COMM_UACC_1)
+        self.__gather_local_result(gt, 'uacc')
 
         # Step 3 : Global Upward Accumulation
         gt2 = self.__global_upwards_accumulation(psi_n, gt)
 
         # Step 4 : Distributing Global Result
-        gt2 = self.__distribute_global_result(gt2, TAG_COMM_UACC_2)
+        gt2 = self.__distribute_global_result(gt2, 'uacc')
 
         # Step 5 : Local Updates
-        content = self.__local_updates(gt, gt2, lt2, k)
+        with trace.phase('uacc', 'update'):
+            content = self.__local_updates(gt, gt2, lt2, k)
 
         res = PTree.init(self, content)
-        logger.debug('[END] PID[%s] uAcc skeleton', PID)
         return res
 
     def dacc(self, gl, gr, c, phi_l, phi_r, psi_u, psi_d):
@@ -402,39 +359,27 @@ class PTree:
         psi_u : callable
             A function used to respect the closure property to make partial computation
         """
-        logger.debug('[START] PID[%s] dAcc skeleton', PID)
         # Step 1 : Computing Local Intermediate Values
         gt = Segment([None] * self.__nb_segs)
-        i = 0
-        for (start, offset) in \
-                self.__global_index[self.__start_index: self.__start_index + self.__nb_segs]:
-            seg = Segment(self.__content[start:start + offset])
-            logger.debug('[START] PID[%s] dacc_path from %s to %s', PID, start, start + offset)
-            if seg.has_critical():
-                gt[i] = seg.dacc_path(phi_l, phi_r, psi_u)
-            else:
-                gt[i] = TaggedValue(seg[0].get_value(), "L")
-            logger.debug('[END] PID[%s] dacc_path from %s to %s', PID, start, start + offset)
-            i = i + 1
+        with trace.phase('dacc', 'local'):
+            for (i, seg) in enumerate(self.__local_segments()):
+                if seg.has_critical():
+                    gt[i] = seg.dacc_path(phi_l, phi_r, psi_u)
+                else:
+                    gt[i] = TaggedValue(seg[0].get_value(), "L")
         # Step 2 : Gather Local Results
-        self.__gather_local_result(gt, i, TAG_COMM_DACC_1)
+        self.__gather_local_result(gt, 'dacc')
         # Step 3 : Global Downward Accumulation
-        par.at_root(lambda: logger.debug('[START] PID[%s] dacc_global', PID))
-        gt2 = (gt.dacc_global(psi_d, c) if PID == 0 else None)
-        par.at_root(lambda: logger.debug('[END] PID[%s] dacc_global', PID))
+        gt2 = None
+        if PID == 0:
+            with trace.phase('dacc', 'global'):
+                gt2 = gt.dacc_global(psi_d, c)
         # Step 4 : Distributing Global Result
-        gt2 = self.__distribute_global_result(gt2, TAG_COMM_DACC_2)
+        gt2 = self.__distribute_global_result(gt2, 'dacc')
         # Step 5 : Local Downward Accumulation
-        content = SList([None] * self.__content.length())
-        for i in range(len(self.__global_index[self.__start_index: self.__start_index +
-                                               self.__nb_segs])):
-            (start, offset) = self.__global_index[self.__start_index: self.__start_index +
-                                                  self.__nb_segs][i]
-            logger.debug('[START] PID[%s] dacc_local from %s to %s', PID, start, start + offset)
-            content[start:start + offset] = \
-                Segment(self.__content[start:start + offset]).dacc_local(gl, gr, gt2[i].get_value())
-            logger.debug('[END] PID[%s] dacc_local from %s to %s', PID, start, start + offset)
-        logger.debug('[END] PID[%s] dAcc skeleton', PID)
+        with trace.phase('dacc', 'update'):
+            content = self.__concat(seg.dacc_local(gl, gr, gt2[i].get_value())
+                                    for (i, seg) in enumerate(self.__local_segments()))
         return PTree.init(self, content)
 
     def zip(self, pt: 'PTree'):
@@ -449,19 +394,11 @@ class PTree:
         pt : :obj:`PTree`
             The PTree to zip with the current instance
         """
-        logger.debug('[START] PID[%s] zip skeleton', PID)
         assert self.__distribution == pt.distribution
-        content = SList([None] * self.__content.length())
-        for i in range(len(self.__global_index[self.__start_index: self.__start_index +
-                                               self.__nb_segs])):
-            (start, offset) = self.__global_index[self.__start_index: self.__start_index +
-                                                  self.__nb_segs][i]
-            logger.debug('[START] PID[%s] zip_local from %s to %s', PID, start, start + offset)
-            content[start:start + offset] = Segment(self.__content[start:start + offset]). \
-                zip(Segment(pt.content[start:start + offset]))
-            logger.debug('[END] PID[%s] zip_local from %s to %s', PID, start, start + offset)
+        with trace.phase('zip', 'local'):
+            content = self.__concat(seg.zip(pt_seg) for (seg, pt_seg) in
+                                    zip(self.__local_segments(), pt.__local_segments()))
         res = PTree.init(self, content)
-        logger.debug('[END] PID[%s] zip skeleton', PID)
         return res
 
     def map2(self, f, pt):
@@ -478,19 +415,11 @@ class PTree:
         f : callable
             A function to zip values
         """
-        logger.debug('[START] PID[%s] map2 skeleton', PID)
         assert self.__distribution == pt.distribution
-        content = SList([None] * self.__content.length())
-        for i in range(len(self.__global_index[self.__start_index: self.__start_index +
-                                               self.__nb_segs])):
-            (start, offset) = self.__global_index[self.__start_index: self.__start_index +
-                                                  self.__nb_segs][i]
-            logger.debug('[START] PID[%s] map2_local from %s to %s', PID, start, start + offset)
-            content[start:start + offset] = Segment(self.__content[start:start + offset]). \
-                map2(f, Segment(pt.content[start:start + offset]))
-            logger.debug('[END] PID[%s] map2_local from %s to %s', PID, start, start + offset)
+        with trace.phase('map2', 'local'):
+            content = self.__concat(seg.map2(f, pt_seg) for (seg, pt_seg) in
+                                    zip(self.__local_segments(), pt.__local_segments()))
         res = PTree.init(self, content)
-        logger.debug('[END] PID[%s] map2 skeleton', PID)
         return res
 
     def get_full_index(self):
@@ -502,17 +431,16 @@ class PTree:
         return SList(self.__global_index.scanr(f))
 
     def to_seq(self):
-        full_content = []
+        with trace.phase('to_seq', 'gather'):
+            contents = COMM.gather(self.__content, root=0)
         if PID == 0:
             full_index = self.get_full_index()
             res = LTree([None] * full_index.length())
-            full_content.extend(self.__content)
-            for iproc in range(1, NPROCS):
-                full_content.extend(COMM.recv(source=iproc, tag=TAG_TO_SEQ)['c'])
-
+            full_content = Segment()
+            for content in contents:
+                full_content.extend(content)
             for i in range(full_index.length()):
                 (start, offset) = full_index[i]
                 res[i] = full_content[start:start + offset]
             return res
-        COMM.send({'c': self.__content}, dest=0, tag=TAG_TO_SEQ)
         return None
@@ -1,8 +1,8 @@
 """
 A module of useful simple functions.
 """
-__all__ = ['idt', 'compose', 'curry', 'uncurry', 'zero', 'one', 'add', 'incr', 'decr',
-           'is_even', 'is_odd']
+__all__ = ['idt', 'compose', 'compose_index', 'index_compose', 'compose_left', 'compose_right',
+           'curry', 'uncurry', 'zero', 'one', 'add', 'incr', 'decr', 'is_even', 'is_odd']
 
 import functools
 import operator
@@ -29,6 +29,54 @@ def compose(fun_f, fun_g):
     return lambda x: fun_f(fun_g(x))
 
 
+def compose_index(fun_g, fun_f):
+    """
+    Composition of a function taking an index and a value, and a unary function.
+
+    :param fun_g: callable taking an index and a value
+    :param fun_f: callable
+    :return: callable taking an index ``i`` and a value ``x``
+        and returning ``fun_g(i, fun_f(x))``
+    """
+    return lambda i, x: fun_g(i, fun_f(x))
+
+
+def index_compose(fun_g, fun_f):
+    """
+    Composition of a unary function, and a function taking an index and a value.
+
+    :param fun_g: callable
+    :param fun_f: callable taking an index and a value
+    :return: callable taking an index ``i`` and a value ``x``
+        and returning ``fun_g(fun_f(i, x))``
+    """
+    return lambda i, x: fun_g(fun_f(i, x))
+
+
+def compose_left(fun_g, fun_f):
+    """
+    Composition of a binary function with a unary function on its first argument.
+
+    :param fun_g: callable taking two arguments
+    :param fun_f: callable
+    :return: callable taking two arguments ``x`` and ``y``
+        and returning ``fun_g(fun_f(x), y)``
+    """
+    return lambda x, y: fun_g(fun_f(x), y)
+
+
+def compose_right(fun_g, fun_f):
+    """
+    Composition of a binary function with a unary function on its second argument.
+
+    :param fun_g: callable taking two arguments
+    :param fun_f: callable
+    :return: callable taking two arguments ``x`` and ``y``
+        and returning ``fun_g(x, fun_f(y))``
+    """
+    return lambda x, y: fun_g(x, fun_f(y))
+
+
 def uncurry(fun_f):
     """
     Transform a function into a function taking one pair argument.
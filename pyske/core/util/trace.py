@@ -0,0 +1,110 @@
+"""
+Tracing of the phases of the skeletons of distributed trees.
+
+Tracing is disabled by default. Once started, each phase of the skeletons of
+``PTree`` (local computations, communications, global computation at the root,
+local updates) is timed on each processor, and recorded as a dictionary::
+
+    {'pid': 0, 'skeleton': 'uacc', 'phase': 'local', 'start': 0.012, 'duration': 0.004}
+
+where ``start`` is the time elapsed since tracing started. The records of a
+processor are kept in memory, and, if a file name is given, written as JSON
+lines to the file ``<filename>.<pid>`` of this processor.
+
+Tracing can also be started without modifying a program, by setting the
+environment variable ``PYSKE_TRACE`` to a file name.
+When tracing is disabled, a phase only costs a function call.
+"""
+__all__ = ['start', 'stop', 'enabled', 'records', 'phase', 'ENVIRONMENT']
+
+import atexit
+import contextlib
+import json
+import os
+from typing import Any, ContextManager, Dict, List, Optional
+
+from pyske.core.support import parallel
+
+# Environment variable that starts tracing when this module is imported
+ENVIRONMENT = 'PYSKE_TRACE'
+
+_TRACE: Dict[str, Any] = {'records': None, 'file': None, 'origin': 0.0}
+
+_DISABLED = contextlib.nullcontext()
+
+
+def start(filename: Optional[str] = None) -> None:
+    """
+    Start tracing, discarding the current records.
+
+    :param filename: (optional) the records of processor ``pid`` are written
+        to the file ``filename.pid``
+    """
+    stop()
+    output = None
+    if filename is not None:
+        # pylint: disable=consider-using-with
+        output = open(filename + '.' + str(parallel.PID), 'w')
+    _TRACE.update(records=[], file=output, origin=parallel.MPI.Wtime())
+
+
+def stop() -> List[Dict[str, Any]]:
+    """
+    Stop tracing.
+
+    :return: the records of the current processor
+    """
+    records = _TRACE['records']
+    if _TRACE['file'] is not None:
+        _TRACE['file'].close()
+    _TRACE.update(records=None, file=None)
+    return [] if records is None else records
+
+
+def enabled() -> bool:
+    """
+    :return: True if tracing is started
+    """
+    return _TRACE['records'] is not None
+
+
+def records() -> List[Dict[str, Any]]:
+    """
+    :return: the records of the current processor since tracing started
+    """
+    return [] if _TRACE['records'] is None else list(_TRACE['records'])
+
+
+@contextlib.contextmanager
+def _phase(skeleton: str, name: str):
+    begin = parallel.MPI.Wtime()
+    try:
+        yield
+    finally:
+        end = parallel.MPI.Wtime()
+        record = {'pid': parallel.PID, 'skeleton': skeleton, 'phase': name,
+                  'start': begin - _TRACE['origin'], 'duration': end - begin}
+        _TRACE['records'].append(record)
+        if _TRACE['file'] is not None:
+            _TRACE['file'].write(json.dumps(record) + '\n')
+
+
+def phase(skeleton: str, name: str) -> ContextManager:
+    """
+    Time a phase of a skeleton, if tracing is started::
+
+        with trace.phase('uacc', 'local'):
+            ...
+
+    :param skeleton: the name of the skeleton
+    :param name: the name of the phase
+    :return: a context manager
+    """
+    if _TRACE['records'] is None:
+        return _DISABLED
+    return _phase(skeleton, name)
+
+
+if os.environ.get(ENVIRONMENT):
+    start(os.environ[ENVIRONMENT])
+    atexit.register(stop)
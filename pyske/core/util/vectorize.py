@@ -0,0 +1,221 @@
+"""
+Vectorized kernels for array-backed lists.
+
+A kernel is a function working on whole NumPy arrays that computes the
+same results as a function working on single elements. When a skeleton
+of an array-backed list (SArray, PArray) is called with a function that
+has a registered kernel, the kernel is applied once to the whole local
+array instead of calling the function on each element.
+
+The default kernels, registered for Python operators and functions, are
+only applied when they compute exactly the results of the element-wise
+functions: on integers, only when the results cannot overflow, and on
+floats, only when no floating point exception is raised (for example,
+``math.sqrt(-1)`` raises a ValueError whereas ``numpy.sqrt(-1.0)`` is nan).
+Otherwise, the skeletons apply the function to each element.
+"""
+__all__ = ['register', 'lookup', 'vectorized', 'apply', 'reduce']
+
+import functools
+import math
+import operator
+from typing import Callable, Dict, Optional, Tuple
+import numpy
+
+from pyske.core.util import fun
+
+_ATTRIBUTE = 'pyske_kernel'
+_KERNELS = {}
+
+# Kernels whose results on boolean arrays are those of the Python operators
+# on booleans. For example ``numpy.add`` is a logical or on boolean arrays,
+# whereas ``True + True == 2``.
+_BOOLEAN_KERNELS = {numpy.bitwise_and, numpy.bitwise_or, numpy.bitwise_xor,
+                    numpy.logical_not, numpy.equal, numpy.not_equal,
+                    numpy.maximum, numpy.minimum, fun.idt}
+
+# Default kernels: function -> (kinds of arrays, bound). The kernel of the function
+# is exact on arrays of these kinds. On integer arrays, ``bound`` gives a bound of
+# the magnitudes of the results from the magnitudes of the arguments, or is None
+# if the results cannot overflow.
+_EXACT: Dict[Callable, Tuple[str, Optional[Callable[..., int]]]] = {}
+
+# Integers of larger magnitudes are not exactly converted to floats.
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _magnitude(array: numpy.ndarray) -> int:
+    if len(array) == 0:
+        return 0
+    return max(abs(int(array.max())), abs(int(array.min())))
+
+
+def _exact(function: Callable, arrays) -> bool:
+    try:
+        (kinds, bound) = _EXACT[function]
+    except (KeyError, TypeError):
+        return True
+    array_kinds = {array.dtype.kind for array in arrays}
+    if not array_kinds <= set(kinds):
+        return False
+    if 'i' not in array_kinds:
+        return True
+    magnitudes = [_magnitude(array) for array in arrays if array.dtype.kind == 'i']
+    if array_kinds != {'i'}:
+        return all(magnitude <= _EXACT_FLOAT_INT for magnitude in magnitudes)
+    return bound is None or bound(*magnitudes) <= numpy.iinfo(numpy.result_type(*arrays)).max
+
+
+def _supports(function: Callable, kernel: Callable, arrays) -> bool:
+    for array in arrays:
+        if array.dtype.kind not in 'biufc':
+            return False
+        if array.dtype.kind == 'b' and kernel not in _BOOLEAN_KERNELS:
+            return False
+    return _exact(function, arrays)
+
+
+def register(function: Callable, kernel: Callable) -> None:
+    """
+    Register a kernel for a function.
+
+    :param function: a function on elements
+    :param kernel: a function on NumPy arrays, typically a NumPy ufunc
+    """
+    try:
+        setattr(function, _ATTRIBUTE, kernel)
+    except (AttributeError, TypeError):
+        _KERNELS[function] = kernel
+
+
+def lookup(function: Callable) -> Optional[Callable]:
+    """
+    Return the kernel registered for a function.
+
+    NumPy ufuncs are their own kernels.
+
+    :param function: a function on elements
+    :return: a kernel, or None if the function has no registered kernel
+    """
+    if isinstance(function, numpy.ufunc):
+        return function
+    kernel = getattr(function, _ATTRIBUTE, None)
+    if kernel is None:
+        try:
+            kernel = _KERNELS.get(function)
+        except TypeError:
+            kernel = None
+    return kernel
+
+
+def vectorized(function: Callable) -> Callable:
+    """
+    Declare that a function can be applied directly to NumPy arrays.
+
+    Can be used as a decorator. The function is returned unchanged.
+
+    Example::
+
+        >>> from pyske.core.list.sarray import SArray
+        >>> SArray([1, 2, 3]).map(vectorized(lambda x: 2 * x + 1))
+        SArray([3, 5, 7])
+
+    :param function: a function that works on numbers and on arrays
+    :return: the function
+    """
+    register(function, function)
+    return function
+
+
+def apply(function: Callable, *arrays: numpy.ndarray) -> Optional[numpy.ndarray]:
+    """
+    Apply the kernel of a function to whole arrays.
+
+    :param function: a function on elements
+    :param arrays: arrays of the same size, of numerical types
+    :return: an array of the same size, or None if there is no kernel
+        for the function or if the kernel could not be applied.
+    """
+    kernel = lookup(function)
+    if kernel is None or not _supports(function, kernel, arrays):
+        return None
+    try:
+        with numpy.errstate(all='raise'):
+            result = numpy.asarray(kernel(*arrays))
+    except (TypeError, ValueError, FloatingPointError, ArithmeticError):
+        return None
+    if result.shape != arrays[0].shape:
+        return None
+    return result
+
+
+def reduce(function: Callable, array: numpy.ndarray):
+    """
+    Reduce a non-empty array using the kernel of a function.
+
+    The values are combined from left to right, as by ``functools.reduce``.
+
+    :param function: a binary associative function on elements
+    :param array: a non-empty array
+    :return: a pair (True, result) if the function has a binary ufunc
+        as kernel that could be applied, (False, None) otherwise
+    """
+    assert len(array) > 0
+    kernel = lookup(function)
+    if not (isinstance(kernel, numpy.ufunc) and kernel.nin == 2 and
+            _supports(function, kernel, [array])):
+        return False, None
+    if array.dtype.kind == 'i' and function in _REDUCE_BOUNDS:
+        bound = _REDUCE_BOUNDS[function]
+        if bound(_magnitude(array), len(array)) > numpy.iinfo(array.dtype).max:
+            return False, None
+    elif array.dtype.kind == 'i' and _EXACT.get(function, ('', None))[1] is not None:
+        return False, None
+    try:
+        with numpy.errstate(all='raise'):
+            # accumulate combines the values sequentially, whereas reduce
+            # may sum floats pairwise
+            return True, kernel.accumulate(array)[-1].item()
+    except (TypeError, ValueError, FloatingPointError, ArithmeticError):
+        return False, None
+
+
+def _sum_bound(*magnitudes: int) -> int:
+    return sum(magnitudes)
+
+
+def _product_bound(*magnitudes: int) -> int:
+    return functools.reduce(operator.mul, magnitudes, 1)
+
+
+def _incr_bound(magnitude: int) -> int:
+    return magnitude + 1
+
+
+# Bounds of the magnitude of the reduction of an integer array,
+# from the magnitude of its elements and its length
+_REDUCE_BOUNDS = {operator.add: operator.mul}
+
+for _function, _kernel, _kinds, _bound in [
+        (operator.add, numpy.add, 'if', _sum_bound),
+        (operator.sub, numpy.subtract, 'if', _sum_bound),
+        (operator.mul, numpy.multiply, 'if', _product_bound),
+        (operator.truediv, numpy.true_divide, 'f', None),
+        (operator.neg, numpy.negative, 'if', _sum_bound),
+        (operator.abs, numpy.absolute, 'if', _sum_bound),
+        (abs, numpy.absolute, 'if', _sum_bound),
+        (operator.and_, numpy.bitwise_and, 'bi', None),
+        (operator.or_, numpy.bitwise_or, 'bi', None),
+        (operator.xor, numpy.bitwise_xor, 'bi', None),
+        (operator.not_, numpy.logical_not, 'bif', None),
+        (operator.eq, numpy.equal, 'bif', None), (operator.ne, numpy.not_equal, 'bif', None),
+        (operator.lt, numpy.less, 'if', None), (operator.le, numpy.less_equal, 'if', None),
+        (operator.gt, numpy.greater, 'if', None),
+        (operator.ge, numpy.greater_equal, 'if', None),
+        # on floats, numpy.maximum propagates nan, max does not
+        (max, numpy.maximum, 'bi', None), (min, numpy.minimum, 'bi', None),
+        (math.sqrt, numpy.sqrt, 'if', None),
+        (fun.idt, fun.idt, 'bifc', None),
+        (fun.incr, fun.incr, 'if', _incr_bound), (fun.decr, fun.decr, 'if', _incr_bound)]:
+    register(_function, _kernel)
+    _EXACT[_function] = (_kinds, _bound)
@@ -0,0 +1,161 @@
+"""
+Local workers for the element-wise skeletons of parallel lists.
+
+Each processor of a parallel machine can start a pool of local workers.
+The local chunk of a parallel list is then split into one slice per worker
+by ``map``, ``mapi``, ``map2``, ``map2i``, ``map3``, ``filter`` and
+``map_reduce``, and the slices are processed concurrently. One MPI process
+can thus be launched per node (or per socket) instead of one per core.
+
+Workers are processes by default. They are created by forking the MPI
+process, as processes started from scratch would try to join the parallel
+machine. The functions given to the skeletons, and the elements of the
+lists, should then be picklable: functions defined at the top level of a
+module are, lambdas are not. Skeletons called with functions that cannot
+be sent to the workers, on lazy lists, or on chunks too small to be worth
+splitting, are executed by the MPI process itself. With threads as workers
+(for example with a free-threaded Python), any function can be used.
+"""
+__all__ = ['start', 'stop', 'number', 'map', 'filter', 'map_reduce']
+
+import builtins
+import functools
+import itertools
+import multiprocessing
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, List, Tuple, Any
+
+# Minimal number of elements of a slice.
+MIN_SLICE = 1024
+
+_POOL = {'executor': None, 'number': 1, 'threads': True}
+
+
+def start(workers: int, threads: bool = False) -> None:
+    """
+    Start a pool of local workers, replacing the current one.
+
+    :param workers: the number of workers. With 1 worker, no pool is started.
+    :param threads: (default: False) if True, the workers are threads,
+        otherwise they are processes
+    """
+    assert workers >= 1
+    stop()
+    if workers == 1:
+        return
+    threads = threads or 'fork' not in multiprocessing.get_all_start_methods()
+    executor: Executor
+    if threads:
+        executor = ThreadPoolExecutor(workers)
+    else:
+        executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    _POOL.update(executor=executor, number=workers, threads=threads)
+
+
+def stop() -> None:
+    """
+    Stop the pool of local workers, if any.
+    """
+    executor = _POOL['executor']
+    if executor is not None:
+        executor.shutdown()
+    _POOL.update(executor=None, number=1, threads=True)
+
+
+def number() -> int:
+    """
+    :return: the number of local workers (1 if no pool is started)
+    """
+    return _POOL['number']
+
+
+def _picklable(function: Callable) -> bool:
+    try:
+        pickle.dumps(function)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
+def _slices(function: Callable, sequences: Sequence[Sequence]) -> Optional[List[Tuple]]:
+    executor = _POOL['executor']
+    if executor is None or not all(isinstance(seq, (list, range)) for seq in sequences):
+        return None
+    size = len(sequences[0])
+    workers = min(_POOL['number'], size // MIN_SLICE)
+    if workers < 2 or not (_POOL['threads'] or _picklable(function)):
+        return None
+    bounds = [size * i // workers for i in range(0, workers + 1)]
+    return [tuple(seq[bounds[i]:bounds[i + 1]] for seq in sequences)
+            for i in range(0, workers)]
+
+
+def _map(function, *values):
+    return list(builtins.map(function, *values))
+
+
+def _filter(predicate, values):
+    return [value for value in values if predicate(value)]
+
+
+def _map_reduce(unary_op, binary_op, values):
+    return functools.reduce(binary_op, builtins.map(unary_op, values))
+
+
+def map(function: Callable, *sequences: Sequence) -> Optional[list]:
+    # pylint: disable=redefined-builtin
+    """
+    Apply a function to the elements of sequences, using the local workers.
+
+    :param function: a function on elements
+    :param sequences: lists or ranges of the same size
+    :return: the list of the results, or None if the workers cannot be used
+    """
+    slices = _slices(function, sequences)
+    if slices is None:
+        return None
+    executor = _POOL['executor']
+    futures = [executor.submit(_map, function, *values) for values in slices]
+    return list(itertools.chain.from_iterable(future.result() for future in futures))
+
+
+def filter(predicate: Callable[[Any], bool], sequence: Sequence) -> Optional[list]:
+    # pylint: disable=redefined-builtin
+    """
+    Select the elements of a sequence, using the local workers.
+
+    :param predicate: a predicate on elements
+    :param sequence: a list
+    :return: the list of the elements that satisfy the predicate,
+        or None if the workers cannot be used
+    """
+    slices = _slices(predicate, [sequence])
+    if slices is None:
+        return None
+    executor = _POOL['executor']
+    futures = [executor.submit(_filter, predicate, values) for (values,) in slices]
+    return list(itertools.chain.from_iterable(future.result() for future in futures))
+
+
+def map_reduce(unary_op: Callable, binary_op: Callable, sequence: Sequence,
+               neutral: Optional[Any] = None) -> Tuple[bool, Any]:
+    """
+    Apply a function to the elements of a sequence and reduce the results,
+    using the local workers.
+
+    :param unary_op: a function on elements
+    :param binary_op: a binary associative operation
+    :param sequence: a list
+    :param neutral: (optional) a neutral element for the operation
+    :return: a pair (True, result) if the workers were used, (False, None) otherwise
+    """
+    slices = _slices(_map_reduce, [sequence])
+    if slices is None or not (_POOL['threads'] or
+                              _picklable(unary_op) and _picklable(binary_op)):
+        return False, None
+    executor = _POOL['executor']
+    futures = [executor.submit(_map_reduce, unary_op, binary_op, values)
+               for (values,) in slices]
+    result = functools.reduce(binary_op, (future.result() for future in futures))
+    return True, result if neutral is None else binary_op(neutral, result)
@@ -6,10 +6,11 @@ import argparse
 import gc
 import random
 from pyske.examples.list.dot_product import opt_dot_product, dot_product
-from pyske.core import par, Timing, PList as DPList
+from pyske.core import par, Timing
 from pyske.core.opt import fun as opt
 from pyske.core.opt.list import PList
-from pyske.examples.list.util import rand_list, print_experiment
+from pyske.examples.list.util import rand_list, print_experiment, select_pyske_list, \
+    PAR, PAR_ARRAY
 
 
 # -------------- Execution -----------------
@@ -32,14 +33,17 @@ def __main():
     parser.add_argument("--test", help="choice of the test",
                         choices=[_DIRECT, _HAND, _EVAL, _OPT],
                         default=_DIRECT)
+    parser.add_argument("--data", help="type of data structure",
+                        choices=[PAR, PAR_ARRAY], default=PAR)
     args = parser.parse_args()
     size = args.size
     test = args.test
 
     # Creation of input lists
     random.seed(42)
-    pl1 = rand_list(DPList, size)
-    pl2 = rand_list(DPList, size)
+    list_class = select_pyske_list(args.data)
+    pl1 = rand_list(list_class, size)
+    pl2 = rand_list(list_class, size)
 
     # Execution and timing
     time = Timing()
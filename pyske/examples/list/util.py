@@ -4,6 +4,8 @@ Utility functions for PySke examples
 
 PAR = 'parallel'
 SEQ = 'sequential'
+PAR_ARRAY = 'parallel_array'
+SEQ_ARRAY = 'sequential_array'
 
 
 def standard_parse_command_line(size_arg=True, iter_arg=True, data_arg=True):
@@ -12,12 +14,13 @@ def standard_parse_command_line(size_arg=True, iter_arg=True, data_arg=True):
 
     --size size for the size of the generated random list
     --iter iter for the number of iterations
-    --data [parallel, sequential] for choosing a sequential or parallel list
+    --data [parallel, sequential, parallel_array, sequential_array]
+        for choosing a sequential or parallel list, possibly array-backed
 
     :param size_arg: (default True) flag to select argument --size
     :param iter_arg: (default True) flag to select argument --iter
     :param data_arg: (default True) flag to select argument --data
-    :return:  (size, iter, ['parallel' | 'sequential'])
+    :return:  (size, iter, ['parallel' | 'sequential' | 'parallel_array' | 'sequential_array'])
     """
     # pylint: disable=import-outside-toplevel
     import argparse
@@ -30,7 +33,7 @@ def standard_parse_command_line(size_arg=True, iter_arg=True, data_arg=True):
                             type=int, default=30)
     if data_arg:
         parser.add_argument("--data", help="type of data structure",
-                            choices=[PAR, SEQ], default=SEQ)
+                            choices=[PAR, SEQ, PAR_ARRAY, SEQ_ARRAY], default=SEQ)
     size = num_iter = 0
     data_type = PAR
     args = parser.parse_args()
@@ -47,12 +50,16 @@ def select_pyske_list(choice):
     """
     Return a PySke list class.
 
-    :param choice: either ``PAR`` or ```SEQ``
-    :return: either PList or SList
+    :param choice: either ``PAR``, ``SEQ``, ``PAR_ARRAY`` or ``SEQ_ARRAY``
+    :return: either PList, SList, PArray or SArray
     """
     # pylint: disable=import-outside-toplevel
     if choice == PAR:
         from pyske.core import PList as ListClass
+    elif choice == PAR_ARRAY:
+        from pyske.core.list.parray import PArray as ListClass
+    elif choice == SEQ_ARRAY:
+        from pyske.core.list.sarray import SArray as ListClass
     else:
         from pyske.core import SList as ListClass
     return ListClass
@@ -62,11 +69,11 @@ def select_execute(choice):
     """
     Return an execution function.
 
-    :param choice: either ``PAR`` or ``SEQ``.
+    :param choice: either ``PAR``, ``SEQ``, ``PAR_ARRAY`` or ``SEQ_ARRAY``.
     :return: either ``par.at_root`` or ``lambda f: f()``
     """
     # pylint: disable=import-outside-toplevel
-    if choice == PAR:
+    if choice in (PAR, PAR_ARRAY):
         from pyske.core.util import par
         return par.at_root
     return lambda f: f()
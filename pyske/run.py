@@ -0,0 +1,75 @@
+"""
+Run a PySke program on several processes of the current machine, without MPI.
+
+Usage::
+
+    python -m pyske.run -n 8 script.py [arguments]
+
+The script is run by each process, as it would be by ``mpirun``. The processes
+communicate through ``multiprocessing`` queues
+(see ``pyske.core.support.communicator``).
+If one of the processes fails, the other ones are terminated.
+"""
+__all__ = ['main']
+
+import argparse
+import multiprocessing
+import multiprocessing.connection
+import os
+import runpy
+import sys
+from typing import List, Optional, Sequence
+
+
+def _run(rank: int, queues: Sequence, script: str, arguments: List[str]) -> None:
+    # communicator.ENVIRONMENT: it is read when pyske.core is first imported
+    os.environ['PYSKE_COMMUNICATOR'] = str(rank) + '/' + str(len(queues))
+    # pylint: disable=import-outside-toplevel
+    from pyske.core.support import communicator
+    communicator.start(queues)
+    del os.environ[communicator.ENVIRONMENT]
+    sys.argv = [script] + arguments
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    runpy.run_path(script, run_name='__main__')
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Run a script on several processes.
+
+    :param arguments: (optional) the command line arguments.
+        If omitted, ``sys.argv[1:]`` is used.
+    :return: 0 if all the processes succeeded,
+        the exit code of a failed process otherwise
+    """
+    parser = argparse.ArgumentParser(prog='python -m pyske.run',
+                                     description='Run a PySke program on several processes.')
+    parser.add_argument('-n', '--np', type=int, default=os.cpu_count(),
+                        help='number of processes (default: number of cores)')
+    parser.add_argument('script', help='the PySke program')
+    parser.add_argument('arguments', nargs=argparse.REMAINDER,
+                        help='the arguments of the program')
+    args = parser.parse_args(arguments)
+    if args.np < 1:
+        parser.error('the number of processes should be positive')
+    context = multiprocessing.get_context('spawn')
+    queues = [context.Queue() for _ in range(0, args.np)]
+    processes = [context.Process(target=_run, args=(rank, queues, args.script, args.arguments))
+                 for rank in range(0, args.np)]
+    for process in processes:
+        process.start()
+    exit_code = 0
+    running = {process.sentinel: process for process in processes}
+    while running:
+        for sentinel in multiprocessing.connection.wait(list(running)):
+            process = running.pop(sentinel)
+            process.join()
+            if process.exitcode != 0 and exit_code == 0:
+                exit_code = process.exitcode if process.exitcode > 0 else 1
+                for other in running.values():
+                    other.terminate()
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -96,3 +96,20 @@ def test_distribution_pid_of_index_with_empty_3():
     res = distr.to_pid(10, value)
     exp = 3, (10, value)
     assert exp == res
+
+
+def test_distribution_bounds():
+    # pylint: disable=missing-docstring
+    res = Distribution([2, 0, 3]).bounds()
+    exp = [0, 2, 2, 5]
+    assert res == exp
+
+
+def test_distribution_overlaps():
+    # pylint: disable=missing-docstring
+    distr = Distribution([2, 0, 3, 4])
+    assert distr.overlaps(1, 6) == [(0, 1, 2), (2, 2, 5), (3, 5, 6)]
+    assert distr.overlaps(2, 5) == [(2, 2, 5)]
+    assert distr.overlaps(3, 3) == []
+    assert distr.overlaps(0, 9) == [(0, 0, 2), (2, 2, 5), (3, 5, 9)]
+
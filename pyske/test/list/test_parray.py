@@ -0,0 +1,192 @@
+"""
+Tests for parallel arrays and associated skeletons
+"""
+
+__all__ = []
+import operator
+
+import pytest
+from pyske.test.support import swap
+from pyske.core import PList, SList, Distribution, par, fun
+from pyske.core.support import parallel
+
+numpy = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from pyske.core.list.parray import PArray
+from pyske.core.support import array as arrimpl
+
+pytestmark = pytest.mark.parray  # pylint: disable=invalid-name
+
+
+def get_distribution(parr: PArray):
+    """
+    Returns the distribution (as a sequential list) of its argument.
+
+    :param parr: PArray
+    :return: list
+    """
+    return parr.get_partition().map(len).to_seq()
+
+
+def test_init_to_seq_empty():
+    # pylint: disable=missing-docstring
+    assert PArray().to_seq() == []
+
+
+def test_init_to_seq_non_empty():
+    # pylint: disable=missing-docstring
+    res = PArray.init(float, 17)
+    res.invariant()
+    assert res.dtype.kind == 'f'
+    assert res.to_seq() == SList.init(float, 17)
+
+
+def test_from_seq():
+    # pylint: disable=missing-docstring
+    data = PArray.from_seq([1, 2, 3])
+    data.invariant()
+    assert get_distribution(data) == [3 if pid == 0 else 0 for pid in par.procs()]
+    assert data.to_seq() == [1, 2, 3]
+
+
+def test_map_mapi():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 23)
+    res = data.map(fun.incr).mapi(operator.mul).to_seq()
+    exp = SList.init(fun.idt, 23).map(fun.incr).mapi(operator.mul)
+    assert res == exp
+
+
+def test_map2_map3():
+    # pylint: disable=missing-docstring
+    data = PArray.init(float, 11)
+    res = data.map3(lambda x, y, z: x * y + z, data, data.map2(operator.add, data)).to_seq()
+    exp = SList.init(lambda x: x * x + 2.0 * x, 11)
+    assert res == exp
+
+
+def test_zip_objects():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 9)
+    res = data.zip(data.map(str)).to_seq()
+    exp = SList.init(lambda i: (i, str(i)), 9)
+    assert res == exp
+
+
+def test_filter():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 31)
+    res = data.filter(fun.is_even)
+    res.invariant()
+    assert res.to_seq() == SList.init(fun.idt, 31).filter(fun.is_even)
+
+
+def test_reduce_map_reduce():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 42)
+    assert data.reduce(operator.add) == sum(range(0, 42))
+    assert data.map_reduce(fun.incr, operator.add, 0) == sum(range(1, 43))
+    assert PArray().reduce(operator.add, 0) == 0
+
+
+def test_scanl_last():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 23)
+    res, last = data.scanl_last(operator.add, 0)
+    assert (res.to_seq(), last) == SList.init(fun.idt, 23).scanl_last(operator.add, 0)
+
+
+def test_scanr():
+    # pylint: disable=missing-docstring
+    data = PArray.init(str, 5)
+    assert data.scanr(operator.add).to_seq() == SList.init(str, 5).scanr(operator.add)
+
+
+def test_distribute_gather_balance():
+    # pylint: disable=missing-docstring
+    size = 37
+    data = PArray.init(float, size)
+    gathered = data.gather(0)
+    gathered.invariant()
+    assert get_distribution(gathered) == [size if pid == 0 else 0 for pid in par.procs()]
+    balanced = gathered.balance()
+    balanced.invariant()
+    assert get_distribution(balanced) == Distribution.balanced(size)
+    assert balanced.to_seq() == SList.init(float, size)
+
+
+def test_distribute_shift():
+    # pylint: disable=missing-docstring
+    size = 10 * len(par.procs())
+    data = PArray.init(float, size)
+    distr = Distribution([10 for _ in par.procs()])
+    distr[0] -= 1
+    distr[-1] += 1
+    res = data.distribute(distr)
+    res.invariant()
+    assert get_distribution(res) == distr
+    assert res.to_seq() == SList.init(float, size)
+
+
+def test_gather_to_root():
+    # pylint: disable=missing-docstring
+    root = len(par.procs()) - 1
+    for data in [PArray.init(float, 23), PArray.init(str, 23)]:
+        seq = data.to_seq()
+        exp = seq if parallel.PID == root else None
+        res = data.gather_to_root(root)
+        if exp is None:
+            assert res is None
+        else:
+            assert res == exp
+
+
+def test_distribute_objects():
+    # pylint: disable=missing-docstring
+    data = PArray.init(str, 12).gather(0).balance()
+    assert data.to_seq() == SList.init(str, 12)
+
+
+def test_scatter():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 20)
+    exp = PList.init(fun.idt, 20).scatter(0).to_seq()
+    assert data.scatter(0).to_seq() == exp
+
+
+def test_scatter_range():
+    # pylint: disable=missing-docstring
+    data = PArray.init(fun.idt, 20)
+    res = data.scatter_range(range(3, 15))
+    assert get_distribution(res) == Distribution.balanced(12)
+    assert res.to_seq() == list(range(3, 15))
+
+
+def test_permute_swap():
+    # pylint: disable=missing-docstring
+    size = 29
+    data = PArray.init(fun.idt, size)
+    res = data.permute(swap(size)).to_seq()
+    exp = SList.init(fun.idt, size).permute(swap(size))
+    assert res == exp
+
+
+
+def test_to_seq_shared(monkeypatch):
+    # pylint: disable=missing-docstring
+    monkeypatch.setattr(arrimpl, 'SHARED_THRESHOLD', 1)
+    monkeypatch.setattr(arrimpl, 'SHARED_NPROCS', 2)
+    size = 37
+    assert PArray.init(float, size).map(fun.incr).to_seq() == SList.init(lambda i: i + 1.0, size)
+
+
+def test_allgatherv_shared(monkeypatch):
+    # pylint: disable=missing-docstring
+    monkeypatch.setattr(arrimpl, 'SHARED_THRESHOLD', 1)
+    monkeypatch.setattr(arrimpl, 'SHARED_NPROCS', 2)
+    counts = [pid + 1 for pid in par.procs()]
+    array = numpy.full(counts[parallel.PID], parallel.PID)
+    res = arrimpl.allgatherv(array, counts)
+    assert res.tolist() == [pid for pid in par.procs() for _ in range(0, pid + 1)]
+    assert res.flags.writeable == (parallel.NPROCS == 1)
@@ -4,11 +4,15 @@ Tests for parallel lists and associated skeletons
 
 __all__ = []
 import operator
+import os
 import random
+import struct
+import tempfile
 
 import pytest
 from pyske.test.support import swap
 from pyske.core import PList, SList, Distribution, par, fun
+from pyske.core.support import parallel
 
 pytestmark = pytest.mark.plist  # pylint: disable=invalid-name
 
@@ -43,6 +47,13 @@ def randint(min_, max_):
     return PList.from_seq([random.randint(min_, max_)]).to_seq()[0]
 
 
+def randpid():
+    """
+    Returns the same random processor identifier on all the processors.
+    """
+    return randint(0, parallel.NPROCS - 1)
+
+
 def rand_min_max(size):
     """
     Returns a pair of random numbers between 0 and ``size-1``, such
@@ -349,7 +360,7 @@ def test_scanl_last_non_empty():
 
 def test_distribute_data():
     # pylint: disable=missing-docstring
-    dst = par.randpid()
+    dst = randpid()
     data = generate_int_plist()
     size = data.length()
     distr = Distribution([0 for _ in par.procs()])
@@ -363,13 +374,34 @@ def test_distribute_distr():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
     size = data.length()
-    dst = par.randpid()
+    dst = randpid()
     exp = Distribution([0 for _ in par.procs()])
     exp[dst] = size
     res = get_distribution(data.distribute(exp))
     assert res == exp
 
 
+def test_distribute_same():
+    # pylint: disable=missing-docstring
+    data = generate_int_plist()
+    res = data.distribute(get_distribution(data))
+    res.invariant()
+    assert res.to_seq() == data.to_seq()
+
+
+def test_distribute_shift():
+    # pylint: disable=missing-docstring
+    size = 10 * parallel.NPROCS
+    data = PList.init(lambda i: i, size)
+    distr = Distribution([10 for _ in par.procs()])
+    distr[0] -= 1
+    distr[-1] += 1
+    res = data.distribute(distr)
+    res.invariant()
+    assert get_distribution(res) == distr
+    assert res.to_seq() == SList(range(0, size))
+
+
 def test_balance_data():
     # pylint: disable=missing-docstring
     data = generate_int_plist()
@@ -383,7 +415,7 @@ def test_balance_distr():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
     size = data.length()
-    dst = par.randpid()
+    dst = randpid()
     distr = Distribution([0 for _ in par.procs()])
     distr[dst] = size
     res = get_distribution(data.distribute(distr).balance())
@@ -394,7 +426,7 @@ def test_balance_distr():
 def test_gather_data():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
-    dst = par.randpid()
+    dst = randpid()
     res = data.gather(dst).to_seq()
     exp = data.to_seq()
     assert res == exp
@@ -404,7 +436,7 @@ def test_gather_distr():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
     size = data.length()
-    dst = par.randpid()
+    dst = randpid()
     res = get_distribution(data.gather(dst))
     exp = [size if i == dst else 0 for i in par.procs()]
     assert res == exp
@@ -413,7 +445,7 @@ def test_gather_distr():
 def test_scatter_data():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
-    src = par.randpid()
+    src = randpid()
     res = data.scatter(src).to_seq()
     exp = data.get_partition().to_seq()[src]
     assert res == exp
@@ -422,7 +454,7 @@ def test_scatter_data():
 def test_scatter_distr():
     # pylint: disable=missing-docstring
     data = generate_str_plist()
-    src = par.randpid()
+    src = randpid()
     distr = get_distribution(data)
     res = get_distribution(data.scatter(src))
     exp = Distribution.balanced(distr[src])
@@ -481,3 +513,240 @@ def test_permute_swap():
     exp = input_list.to_seq()
     res = input_list.permute(swap(size)).permute(swap(size)).to_seq()
     assert exp == res
+
+
+def test_permute_reverse():
+    # pylint: disable=missing-docstring
+    input_list = generate_str_plist()
+    size = input_list.length()
+    exp = input_list.to_seq().permute(lambda i: size - 1 - i)
+    res = input_list.permute(lambda i: size - 1 - i)
+    res.invariant()
+    assert exp == res.to_seq()
+
+
+def test_from_iterable_sized():
+    # pylint: disable=missing-docstring
+    size = randint(0, 111)
+    res = PList.from_iterable(range(0, size), block_size=7)
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(size)
+    assert res.to_seq() == SList(range(0, size))
+
+
+def test_from_iterable_generator():
+    # pylint: disable=missing-docstring
+    size = randint(0, 111)
+    res = PList.from_iterable((alphabet(i) for i in range(0, size)), block_size=5)
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(size)
+    assert res.to_seq() == SList.init(alphabet, size)
+
+
+def test_scatter_blocks():
+    # pylint: disable=missing-docstring
+    data = PList.init(fun.idt, 53).gather(0)
+    res = data.scatter(0)
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(53)
+    assert res.to_seq() == SList(range(0, 53))
+
+
+def shared_file(content: bytes) -> str:
+    """
+    Writes a temporary file at processor 0, and returns its name on all the processors.
+    """
+    name = None
+    if parallel.PID == 0:
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+            name = file.name
+    return parallel.COMM.bcast(name, 0)
+
+
+def remove_shared_file(name: str) -> None:
+    """
+    Removes a file created by ``shared_file``.
+    """
+    parallel.COMM.barrier()
+    if parallel.PID == 0:
+        os.remove(name)
+
+
+def test_from_text_lines():
+    # pylint: disable=missing-docstring
+    lines = [alphabet(i) * (i % 7) for i in range(0, 41)]
+    name = shared_file(("\r\n".join(lines[:20]) + "\n" + "\n".join(lines[20:])).encode())
+    res = PList.from_text_lines(name)
+    remove_shared_file(name)
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(41)
+    assert res.to_seq() == SList(lines)
+
+
+def test_from_file_parser():
+    # pylint: disable=missing-docstring
+    name = shared_file("".join(str(i) + "\n" for i in range(0, 23)).encode())
+    res = PList.from_file(name, parser=int)
+    remove_shared_file(name)
+    assert res.to_seq() == SList(range(0, 23))
+
+
+def test_from_binary():
+    # pylint: disable=missing-docstring
+    name = shared_file(b"".join(struct.pack('<id', i, i / 2) for i in range(0, 29)))
+    res = PList.from_binary(name, '<id')
+    remove_shared_file(name)
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(29)
+    assert res.to_seq() == SList((i, i / 2) for i in range(0, 29))
+
+
+def test_save_load():
+    # pylint: disable=missing-docstring
+    data = PList.init(lambda i: (i, i / 2), 37).gather(0).distribute(
+        Distribution([37 if pid == len(par.procs()) - 1 else 0 for pid in par.procs()]))
+    name = shared_file(b"")
+    data.save(name, '<id')
+    res = PList.load(name)
+    res.invariant()
+    assert get_distribution(res) == get_distribution(data)
+    assert res.map(lambda pair: pair[0]).reduce(operator.add, 0) == sum(range(0, 37))
+    assert res.to_seq() == data.to_seq()
+    remove_shared_file(name)
+
+
+def test_gather_to_root():
+    # pylint: disable=missing-docstring
+    data = generate_str_plist()
+    root = randpid()
+    res = data.gather_to_root(root)
+    seq = data.to_seq()
+    exp = seq if parallel.PID == root else None
+    assert res == exp
+
+
+def test_reduce_non_commutative():
+    # pylint: disable=missing-docstring
+    data = PList.init(alphabet, 37)
+    res = data.reduce(operator.add)
+    exp = ''.join(alphabet(i) for i in range(0, 37))
+    assert res == exp
+
+
+def test_reduce_root():
+    # pylint: disable=missing-docstring
+    root = len(par.procs()) - 1
+    res = PList.init(fun.idt, 20).reduce(operator.add, 0, root=root)
+    exp = sum(range(0, 20)) if parallel.PID == root else None
+    assert res == exp
+
+
+def test_map_reduce_root():
+    # pylint: disable=missing-docstring
+    res = PList.init(fun.idt, 20).map_reduce(fun.incr, operator.add, root=0)
+    exp = sum(range(1, 21)) if parallel.PID == 0 else None
+    assert res == exp
+
+
+def test_lazy_map_reduce():
+    # pylint: disable=missing-docstring
+    data = generate_int_plist(1)
+    res = data.lazy().map(fun.incr).mapi(operator.add).map2(operator.mul, data)
+    exp = data.map(fun.incr).mapi(operator.add).map2(operator.mul, data)
+    assert res.reduce(operator.add) == exp.reduce(operator.add)
+    assert res.to_seq() == exp.to_seq()
+
+
+def test_lazy_filter_balance():
+    # pylint: disable=missing-docstring
+    data = generate_int_plist()
+    res = data.lazy().map(fun.incr).filter(is_even).balance()
+    res.invariant()
+    exp = data.map(fun.incr).filter(is_even).balance()
+    assert res.to_seq() == exp.to_seq()
+    assert get_distribution(res) == get_distribution(exp)
+
+
+def test_lazy_map_filter_one_pass():
+    # pylint: disable=missing-docstring
+    calls = []
+
+    def incr(num):
+        calls.append('map')
+        return num + 1
+
+    def even(num):
+        calls.append('filter')
+        return is_even(num)
+
+    res = PList.init(fun.idt, 10).lazy().map(incr).filter(even)
+    assert calls == ['map', 'filter'] * (len(calls) // 2)
+    assert res.to_seq() == list(range(2, 11, 2))
+
+
+def test_reduce_async():
+    # pylint: disable=missing-docstring
+    data = PList.init(alphabet, 37)
+    future = data.reduce_async(operator.add)
+    other = data.map(str.upper).to_seq()
+    res = future.result()
+    exp = ''.join(alphabet(i) for i in range(0, 37))
+    assert res == exp
+    assert other == SList(exp.upper())
+    assert future.done()
+
+
+def test_reduce_async_root():
+    # pylint: disable=missing-docstring
+    root = randpid()
+    res = PList.init(fun.idt, 20).reduce_async(operator.add, 0, root=root).result()
+    exp = sum(range(0, 20)) if parallel.PID == root else None
+    assert res == exp
+
+
+def test_reduce_async_done():
+    # pylint: disable=missing-docstring
+    future = PList.init(fun.idt, 20).reduce_async(operator.add)
+    while not future.done():
+        pass
+    assert future.result() == sum(range(0, 20))
+
+
+def test_distribute_async():
+    # pylint: disable=missing-docstring
+    size = 10 * parallel.NPROCS
+    data = PList.init(lambda i: i, size)
+    distr = Distribution([10 for _ in par.procs()])
+    distr[0] -= 1
+    distr[-1] += 1
+    future = data.distribute_async(distr)
+    while not future.done():
+        pass
+    res = future.result()
+    res.invariant()
+    assert get_distribution(res) == distr
+    assert res.to_seq() == SList(range(0, size))
+
+
+def test_balance_async():
+    # pylint: disable=missing-docstring
+    data = generate_int_plist()
+    future = data.filter(lambda x: x % 3 == 0).balance_async()
+    other = data.map(fun.incr)
+    res = future.result()
+    res.invariant()
+    assert get_distribution(res) == Distribution.balanced(res.length())
+    assert res.to_seq() == data.to_seq().filter(lambda x: x % 3 == 0)
+    assert other.to_seq() == data.to_seq().map(fun.incr)
+
+
+def test_gather_async():
+    # pylint: disable=missing-docstring
+    data = generate_str_plist()
+    root = randpid()
+    res = data.gather_async(root).result()
+    res.invariant()
+    exp = data.gather(root)
+    assert get_distribution(res) == get_distribution(exp)
+    assert res.to_seq() == exp.to_seq()
@@ -0,0 +1,143 @@
+"""
+Tests of sequential arrays
+"""
+
+import operator
+import pytest
+from pyske.core.util import fun
+from pyske.core import SList
+from pyske.test.support import swap
+
+pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from pyske.core.list.sarray import SArray
+
+pytestmark = pytest.mark.sarray  # pylint: disable=invalid-name
+
+
+# -------------------------- #
+
+def test_init_dtype():
+    # pylint: disable=missing-docstring
+    res = SArray.init(float, 4)
+    assert res.dtype.kind == 'f'
+    assert res.to_seq() == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_init_objects():
+    # pylint: disable=missing-docstring
+    res = SArray.init(lambda i: (i, i), 3)
+    assert res.dtype == object
+    assert res.to_seq() == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_init_mixed():
+    # pylint: disable=missing-docstring
+    res = SArray([1, 'a'])
+    assert res.dtype == object
+    assert res.to_seq() == [1, 'a']
+
+
+def test_length_nil():
+    # pylint: disable=missing-docstring
+    assert SArray().length() == 0
+
+
+# -------------------------- #
+
+def test_map_inc():
+    # pylint: disable=missing-docstring
+    res = SArray([1, 2, 3]).map(fun.incr)
+    exp = SList([2, 3, 4])
+    assert res == exp
+
+
+def test_mapi_non_empty():
+    # pylint: disable=missing-docstring
+    res = SArray([1, 3, 5, 8, 12]).mapi(operator.add)
+    exp = SList([1, 4, 7, 11, 16])
+    assert res == exp
+
+
+def test_map2_non_empty():
+    # pylint: disable=missing-docstring
+    data = SArray([42, 11, 0, -42])
+    res = data.map2(operator.add, data).to_seq()
+    exp = [84, 22, 0, -84]
+    assert res == exp
+
+
+def test_zip_non_empty():
+    # pylint: disable=missing-docstring
+    data = SArray([1, 2])
+    res = data.zip(data.map(str)).to_seq()
+    exp = [(1, '1'), (2, '2')]
+    assert res == exp
+
+
+def test_filter():
+    # pylint: disable=missing-docstring
+    res = SArray(range(0, 10)).filter(fun.is_even)
+    exp = SList([0, 2, 4, 6, 8])
+    assert res == exp
+
+
+# -------------------------- #
+
+def test_reduce_nil():
+    # pylint: disable=missing-docstring
+    assert SArray().reduce(operator.add, 1232) == 1232
+
+
+def test_reduce_cons():
+    # pylint: disable=missing-docstring
+    assert SArray([1, 2, 3, 4]).reduce(operator.add) == 10
+
+
+def test_map_reduce_non_empty():
+    # pylint: disable=missing-docstring
+    data = SArray([1, 2, 3, 4])
+    res = data.map_reduce(fun.incr, operator.add, 0)
+    exp = data.map(fun.incr).reduce(operator.add)
+    assert res == exp
+
+
+# -------------------------- #
+
+def test_scanl_last():
+    # pylint: disable=missing-docstring
+    res, last = SArray.init(float, 4).scanl_last(operator.add, 0.0)
+    assert (res.to_seq(), last) == SList.init(float, 4).scanl_last(operator.add, 0.0)
+
+
+def test_scanr():
+    # pylint: disable=missing-docstring
+    res = SArray.init(str, 4).scanr(operator.add)
+    exp = SList.init(str, 4).scanr(operator.add)
+    assert res == exp
+
+
+# -------------------------- #
+
+def test_get_partition_flatten():
+    # pylint: disable=missing-docstring
+    data = SArray.init(fun.idt, 7)
+    res = data.get_partition().flatten()
+    assert res == data
+
+
+def test_permute_swap():
+    # pylint: disable=missing-docstring
+    size = 13
+    data = SArray.init(fun.idt, size)
+    res = data.permute(swap(size))
+    exp = SList.init(fun.idt, size).permute(swap(size))
+    assert res == exp
+
+
+def test_scatter_range():
+    # pylint: disable=missing-docstring
+    res = SArray.init(fun.idt, 10).scatter_range(range(2, 8, 2))
+    exp = SList([2, 4, 6])
+    assert res == exp
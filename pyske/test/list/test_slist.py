@@ -3,6 +3,7 @@ Tests of sequential lists
 """
 
 import operator
+import struct
 import pytest
 from pyske.core.util import fun
 from pyske.core import SList, Distribution
@@ -459,3 +460,71 @@ def test_invariant():
     # pylint: disable=missing-docstring
     res = SList([1, 2, 3]).get_partition().invariant()
     assert res
+
+
+# -------------------------- #
+
+def test_lazy_map_filter_reduce():
+    # pylint: disable=missing-docstring
+    calls = []
+
+    def square(num):
+        calls.append(num)
+        return num * num
+
+    slst = SList(range(0, 10))
+    res = slst.lazy().map(square).map(fun.incr).filter(fun.is_odd)
+    assert not calls
+    res = res.reduce(operator.add)
+    assert len(calls) == 10
+    exp = slst.map(square).map(fun.incr).filter(fun.is_odd).reduce(operator.add)
+    assert res == exp
+
+
+def test_lazy_force():
+    # pylint: disable=missing-docstring
+    slst = SList(range(0, 10))
+    res = slst.lazy().mapi(operator.mul).filter(fun.is_even).zip(SList(range(0, 5))).force()
+    exp = slst.mapi(operator.mul).filter(fun.is_even).zip(SList(range(0, 5)))
+    assert isinstance(res, SList)
+    assert res == exp
+
+
+def test_lazy_map_reduce_empty():
+    # pylint: disable=missing-docstring
+    res = SList([1, 3]).lazy().filter(fun.is_even).map_reduce(fun.incr, operator.add)
+    assert res is None
+
+
+def test_lazy_length_after_filter():
+    # pylint: disable=missing-docstring
+    res = SList(range(0, 10)).lazy().map2(operator.add, SList(range(0, 10))).filter(fun.is_even)
+    assert res.length() == 10
+    assert res.scanl(operator.add, 0) == SList(range(0, 20, 2)).scanl(operator.add, 0)
+
+
+def test_from_text_lines(tmp_path):
+    # pylint: disable=missing-docstring
+    name = tmp_path / "lines.txt"
+    name.write_bytes(b"a\r\n\nbc\nd")
+    res = SList.from_text_lines(str(name))
+    exp = SList(["a", "", "bc", "d"])
+    assert res == exp
+
+
+def test_from_file_parser(tmp_path):
+    # pylint: disable=missing-docstring
+    name = tmp_path / "numbers.txt"
+    name.write_text("1\n2\n3\n")
+    res = SList.from_file(str(name), parser=int)
+    exp = SList([1, 2, 3])
+    assert res == exp
+
+
+def test_from_binary(tmp_path):
+    # pylint: disable=missing-docstring
+    name = tmp_path / "numbers.bin"
+    name.write_bytes(struct.pack('<3d', 0.5, 1.5, 2.5))
+    res = SList.from_binary(str(name), '<d')
+    exp = SList([0.5, 1.5, 2.5])
+    assert res == exp
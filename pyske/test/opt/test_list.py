@@ -1,12 +1,15 @@
 """
 Tests for the optimization mechanism on lists
 """
-from operator import add
+from operator import add, sub
 import pytest
 from pyske.core.opt.list import PList, SList
+from pyske.core.opt import terms
+from pyske.core.opt.terms import compile_term
 from pyske.core.list.plist import PList as DPList
 from pyske.core.list.slist import SList as DSList
-from pyske.core.util.fun import incr, idt
+from pyske.core.util.fun import incr, idt, is_even
+from pyske.core.list.distribution import Distribution
 
 # pylint: disable=invalid-name
 pytestmark = pytest.mark.opt_list
@@ -54,3 +57,139 @@ def test_slist_with_raw():
     exp = input_list.map(incr).map(incr).reduce(add)
     res = SList.raw(input_list).map(incr).map(incr).reduce(add).run()
     assert res == exp
+
+
+def _double(num):
+    return 2 * num
+
+
+def _check(term, head):
+    optimized = term.opt()
+    assert optimized.function == head
+    return optimized.eval()
+
+
+def test_map_map_order():
+    # pylint: disable=missing-docstring
+    input_list = DSList.init(idt, 10)
+    exp = input_list.map(incr).map(_double)
+    res = _check(SList.raw(input_list).map(incr).map(_double), 'map')
+    assert res == exp
+
+
+def test_mapi_map():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    exp = input_list.map(incr).mapi(add).to_seq()
+    res = _check(PList.raw(input_list).map(incr).mapi(add), 'mapi').to_seq()
+    assert res == exp
+
+
+def test_map_mapi():
+    # pylint: disable=missing-docstring
+    input_list = DSList.init(idt, 10)
+    exp = input_list.mapi(add).map(_double)
+    res = _check(SList.raw(input_list).mapi(add).map(_double), 'mapi')
+    assert res == exp
+
+
+def test_map2_map():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    exp = input_list.map(incr).map2(sub, input_list.map(_double)).to_seq()
+    raw = PList.raw(input_list)
+    res = _check(raw.map(incr).map2(sub, raw.map(_double)), 'map2').to_seq()
+    assert res == exp
+
+
+def test_map_map_reduce():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    exp = input_list.map(incr).map_reduce(_double, add, 0)
+    res = _check(PList.raw(input_list).map(incr).map_reduce(_double, add, 0), 'map_reduce')
+    assert res == exp
+
+
+def test_map_filter():
+    # pylint: disable=missing-docstring
+    input_list = DSList.init(idt, 10)
+    exp = input_list.map(incr).filter(is_even)
+    res = _check(SList.raw(input_list).map(incr).filter(is_even), 'force')
+    assert res == exp
+    assert isinstance(res, DSList)
+
+
+def test_partition_flatten():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    res = _check(PList.raw(input_list).get_partition().flatten(), '__raw__')
+    assert res.to_seq() == input_list.to_seq()
+
+
+def test_distribute_distribute():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    distr = Distribution.balanced(10)
+    term = PList.raw(input_list).balance().distribute(distr).balance()
+    res = _check(term, 'balance')
+    assert term.opt().arguments[0].function == '__raw__'
+    assert res.to_seq() == input_list.to_seq()
+
+
+def _dot_product(pl1, pl2):
+    return pl1.map(incr).zip(pl2).map(_mul).reduce(add, 0)
+
+
+def _mul(pair):
+    return pair[0] * pair[1]
+
+
+def test_run_plan_cached():
+    # pylint: disable=missing-docstring
+    for size in [5, 10]:
+        pl1 = DSList.init(idt, size)
+        pl2 = DSList.init(incr, size)
+        exp = pl1.map(incr).zip(pl2).map(_mul).reduce(add, 0)
+        res = _dot_product(SList.raw(pl1), SList.raw(pl2)).run()
+        assert res == exp
+    plan1 = compile_term(_dot_product(SList.raw(DSList([1])), SList.raw(DSList([2]))))
+    plan2 = compile_term(_dot_product(SList.raw(DSList([3])), SList.raw(DSList([4]))))
+    assert plan1.func is plan2.func
+    assert plan1() == 4
+    assert plan2() == 16
+
+
+def test_run_closure():
+    # pylint: disable=missing-docstring
+    input_list = DSList.init(idt, 5)
+    for step in [1, 2]:
+        exp = input_list.map(lambda num, step=step: num + step).map(_double)
+        res = SList.raw(input_list).map(lambda num: num + step).map(_double).run()
+        assert res == exp
+
+
+def test_run_lambda_one_plan(monkeypatch):
+    # pylint: disable=missing-docstring, protected-access
+    compiled = []
+    compile_plan = terms._Compiler.compile
+
+    def counting_compile(compiler, term):
+        compiled.append(term)
+        return compile_plan(compiler, term)
+
+    monkeypatch.setattr(terms, '_PLANS', type(terms._PLANS)())
+    monkeypatch.setattr(terms._Compiler, 'compile', counting_compile)
+    input_list = DSList.init(idt, 5)
+    for _ in range(0, 3):
+        res = SList.raw(input_list).map(lambda num: num + 1).map(_double).run()
+        assert res == input_list.map(incr).map(_double)
+    assert len(compiled) == 1
+
+
+def test_run_shared_subterm():
+    # pylint: disable=missing-docstring
+    input_list = DPList.init(idt, 10)
+    exp = input_list.map(incr).map2(add, input_list.map(incr)).to_seq()
+    shared = PList.raw(input_list).map(incr)
+    res = shared.map2(add, shared).to_seq().run()
+    assert res == exp
@@ -3,7 +3,8 @@ Tests for term rewriting systems
 """
 
 import pytest
-from pyske.core.opt.terms import Var, Term, subst, merge
+from pyske.core.opt.terms import Var, Term, Rule, subst, merge, \
+    index_rules, inner_most_strategy
 
 
 def test_str_non_static():
@@ -67,3 +68,53 @@ def test_merge():
     # pylint: disable=missing-docstring
     with pytest.raises(Exception):
         merge({'x': 1}, {'x': 2})
+
+
+_F_G = Rule(left=Term('f', [Var('x')]), right=Term('g', [Var('x')]), name="f g", type=Term)
+_G_F = Rule(left=Term('g', [Var('x')]), right=Term('f', [Var('x')]), name="g f", type=Term)
+_G_H = Rule(left=Term('g', [Var('x')]), right=Term('h', [Var('x')]), name="g h", type=Term)
+
+
+def _nest(symbol, depth):
+    term = 0
+    for _ in range(depth):
+        term = Term(symbol, [term])
+    return term
+
+
+def test_index_rules():
+    # pylint: disable=missing-docstring
+    index = index_rules([_F_G, _G_F, _G_H])
+    assert index == {'f': [(0, _F_G)], 'g': [(1, _G_F), (2, _G_H)]}
+
+
+def test_inner_most_rules_order():
+    # pylint: disable=missing-docstring
+    res = inner_most_strategy(Term('f', [0]), rules=[_F_G, _G_H])
+    assert res.function == 'h'
+
+
+def test_inner_most_deep():
+    # pylint: disable=missing-docstring
+    res = inner_most_strategy(_nest('f', 200), rules=[_F_G, _G_H])
+    assert str(res) == str(_nest('h', 200))
+
+
+def test_inner_most_shared():
+    # pylint: disable=missing-docstring
+    term = Term('p', [_nest('f', 3), _nest('f', 3)])
+    res = inner_most_strategy(term, rules=[_F_G])
+    assert res.arguments[0] is res.arguments[1]
+    assert str(res.arguments[0]) == str(_nest('g', 3))
+
+
+def test_inner_most_cycle():
+    # pylint: disable=missing-docstring
+    res = inner_most_strategy(Term('f', [0]), rules=[_F_G, _G_F])
+    assert res.function in ['f', 'g']
+
+
+def test_inner_most_max_steps():
+    # pylint: disable=missing-docstring
+    res = inner_most_strategy(_nest('f', 3), max_steps=1, rules=[_F_G])
+    assert str(res) == "f(f(g(0)))"
@@ -0,0 +1,62 @@
+"""
+Experiments on the skeletons of binary trees, on balanced and ill-balanced trees,
+represented by BTree and by CBTree
+"""
+
+import argparse
+import operator
+import time
+
+from pyske.core.support.generate import balanced_btree, ill_balanced_btree
+from pyske.core.tree.cbtree import CBTree
+from pyske.core.util import fun
+
+
+def _parse_command_line():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", help="number of nodes of the trees", type=int,
+                        default=1_000_000)
+    parser.add_argument("--iter", help="number of iterations", type=int, default=3)
+    args = parser.parse_args()
+    return max(1, args.size), max(1, args.iter)
+
+
+SKELETONS = [('map', lambda bt: bt.map(fun.incr, fun.decr)),
+             ('mapt', lambda bt: bt.mapt(fun.incr, lambda v, l, r: v)),
+             ('reduce', lambda bt: bt.reduce(lambda l, v, r: l + v + r)),
+             ('uacc', lambda bt: bt.uacc(lambda l, v, r: l + v + r)),
+             ('dacc', lambda bt: bt.dacc(operator.add, operator.sub, 0)),
+             ('zip', lambda bt: bt.zip(bt)),
+             ('map2', lambda bt: bt.map2(operator.add, bt)),
+             ('getchl', lambda bt: bt.getchl(0))]
+
+
+def _timing(skeleton, tree, num_iter):
+    times = []
+    for _ in range(0, num_iter):
+        start = time.perf_counter()
+        skeleton(tree)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def __performance():
+    size, num_iter = _parse_command_line()
+    trees = [('balanced', balanced_btree(lambda: 1, size)),
+             ('ill-balanced', ill_balanced_btree(lambda: 1, size))]
+    trees += [(name + ' compact', CBTree.init_from_bt(tree)) for (name, tree) in trees]
+    print("skeleton\t" + "\t".join(name for (name, _) in trees))
+    for (name, skeleton) in SKELETONS:
+        times = []
+        for (_, tree) in trees:
+            try:
+                times.append(f"{_timing(skeleton, tree, num_iter):.4f}")
+            except RecursionError:
+                times.append("RecursionError")
+            except AttributeError:
+                times.append("-")
+        print(name + "\t" + "\t".join(times))
+
+
+if __name__ == "__main__":
+    __performance()
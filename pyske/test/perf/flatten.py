@@ -0,0 +1,49 @@
+"""
+Experiments on flatten with many small partitions
+"""
+
+import argparse
+import functools
+from operator import concat
+from pyske.core import SList, par
+
+
+def _parse_command_line():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", help="size of each sub-list", type=int, default=4)
+    parser.add_argument("--iter", help="number of iterations", type=int, default=5)
+    parser.add_argument("--max", help="maximal number of sub-lists", type=int, default=32_000)
+    args = parser.parse_args()
+    return max(0, args.size), max(1, args.iter), max(1, args.max)
+
+
+def _reduce_concat(lists):
+    return SList(functools.reduce(concat, lists, []))
+
+
+def _flatten(lists):
+    return lists.flatten()
+
+
+def _timing(function, lists, num_iter):
+    times = []
+    for _ in range(0, num_iter):
+        start = par.wtime()
+        function(lists)
+        times.append(par.wtime() - start)
+    return sum(times) / num_iter
+
+
+def __performance():
+    size, num_iter, max_lists = _parse_command_line()
+    print("sub-lists\treduce(concat)\tflatten")
+    num_lists = 1000
+    while num_lists <= max_lists:
+        lists = SList.init(lambda i: SList([i] * size), num_lists)
+        print(f"{num_lists}\t{_timing(_reduce_concat, lists, num_iter):.6f}\t"
+              f"{_timing(_flatten, lists, num_iter):.6f}")
+        num_lists *= 2
+
+
+if __name__ == "__main__":
+    __performance()
@@ -7,6 +7,7 @@ import random
 import math
 import gc
 import argparse
+import tracemalloc
 from pyske.core import PList as DPList, SList as DSList, par
 from pyske.core.opt.list import PList as OPList, SList as OSList
 
@@ -53,6 +54,27 @@ def test_timing(test_f, data, name,
     return output
 
 
+def test_allocation(test_f, data, name):
+    """
+    Output the peak memory allocated during the application of a function.
+
+    :param test_f: the function to test.
+    :param data: the input data to the function.
+    :param name: of the test.
+    :return: the result of the application of the test function.
+        Output the peak allocation (maximum over the processors) on standard output.
+    """
+    gc.collect()
+    par.barrier()
+    tracemalloc.start()
+    output = test_f(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    max_peak = DPList.init(lambda _: peak).reduce(max)
+    par.at_root(lambda: print(f'Test: {name}\nPeak allocation (max):\t{max_peak} bytes'))
+    return output
+
+
 def _f_map(num):
     return 2 * num + 1
 
@@ -257,6 +279,38 @@ def _test3():
     assert res1 == res2
 
 
+def _is_multiple_of_3(num):
+    return num % 3 == 0
+
+
+_RULES = [("mapi map", lambda lst: lst.map(_f_map).mapi(add)),
+          ("map mapi", lambda lst: lst.mapi(add).map(_f_map)),
+          ("map2 map", lambda lst: lst.map(_f_map).map2(add, lst.map(sqr))),
+          ("map map_reduce", lambda lst: lst.map(_f_map).map_reduce(sqr, add, 0)),
+          ("map filter", lambda lst: lst.map(_f_map).filter(_is_multiple_of_3)),
+          ("get_partition flatten", lambda lst: lst.get_partition().flatten()),
+          ("distribute distribute", lambda lst: lst.balance().balance())]
+
+
+def _to_seq(value):
+    return value.to_seq() if hasattr(value, 'to_seq') else value
+
+
+def _test4():
+    if SEQ:
+        data = DSList.init(lambda num: random.randint(0, 1000), SIZE)
+    else:
+        data = DPList.init(lambda num: random.randint(0, 1000), SIZE)
+    for (name, skel) in _RULES:
+        def optimized(lst, skel=skel):
+            return skel(OSList.raw(lst) if SEQ else OPList.raw(lst))
+        res1 = test_timing(skel, data, name)
+        res2 = test_timing(optimized, data, name + " [_opt/_run]", _opt, _run)
+        test_allocation(skel, data, name)
+        test_allocation(lambda lst, fct=optimized: fct(lst).run(), data, name + " [_run]")
+        assert _to_seq(res1) == _to_seq(res2)
+
+
 if __name__ == '__main__':
     if TST == 1:
         _test1()
@@ -264,3 +318,5 @@ if __name__ == '__main__':
         _test2()
     if TST == 3:
         _test3()
+    if TST == 4:
+        _test4()
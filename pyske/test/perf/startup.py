@@ -0,0 +1,51 @@
+"""
+Experiments on the start-up time of programs importing parts of PySke
+
+Each import is run in a new Python process. The time of the interpreter
+alone is given for reference.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import pyske
+
+IMPORTS = [('python', 'pass'),
+           ('SList', 'from pyske.core import SList'),
+           ('trees', 'from pyske.core.tree.ltree import LTree; '
+                     'from pyske.core.tree.rtree import RNode'),
+           ('opt.list', 'import pyske.core.opt.list'),
+           ('PList', 'from pyske.core import PList')]
+
+
+def _parse_command_line():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iter", help="number of iterations", type=int, default=10)
+    args = parser.parse_args()
+    return max(1, args.iter)
+
+
+def _start(statement, env):
+    script = statement + "; import sys; print(int('mpi4py' in sys.modules))"
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return time.perf_counter() - start, output.strip() == '1'
+
+
+def __performance():
+    num_iter = _parse_command_line()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(pyske.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    print("import\tmpi4py\ttime (median)")
+    for (name, statement) in IMPORTS:
+        results = [_start(statement, env) for _ in range(0, num_iter)]
+        times = sorted(elapsed for (elapsed, _) in results)
+        print(f"{name}\t{results[0][1]}\t{times[len(times) // 2]:.4f}")
+
+
+if __name__ == "__main__":
+    __performance()
@@ -240,3 +240,60 @@ def test_getchr_node_left():
     assert res == exp
 
 # -------------------------- #
+
+
+# -------------------------- #
+
+DEEP = 100001
+
+
+def deep_btree(size):
+    bt = Leaf(1)
+    for _ in range(0, size // 2):
+        bt = Node(1, Leaf(1), bt)
+    return bt
+
+
+def test_map_deep():
+    bt = deep_btree(DEEP)
+    res = bt.map(fun.incr, fun.decr)
+    assert res.size == DEEP
+    assert res.reduce(lambda x, y, z: x + y + z) == DEEP + 1
+
+
+def test_reduce_deep():
+    bt = deep_btree(DEEP)
+    assert bt.reduce(lambda x, y, z: x + y + z) == DEEP
+
+
+def test_uacc_deep():
+    bt = deep_btree(DEEP)
+    res = bt.uacc(lambda x, y, z: x + y + z)
+    assert res.get_value() == DEEP
+    assert res.get_right().get_value() == DEEP - 2
+
+
+def test_dacc_deep():
+    bt = deep_btree(DEEP)
+    res = bt.dacc(fun.add, fun.add, 0)
+    assert res.get_value() == 0
+    assert res.reduce(lambda x, y, z: max(x, y, z)) == DEEP // 2
+
+
+def test_zip_map2_deep():
+    bt = deep_btree(DEEP)
+    assert bt.zip(bt) == bt.map(lambda x: (x, x), lambda x: (x, x))
+    assert bt.map2(fun.add, bt) == bt.map(lambda x: 2 * x, lambda x: 2 * x)
+
+
+def test_getchl_getchr_deep():
+    bt = deep_btree(DEEP)
+    assert bt.getchl(0).reduce(lambda x, y, z: x + y + z) == DEEP // 2
+    assert bt.getchr(0).reduce(lambda x, y, z: x + y + z) == DEEP // 2
+
+
+def test_str_deep():
+    bt = deep_btree(5)
+    assert str(bt) == "node 1 (leaf 1) (node 1 (leaf 1) (leaf 1))"
+    half = DEEP // 2
+    assert str(deep_btree(DEEP)) == "node 1 (leaf 1) (" * half + "leaf 1" + ")" * half
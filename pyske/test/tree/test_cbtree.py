@@ -0,0 +1,124 @@
+import operator
+import pytest
+from pyske.core.util import fun
+from pyske.core.support.errors import EmptyError, IllFormedError, NotSameTagError
+from pyske.core.support.generate import balanced_btree, ill_balanced_btree
+from pyske.core.tree.btree import Leaf, Node
+from pyske.core.tree.ltree import LTree, Segment, TaggedValue
+from pyske.core.tree.cbtree import CBTree
+
+
+def example_btree():
+    return Node(13, Node(31, Leaf(47), Leaf(32)), Node(72, Leaf(92), Leaf(42)))
+
+
+def test_init_from_bt_leaf():
+    cbt = CBTree.init_from_bt(Leaf(1))
+    assert cbt.values == [1]
+    assert cbt.size == 1
+    assert cbt.to_bt() == Leaf(1)
+
+
+def test_init_from_bt():
+    cbt = CBTree.init_from_bt(example_btree())
+    assert cbt.values == [13, 31, 47, 32, 72, 92, 42]
+    assert list(cbt.rights) == [4, 3, -1, -1, 6, -1, -1]
+    assert cbt.to_bt() == example_btree()
+
+
+def test_init_empty():
+    with pytest.raises(EmptyError):
+        CBTree([], b"", [])
+
+
+# -------------------------- #
+
+def test_init_from_lt():
+    seg1 = Segment([TaggedValue(13, "C")])
+    seg2 = Segment([TaggedValue(31, "N"), TaggedValue(47, "L"), TaggedValue(32, "L")])
+    seg3 = Segment([TaggedValue(72, "N"), TaggedValue(92, "L"), TaggedValue(42, "L")])
+    cbt = CBTree.init_from_lt(LTree([seg1, seg2, seg3]))
+    assert cbt == CBTree.init_from_bt(example_btree())
+
+
+def test_init_from_lt_illformed():
+    seg1 = Segment([TaggedValue(13, "C")])
+    seg3 = Segment([TaggedValue(72, "N"), TaggedValue(92, "L"), TaggedValue(42, "L")])
+    with pytest.raises(IllFormedError):
+        CBTree.init_from_lt(LTree([seg1, seg3]))
+
+
+def test_init_from_lt_empty():
+    with pytest.raises(EmptyError):
+        CBTree.init_from_lt(LTree())
+
+
+def test_to_lt():
+    for size in [1, 7, 63, 1001]:
+        for bt in [balanced_btree(lambda: 1, size), ill_balanced_btree(lambda: 1, size)]:
+            cbt = CBTree.init_from_bt(bt)
+            for m in [1, 2, 5, 16]:
+                lt = LTree.init_from_bt(bt, m)
+                assert cbt.to_lt(m) == lt
+                assert CBTree.init_from_lt(lt) == cbt
+
+
+# -------------------------- #
+
+def test_map():
+    cbt = CBTree.init_from_bt(example_btree())
+    res = cbt.map(fun.incr, fun.decr)
+    exp = Node(12, Node(30, Leaf(48), Leaf(33)), Node(71, Leaf(93), Leaf(43)))
+    assert res.to_bt() == exp
+    assert res.rights is cbt.rights
+
+
+def test_reduce():
+    cbt = CBTree.init_from_bt(example_btree())
+    res = cbt.reduce(lambda x, y, z: x + y + z)
+    assert res == 13 + 31 + 47 + 32 + 72 + 92 + 42
+
+
+def test_reduce_leaf():
+    assert CBTree.init_from_bt(Leaf(3)).reduce(lambda x, y, z: x + y + z) == 3
+
+
+def test_uacc():
+    bt = example_btree()
+    res = CBTree.init_from_bt(bt).uacc(lambda x, y, z: x + y + z)
+    assert res.to_bt() == bt.uacc(lambda x, y, z: x + y + z)
+
+
+def test_dacc():
+    bt = example_btree()
+    res = CBTree.init_from_bt(bt).dacc(operator.add, operator.sub, 0)
+    assert res.to_bt() == bt.dacc(operator.add, operator.sub, 0)
+
+
+def test_zip():
+    cbt = CBTree.init_from_bt(example_btree())
+    res = cbt.zip(cbt.map(fun.incr, fun.incr))
+    assert res.values == [(x, x + 1) for x in cbt.values]
+
+
+def test_zip_not_same_shape():
+    cbt1 = CBTree.init_from_bt(example_btree())
+    cbt2 = CBTree.init_from_bt(Node(1, Leaf(2), Node(3, Leaf(4), Node(5, Leaf(6), Leaf(7)))))
+    with pytest.raises(NotSameTagError):
+        cbt1.zip(cbt2)
+
+
+def test_map2():
+    cbt = CBTree.init_from_bt(example_btree())
+    res = cbt.map2(operator.mul, cbt)
+    assert res.values == [x * x for x in cbt.values]
+
+
+def test_skeletons_deep():
+    size = 100001
+    bt = ill_balanced_btree(lambda: 1, size)
+    cbt = CBTree.init_from_bt(bt)
+    assert cbt.reduce(lambda x, y, z: x + y + z) == size
+    assert cbt.uacc(lambda x, y, z: x + y + z).values[0] == size
+    assert max(cbt.dacc(fun.add, fun.add, 0).values) == size // 2
+    assert cbt.to_bt() == bt
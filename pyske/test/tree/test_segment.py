@@ -1,7 +1,8 @@
 import pytest
 import operator
+import pickle
 from pyske.core.support.errors import IllFormedError, ApplicationError, NotSameTagError
-from pyske.core.tree.ltree import Segment, TaggedValue
+from pyske.core.tree.ltree import Segment, TaggedValue, TAG_LEAF, TAG_NODE, TAG_CRITICAL
 from pyske.core.util import fun
 
 
@@ -548,3 +549,37 @@ def test_from_str():
     assert res == exp
 
 # -------------------------- #
+
+
+def test_str():
+    seg = Segment([TaggedValue(11, "N"), TaggedValue(2, "L"), TaggedValue(3, "C")])
+    assert Segment.from_str(str(seg)) == seg
+
+
+# -------------------------- #
+
+def test_storage():
+    seg = Segment([TaggedValue(1, "N"), TaggedValue(2, "L"), TaggedValue(3, "C")])
+    assert seg.values == [1, 2, 3]
+    assert seg.tags == bytearray([TAG_NODE, TAG_LEAF, TAG_CRITICAL])
+    assert seg[1] == TaggedValue(2, "L")
+    assert seg[1:] == Segment([TaggedValue(2, "L"), TaggedValue(3, "C")])
+
+
+def test_storage_not_set():
+    seg = Segment([None] * 2)
+    assert seg[0] is None
+    seg[1] = TaggedValue(4, "L")
+    assert list(seg) == [None, TaggedValue(4, "L")]
+
+
+def test_pickle():
+    seg = Segment([TaggedValue(1, "N"), TaggedValue(2, "L"), TaggedValue(3, "C")])
+    assert pickle.loads(pickle.dumps(seg)) == seg
+
+
+def test_get_right_after_node():
+    gt = Segment([TaggedValue(1, "N"), TaggedValue(2, "N"), TaggedValue(3, "L"),
+                  TaggedValue(4, "N"), TaggedValue(5, "L"), TaggedValue(6, "L"),
+                  TaggedValue(7, "L")])
+    assert gt.get_right(0) == TaggedValue(7, "L")
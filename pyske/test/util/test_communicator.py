@@ -0,0 +1,98 @@
+"""
+Tests for the communicator between the processes of one machine
+"""
+
+__all__ = []
+
+import os
+import subprocess
+import sys
+import pytest
+import pyske
+from pyske.core.support import communicator, parallel
+
+_SCRIPT = """
+import operator
+from pyske.core import PList, SList, par
+from pyske.core.support import parallel
+data = PList.init(lambda i: i, 100)
+assert data.reduce(operator.add) == 4950
+assert data.permute(lambda i: 99 - i).to_seq() == SList(range(99, -1, -1))
+assert data.filter(lambda x: x % 3 == 0).balance().to_seq() == SList(range(0, 100, 3))
+par.barrier()
+print(parallel.PID, parallel.NPROCS, parallel.MPI.__name__)
+"""
+
+
+def _run(tmp_path, script, number):
+    path = tmp_path / 'script.py'
+    path.write_text(script)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(pyske.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    return subprocess.run([sys.executable, '-m', 'pyske.run', '-n', str(number), str(path)],
+                          env=env, capture_output=True, text=True, timeout=60, check=False)
+
+
+def test_send_recv_self():
+    # pylint: disable=missing-docstring
+    comm = communicator.Comm()
+    comm.send([1, 2], dest=0, tag=5)
+    comm.send('a', dest=0, tag=4)
+    assert comm.recv(source=0, tag=4) == 'a'
+    assert comm.recv(source=0, tag=5) == [1, 2]
+
+
+def test_send_copy():
+    # pylint: disable=missing-docstring
+    comm = communicator.Comm()
+    message = [1, 2]
+    comm.isend(message, dest=0, tag=0).wait()
+    message.append(3)
+    assert comm.recv(source=0, tag=0) == [1, 2]
+
+
+def test_improbe():
+    # pylint: disable=missing-docstring
+    comm = communicator.Comm()
+    assert comm.improbe(source=0, tag=1) is None
+    comm.send('a', dest=0, tag=1)
+    assert comm.improbe(source=0, tag=1).recv() == 'a'
+
+
+def test_recv_any_source():
+    # pylint: disable=missing-docstring
+    comm = communicator.Comm()
+    comm.send('a', dest=0, tag=2)
+    comm.send('b', dest=0, tag=3)
+    assert comm.recv(source=communicator.ANY_SOURCE, tag=3) == 'b'
+    assert comm.recv(source=communicator.ANY_SOURCE, tag=2) == 'a'
+
+
+def test_collectives_single():
+    # pylint: disable=missing-docstring
+    comm = communicator.Comm()
+    assert comm.bcast('a', 0) == 'a'
+    assert comm.gather('a', 0) == ['a']
+    assert comm.scatter(['a'], 0) == 'a'
+    assert comm.allgather('a') == ['a']
+    assert comm.alltoall(['a']) == ['a']
+    assert comm.sendrecv('a', dest=communicator.PROC_NULL,
+                         source=communicator.PROC_NULL) is None
+
+
+@pytest.mark.skipif(parallel.NPROCS > 1, reason="launches its own processes")
+def test_run(tmp_path):
+    # pylint: disable=missing-docstring
+    result = _run(tmp_path, _SCRIPT, 3)
+    assert result.returncode == 0, result.stderr
+    words = sorted(result.stdout.split())
+    assert words == sorted(['0', '1', '2'] + ['3', 'pyske.core.support.communicator'] * 3)
+
+
+@pytest.mark.skipif(parallel.NPROCS > 1, reason="launches its own processes")
+def test_run_failure(tmp_path):
+    # pylint: disable=missing-docstring
+    script = ("import sys\nfrom pyske.core.support import parallel\n"
+              "if parallel.PID == 1:\n    sys.exit(3)\nparallel.COMM.barrier()\n")
+    result = _run(tmp_path, script, 2)
+    assert result.returncode == 3
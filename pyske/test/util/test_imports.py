@@ -0,0 +1,45 @@
+"""
+Tests for the lazy imports of PySke modules
+"""
+
+__all__ = []
+
+import os
+import subprocess
+import sys
+import pytest
+import pyske
+import pyske.core
+from pyske.core.list.plist import PList
+
+
+def _imported(statement):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(pyske.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    script = statement + "; import sys; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                            capture_output=True, text=True, timeout=60).stdout
+    return output.split()
+
+
+@pytest.mark.parametrize('statement', ['from pyske.core import SList, fun',
+                                       'from pyske.core.tree.ltree import LTree',
+                                       'from pyske.core.tree.rtree import RNode',
+                                       'import pyske.core.opt.list'])
+def test_sequential_without_mpi(statement):
+    # pylint: disable=missing-docstring
+    modules = _imported(statement)
+    assert 'mpi4py' not in modules
+    assert 'pyske.core.support.parallel' not in modules
+
+
+def test_lazy_attribute():
+    # pylint: disable=missing-docstring
+    assert pyske.core.PList is PList
+    assert 'PList' in dir(pyske.core)
+
+
+def test_unknown_attribute():
+    # pylint: disable=missing-docstring
+    with pytest.raises(AttributeError):
+        getattr(pyske.core, 'PTree')
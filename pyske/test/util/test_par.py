@@ -4,6 +4,7 @@ Tests for parallel util functions and class
 
 __all__ = []
 
+import operator
 from pyske.core.support import parallel
 from pyske.core.util import par
 
@@ -12,3 +13,11 @@ def test_rand_pid():
     # pylint: disable=missing-docstring
     val = par.randpid()
     assert val in range(0, parallel.NPROCS)
+
+
+def test_scan_non_commutative():
+    # pylint: disable=missing-docstring
+    pre, total = parallel.scan(operator.add, str(parallel.PID))
+    exp_pre = ''.join(map(str, range(0, parallel.PID))) if parallel.PID > 0 else '0'
+    exp_total = ''.join(map(str, par.procs()))
+    assert (pre, total) == (exp_pre, exp_total)
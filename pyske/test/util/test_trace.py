@@ -0,0 +1,70 @@
+"""
+Tests for the tracing of the skeletons of distributed trees
+"""
+
+__all__ = []
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+import pyske
+from pyske.core.support import parallel
+from pyske.core.tree.ltree import LTree, Segment, TaggedValue
+from pyske.core.tree.ptree import PTree
+from pyske.core.util import fun, trace
+
+
+def _ptree():
+    seg1 = Segment([TaggedValue(13, "C")])
+    seg2 = Segment([TaggedValue(31, "N"), TaggedValue(47, "L"), TaggedValue(32, "L")])
+    seg3 = Segment([TaggedValue(72, "N"), TaggedValue(92, "L"), TaggedValue(42, "L")])
+    return PTree(LTree([seg1, seg2, seg3]))
+
+
+def test_disabled():
+    # pylint: disable=missing-docstring
+    assert not trace.enabled()
+    _ptree().uacc(fun.add, fun.idt, fun.add, fun.add, fun.add)
+    assert trace.records() == []
+
+
+def test_phases():
+    # pylint: disable=missing-docstring
+    trace.start()
+    _ptree().uacc(fun.add, fun.idt, fun.add, fun.add, fun.add)
+    records = trace.stop()
+    assert not trace.enabled()
+    phases = [record['phase'] for record in records]
+    expected = ['local', 'gather', 'global', 'scatter', 'update']
+    assert phases == expected if parallel.PID == 0 else [p for p in expected if p != 'global']
+    assert all(record['skeleton'] == 'uacc' and record['pid'] == parallel.PID
+               and record['duration'] >= 0 for record in records)
+
+
+def test_file(tmp_path):
+    # pylint: disable=missing-docstring
+    filename = str(tmp_path / 'trace')
+    trace.start(filename)
+    _ptree().map(fun.incr, fun.decr)
+    records = trace.stop()
+    with open(filename + '.' + str(parallel.PID)) as file:
+        assert [json.loads(line) for line in file] == records
+    assert [record['skeleton'] for record in records] == ['map']
+
+
+@pytest.mark.skipif(parallel.NPROCS > 1, reason="launches its own process")
+def test_environment(tmp_path):
+    # pylint: disable=missing-docstring
+    root = os.path.dirname(os.path.dirname(os.path.abspath(pyske.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    env[trace.ENVIRONMENT] = str(tmp_path / 'trace')
+    script = ("from pyske.core.tree.ltree import LTree, Segment, TaggedValue\n"
+              "from pyske.core.tree.ptree import PTree\n"
+              "PTree(LTree([Segment([TaggedValue(1, 'L')])])).map(abs, abs)\n")
+    subprocess.run([sys.executable, '-c', script], env=env, cwd=str(tmp_path), check=True,
+                   timeout=60)
+    assert sorted(os.listdir(str(tmp_path))) == ['trace.0']
+    with open(str(tmp_path / 'trace.0')) as file:
+        assert json.loads(file.readline())['phase'] == 'local'
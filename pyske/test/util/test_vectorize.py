@@ -0,0 +1,132 @@
+"""
+Tests for vectorized kernels of array-backed lists
+"""
+
+__all__ = []
+
+import math
+import operator
+import pytest
+from pyske.core.util import fun
+
+numpy = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from pyske.core.util import vectorize
+from pyske.core.list.sarray import SArray
+
+pytestmark = pytest.mark.sarray  # pylint: disable=invalid-name
+
+
+def test_lookup_builtin():
+    # pylint: disable=missing-docstring
+    assert vectorize.lookup(operator.add) is numpy.add
+    assert vectorize.lookup(math.sqrt) is numpy.sqrt
+
+
+def test_lookup_ufunc():
+    # pylint: disable=missing-docstring
+    assert vectorize.lookup(numpy.hypot) is numpy.hypot
+
+
+def test_lookup_unknown():
+    # pylint: disable=missing-docstring
+    assert vectorize.lookup(lambda x: x) is None
+
+
+def test_vectorized_map():
+    # pylint: disable=missing-docstring
+    calls = []
+
+    @vectorize.vectorized
+    def affine(num):
+        calls.append(num)
+        return 2 * num + 1
+
+    res = SArray([1, 2, 3]).map(affine)
+    assert res == [3, 5, 7]
+    assert len(calls) == 1
+
+
+def test_map2_reduce():
+    # pylint: disable=missing-docstring
+    vec1 = SArray.init(float, 100)
+    vec2 = SArray.init(fun.incr, 100)
+    res = vec1.map2(operator.mul, vec2).reduce(operator.add, 0)
+    exp = sum(float(i) * (i + 1) for i in range(0, 100))
+    assert res == exp
+
+
+def test_map_reduce():
+    # pylint: disable=missing-docstring
+    data = SArray.init(float, 10)
+    assert data.map_reduce(math.sqrt, max) == math.sqrt(9.0)
+
+
+def test_map3_register():
+    # pylint: disable=missing-docstring
+    def fma(num1, num2, num3):
+        return num1 * num2 + num3
+
+    vectorize.register(fma, lambda arr1, arr2, arr3: arr1 * arr2 + arr3)
+    data = SArray.init(fun.idt, 5)
+    assert data.map3(fma, data, data) == [0, 2, 6, 12, 20]
+
+
+def test_boolean_add_not_vectorized():
+    # pylint: disable=missing-docstring
+    data = SArray([True, True, False])
+    assert data.reduce(operator.add) == 2
+    assert data.map(operator.not_).reduce(operator.and_, True) is False
+
+
+def test_objects_not_vectorized():
+    # pylint: disable=missing-docstring
+    data = SArray.init(str, 3)
+    assert data.reduce(operator.add) == '012'
+
+
+def test_pow_negative_exponent():
+    # pylint: disable=missing-docstring
+    res = SArray([2, 4]).map2(operator.pow, SArray([-1, -2]))
+    assert res == [0.5, 0.0625]
+
+
+def test_division_by_zero():
+    # pylint: disable=missing-docstring
+    for function in [operator.floordiv, operator.mod, operator.truediv]:
+        with pytest.raises(ZeroDivisionError):
+            SArray([1, 2]).map2(function, SArray([1, 0]))
+    with pytest.raises(ZeroDivisionError):
+        SArray([1.0, 2.0]).map2(operator.truediv, SArray([1.0, 0.0]))
+
+
+def test_math_domain_error():
+    # pylint: disable=missing-docstring
+    with pytest.raises(ValueError):
+        SArray([4, -1]).map(math.sqrt)
+    with pytest.raises(ValueError):
+        SArray([1.0, 0.0]).map(math.log)
+    assert SArray([4, 9]).map(math.sqrt) == [2.0, 3.0]
+
+
+def test_integer_overflow():
+    # pylint: disable=missing-docstring
+    big = 2 ** 62
+    assert SArray([big, big]).reduce(operator.add) == 2 ** 63
+    assert SArray([big, big]).map2(operator.mul, SArray([4, 2])) == [2 ** 64, 2 ** 63]
+    assert SArray([-2 ** 63]).map(abs) == [2 ** 63]
+    assert SArray([big, 2]).reduce(operator.mul) == 2 ** 63
+
+
+def test_max_not_unary():
+    # pylint: disable=missing-docstring
+    with pytest.raises(TypeError):
+        SArray([1, 2]).map(max)
+    assert SArray([3, 1, 2]).reduce(max) == 3
+
+
+def test_float_max_nan():
+    # pylint: disable=missing-docstring
+    data = SArray([1.0, float('nan'), 2.0])
+    assert data.reduce(max) == max(1.0, float('nan'), 2.0)
@@ -0,0 +1,97 @@
+"""
+Tests for the local workers of parallel lists
+"""
+
+__all__ = []
+
+import operator
+import pytest
+from pyske.core import PList, SList
+from pyske.core.util import fun, workers
+
+SIZE = 10 * workers.MIN_SLICE + 7
+
+
+@pytest.fixture(params=[False, True], ids=['processes', 'threads'])
+def pool(request):
+    # pylint: disable=missing-docstring
+    workers.start(3, threads=request.param)
+    yield
+    workers.stop()
+
+
+def test_start_stop():
+    # pylint: disable=missing-docstring
+    workers.start(2)
+    assert workers.number() == 2
+    workers.stop()
+    assert workers.number() == 1
+
+
+def test_map_small():
+    # pylint: disable=missing-docstring
+    workers.start(2)
+    res = workers.map(fun.incr, list(range(0, 10)))
+    workers.stop()
+    assert res is None
+
+
+def test_map_lambda_processes():
+    # pylint: disable=missing-docstring
+    workers.start(2)
+    res = workers.map(lambda x: x + 1, list(range(0, SIZE)))
+    workers.stop()
+    assert res is None
+
+
+def test_map_lambda_threads():
+    # pylint: disable=missing-docstring
+    workers.start(2, threads=True)
+    res = workers.map(lambda x: x + 1, list(range(0, SIZE)))
+    workers.stop()
+    assert res == list(range(1, SIZE + 1))
+
+
+def test_map_workers(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = workers.map(fun.incr, list(range(0, SIZE)))
+    assert res == list(range(1, SIZE + 1))
+
+
+def test_map(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = PList.init(fun.idt, SIZE).map(fun.incr)
+    res.invariant()
+    assert res.to_seq() == SList(range(1, SIZE + 1))
+
+
+def test_mapi(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = PList.init(fun.idt, SIZE).mapi(operator.mul)
+    assert res.to_seq() == SList(i * i for i in range(0, SIZE))
+
+
+def test_map2(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    data = PList.init(fun.idt, SIZE)
+    res = data.map2(operator.add, data)
+    assert res.to_seq() == SList(range(0, 2 * SIZE, 2))
+
+
+def test_filter(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = PList.init(fun.idt, SIZE).filter(fun.is_even)
+    res.invariant()
+    assert res.to_seq() == SList(range(0, SIZE, 2))
+
+
+def test_map_reduce(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = PList.init(fun.idt, SIZE).map_reduce(fun.incr, operator.add, 0)
+    assert res == sum(range(1, SIZE + 1))
+
+
+def test_map_reduce_non_commutative(pool):
+    # pylint: disable=missing-docstring, unused-argument, redefined-outer-name
+    res = PList.init(fun.idt, SIZE).map_reduce(str, operator.add)
+    assert res == ''.join(str(i) for i in range(0, SIZE))